@@ -4,6 +4,8 @@ import plotly.express as px
 # Importar todos los modelos necesarios de la biblioteca
 from dea_models.radial import run_ccr, run_bcc
 from dea_models.nonradial import run_sbm
+from dea_models.fdh import run_fdh
+from dea_models.partial_frontiers import run_order_m, run_order_alpha
 from dea_models.mpi import compute_malmquist_phi
 from dea_models.visualizations import plot_efficiency_histogram
 
@@ -13,16 +15,28 @@ def execute_analysis(
     inputs: list[str],
     outputs: list[str],
     model_key: str,
-    period_column: str = None
+    period_column: str = None,
+    legacy_results: bool = False,
+    n_jobs: int | None = 1
 ) -> dict:
     """
     Ejecuta el análisis DEA seleccionado y devuelve un diccionario estandarizado con los resultados.
+
+    En el modelo radial ``main_df`` usa columnas planas (``slack_in__<col>``,
+    ``target_in__<col>``...) y las lambdas van aparte, como matriz dispersa,
+    en ``results["dea_results"]``. Con ``legacy_results=True`` se devuelven
+    las tablas clásicas con diccionarios en las celdas.
+
+    ``n_jobs`` se pasa a los modelos con réplicas Monte Carlo (orden-m y
+    orden-α). Por defecto es secuencial: abrir un pool de procesos desde el
+    manejador de una petición de Streamlit debe decidirlo quien llama.
     """
     results = {"model_name": model_key, "main_df": pd.DataFrame(), "charts": {}}
 
     if model_key == 'CCR_BCC':
         results["model_name"] = "Radial (CCR y BCC)"
-        df_ccr = run_ccr(df, dmu_column, inputs, outputs)
+        res_ccr = run_ccr(df, dmu_column, inputs, outputs, compact=True)
+        df_ccr = res_ccr.to_legacy() if legacy_results else res_ccr.frame
 
         # Verificación de robustez: se comprueba que el cálculo de CCR generó la columna esperada.
         if 'tec_efficiency_ccr' not in df_ccr.columns:
@@ -34,8 +48,10 @@ def execute_analysis(
         # Se crea una copia con la columna renombrada solo para el gráfico de histograma.
         df_ccr_hist = df_ccr.rename(columns={"tec_efficiency_ccr": "efficiency"})
         
-        # CORRECCIÓN: Se pasa el DataFrame original 'df_ccr' a run_bcc.
-        df_bcc = run_bcc(df, dmu_column, inputs, outputs, df_ccr_results=df_ccr)
+        # Se pasan a run_bcc los resultados CCR completos (eficiencias sin renombrar).
+        res_bcc = run_bcc(df, dmu_column, inputs, outputs, df_ccr_results=res_ccr, compact=True)
+        df_bcc = res_bcc.to_legacy() if legacy_results else res_bcc.frame
+        results["dea_results"] = {"ccr": res_ccr, "bcc": res_bcc}
         
         main_df = pd.DataFrame()
         # Se verifica que ambos DataFrames no estén vacíos antes de unirlos.
@@ -66,6 +82,29 @@ def execute_analysis(
         results["charts"]["hist_sbm"] = plot_efficiency_histogram(df_sbm_hist)
         return results
 
+    elif model_key == 'FDH':
+        results["model_name"] = "Free Disposal Hull (FDH)"
+        res_fdh = run_fdh(df, dmu_column, inputs, outputs, compact=True)
+        df_fdh = res_fdh.to_legacy() if legacy_results else res_fdh.frame
+        results["main_df"] = df_fdh
+        results["dea_results"] = {"fdh": res_fdh}
+        results["charts"]["hist_fdh"] = plot_efficiency_histogram(df_fdh.rename(columns={"efficiency_fdh": "efficiency"}))
+        return results
+
+    elif model_key in ('ORDER_M', 'ORDER_ALPHA'):
+        # Fronteras parciales: alternativas robustas y rápidas para cargas grandes con ruido
+        if model_key == 'ORDER_M':
+            results["model_name"] = "Frontera Parcial Orden-m"
+            df_partial = run_order_m(df, dmu_column, inputs, outputs, seed=0, n_jobs=n_jobs)
+            eff_col = "efficiency_order_m"
+        else:
+            results["model_name"] = "Frontera Parcial Orden-α"
+            df_partial = run_order_alpha(df, dmu_column, inputs, outputs, n_jobs=n_jobs)
+            eff_col = "efficiency_order_alpha"
+        results["main_df"] = df_partial
+        results["charts"]["hist_partial"] = plot_efficiency_histogram(df_partial.rename(columns={eff_col: "efficiency"}))
+        return results
+
     elif model_key == 'MALMQUIST':
         results["model_name"] = "Índice de Productividad de Malmquist"
         if not period_column or period_column not in df.columns:
@@ -4,40 +4,40 @@ import json
 import pandas as pd
 from openai import OpenAI
 
+from dea_models.utils import validation_report
+
 client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
 # ---------- reglas formales básicas ----------
-def _formal_checks(df: pd.DataFrame, inputs: list[str], outputs: list[str]) -> list[str]:
+def _formal_checks(df: pd.DataFrame, inputs: list[str], outputs: list[str], report: dict | None = None) -> list[str]:
     """
     Comprueba únicamente las columnas de 'inputs' y 'outputs':
       - que existan en el DataFrame,
       - que no tengan valores nulos,
       - que sean numéricas,
       - que todos los valores sean > 0.
+    Usa el informe de ``validation_report`` (una sola pasada sobre todas las
+    columnas), así que devuelve todos los problemas a la vez.
     Devuelve lista de mensajes de error (vacía si todo OK).
     """
-    issues = []
+    if report is None:
+        report = validation_report(df, inputs, outputs)
 
-    # 1) Verificar existencia de columnas seleccionadas
-    for col in inputs + outputs:
-        if col not in df.columns:
+    issues = []
+    for col, info in report["columns"].items():
+        if info["missing"]:
             issues.append(f"La columna '{col}' no existe en el DataFrame.")
-            # No seguimos validando esa columna si no existe
-    if issues:
-        return issues
-
-    # 2) Para cada columna de inputs/outputs, chequear nulos, tipo y positividad
-    for col in inputs + outputs:
-        # 2.1) Nulos
-        if df[col].isnull().any():
-            issues.append(f"Columna '{col}' contiene valores nulos.")
-        # 2.2) Tipo numérico
-        if not pd.api.types.is_numeric_dtype(df[col]):
+            continue
+        if info["nulls"]:
+            issues.append(f"Columna '{col}' contiene {info['nulls']} valores nulos.")
+        if not info["numeric"]:
             issues.append(f"Columna '{col}' no es numérica.")
-        else:
-            # 2.3) Todos > 0
-            if (df[col] <= 0).any():
-                issues.append(f"Columna '{col}' contiene valores ≤ 0; DEA requiere positivos.")
+            continue
+        if info["infinite"]:
+            issues.append(f"Columna '{col}' contiene {info['infinite']} valores infinitos.")
+        non_positive = info["zeros"] + info["negatives"]
+        if non_positive:
+            issues.append(f"Columna '{col}' contiene {non_positive} valores ≤ 0; DEA requiere positivos.")
 
     return issues
 
@@ -77,11 +77,13 @@ def validate(df: pd.DataFrame, inputs: list[str], outputs: list[str]) -> dict:
     Retorna:
       {
         "formal_issues": [str, ...],
+        "formal_report": dict (ver dea_models.utils.validation_report),
         "llm": { "ready": bool, "issues": [str,...], "suggested_fixes": [str,...], "raw": str? }
       }
     """
-    # 1) Validación formal de inputs/outputs
-    formal_issues = _formal_checks(df, inputs, outputs)
+    # 1) Validación formal de inputs/outputs (una sola pasada)
+    formal_report = validation_report(df, inputs, outputs)
+    formal_issues = _formal_checks(df, inputs, outputs, report=formal_report)
 
     # 2) Preparar HEAD para LLM (solo primeras filas, en JSON)
     try:
@@ -98,4 +100,4 @@ def validate(df: pd.DataFrame, inputs: list[str], outputs: list[str]) -> dict:
         if "issues" not in llm_json:
             llm_json["issues"] = []
 
-    return {"formal_issues": formal_issues, "llm": llm_json}
+    return {"formal_issues": formal_issues, "formal_report": formal_report, "llm": llm_json}
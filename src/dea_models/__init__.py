@@ -3,12 +3,24 @@
 # Las funciones de visualización se importarán directamente desde el módulo
 # dea_models.visualizations para evitar errores de importación circular.
 
-from .utils import validate_positive_dataframe, check_positive_data, check_zero_negative_data
-from .radial import run_ccr, run_bcc
+from .utils import validate_positive_dataframe, check_positive_data, check_zero_negative_data, validation_report
+from .radial import run_ccr, run_bcc, scaling_report
 from .nonradial import run_sbm, run_radial_distance
+from .fdh import run_fdh
+from .partial_frontiers import run_order_m, run_order_alpha
 from .mpi import compute_malmquist_phi
 from .cross_efficiency import compute_cross_efficiency
 from .window_analysis import run_window_dea
-from .stochastic import run_stochastic_dea, bootstrap_efficiencies
-from .auto_tuner import generate_candidates, evaluate_candidates
+from .stochastic import run_stochastic_dea, bootstrap_efficiencies, run_smoothed_bootstrap_dea
+from .auto_tuner import generate_candidates, evaluate_candidates, iter_evaluate_candidates, search_variable_subsets, rank_variables
+from .cache import configure_cache, clear_cache, cache_info
+from .solver import configure_solver
+from .data import DEAData
+from .dominance import dominance_index
+from .results import DEAResults
+from .incremental import IncrementalDEA
+from .frontier import Frontier
+from .streaming import run_streaming_dea
+from .sharded import run_sharded_dea, serve_worker, start_local_workers, stop_workers
+from .certificates import verify_radial, certify_results
 # Las líneas que importaban desde .visualizations han sido eliminadas.
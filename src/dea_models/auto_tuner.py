@@ -1,10 +1,18 @@
 # jftmames/-dea-deliberativo-mvp/-dea-deliberativo-mvp-b44b8238c978ae0314af30717b9399634d28f8f9/src/dea_models/auto_tuner.py
 import pandas as pd
 import numpy as np
+import heapq
+import re
+import time
 import uuid
+from concurrent.futures import as_completed
 
-from .radial import _run_dea_internal
-from .utils import validate_positive_dataframe
+from .radial import _dea_core, _build_radial_problem, _set_reference, _solve_radial_problem, _radial_duals, _run_ccr_key
+from .parallel import resolve_n_jobs, share_arrays, release_arrays, make_pool, get_shared_array
+from .cache import spec_key, get_cached, store_cached
+from .data import as_dea_data
+from .results import DEAResults
+from .utils import _scan_columns
 
 def generate_candidates(
     df: pd.DataFrame,
@@ -13,11 +21,27 @@ def generate_candidates(
     output_cols: list[str],
     inquiry_tree: dict,
     eee_score: float,
-    n_candidates: int = 5
+    n_candidates: int = 5,
+    search_mode: str = "leave_one_out",
+    model: str = "CCR",
+    time_budget: float | None = None,
+    base_results: DEAResults | None = None
 ) -> list[dict]:
     """
     Genera n_candidates propuestas de {inputs: new_inputs, outputs: new_outputs}
     basado en subpreguntas e eee_score.
+
+    ``search_mode``:
+      - "leave_one_out": quita una variable cada vez, en el orden de
+        :func:`rank_variables` (precios sombra, correlaciones y variables
+        citadas en ``inquiry_tree``); cada candidato lleva
+        ``estimated_delta_eff`` y solo los ``n_candidates`` primeros se
+        resolverán después en :func:`evaluate_candidates`.
+      - "branch_and_bound": explora todo el retículo de subconjuntos con
+        :func:`search_variable_subsets` y propone los más discriminantes.
+
+    ``base_results`` (el :class:`DEAResults` de ``run_ccr`` sobre la
+    especificación actual) se pasa a :func:`rank_variables`.
     """
     all_vars = input_cols + output_cols
     candidates = []
@@ -29,14 +53,31 @@ def generate_candidates(
         "outputs": output_cols
     })
 
-    for var in all_vars:
-        new_inputs = input_cols.copy()
-        new_outputs = output_cols.copy()
+    if search_mode == "branch_and_bound":
+        found = search_variable_subsets(
+            df, dmu_column, input_cols, output_cols,
+            model=model, top_k=n_candidates, time_budget=time_budget
+        )
+        for _, row in found.iterrows():
+            if set(row["inputs"]) == set(input_cols) and set(row["outputs"]) == set(output_cols):
+                continue
+            candidates.append({
+                "candidate_id": str(uuid.uuid4()),
+                "inputs": row["inputs"],
+                "outputs": row["outputs"]
+            })
+        return candidates[:n_candidates + 1]
+    elif search_mode != "leave_one_out":
+        raise ValueError(f"search_mode '{search_mode}' no soportado.")
 
-        if var in new_inputs:
-            new_inputs.remove(var)
-        elif var in new_outputs:
-            new_outputs.remove(var)
+    ranked = rank_variables(
+        df, input_cols, output_cols, inquiry_tree=inquiry_tree, eee_score=eee_score,
+        dmu_column=dmu_column, base_results=base_results,
+    )
+    for _, info in ranked.iterrows():
+        var = info["variable"]
+        new_inputs = [c for c in input_cols if c != var]
+        new_outputs = [c for c in output_cols if c != var]
 
         if not new_inputs or not new_outputs:
             continue
@@ -44,7 +85,8 @@ def generate_candidates(
         candidates.append({
             "candidate_id": str(uuid.uuid4()),
             "inputs": new_inputs,
-            "outputs": new_outputs
+            "outputs": new_outputs,
+            "estimated_delta_eff": info["estimated_delta_eff"]
         })
         if len(candidates) > n_candidates: # > para contar el base
             break
@@ -52,49 +94,203 @@ def generate_candidates(
     return candidates
 
 
-def evaluate_candidates(
+def rank_variables(
     df: pd.DataFrame,
-    dmu_column: str,
-    candidates: list[dict],
-    model: str = "CCR"
+    input_cols: list[str],
+    output_cols: list[str],
+    inquiry_tree: dict | None = None,
+    eee_score: float = 0.0,
+    dmu_column: str | None = None,
+    base_results: DEAResults | None = None
 ) -> pd.DataFrame:
     """
-    Para cada candidato (inputs/outputs), calcula eficiencia promedio y EEE simulado.
+    Ordena las variables según el impacto estimado de quitarlas, sin resolver
+    ningún PL aparte de la ejecución base.
+
+    De la ejecución CCR base se toman los precios sombra de cada DMU (pesos
+    ``u``, ``v`` del dual). Se reutilizan los duales de ``base_results`` o,
+    con ``dmu_column``, los de una ejecución de ``run_ccr`` (valores por
+    defecto) que siga en la caché; solo se resuelven los PL de las DMUs sin
+    duales (todas si no hay ejecución base). ``df.attrs["base_lp_solves"]``
+    cuenta esos PL. Anulando el peso de la variable ``k`` y reescalando
+    se obtiene una solución factible del modelo sin ``k``, es decir, una cota
+    inferior de la nueva eficiencia de cada DMU:
+
+      - input ``k``: ``e_i · c_ik / (1 - v_ik·x_ik)``;
+      - output ``r``: ``(e_i - u_ir·y_ir) · c_ir``;
+
+    donde ``c`` es el mayor factor que mantiene ``u·y_j <= v·x_j`` para toda
+    DMU ``j`` con los pesos recortados.
+
+    La caída media de esa cota se atenúa por la correlación máxima con otra
+    variable del mismo papel (una variable redundante apenas cambia el
+    resultado). Las variables citadas en ``inquiry_tree`` suben en el ranking
+    con un peso igual a ``eee_score``: cuanto más sólida la deliberación, más
+    cuenta lo que se ha preguntado.
+
+    Retorna DataFrame con ``variable, role, estimated_delta_eff,
+    mentioned, priority`` ordenado por prioridad descendente.
     """
-    rows = []
-    
-    for cand in candidates:
-        inp = cand["inputs"]
-        outp = cand["outputs"]
-        
-        try:
-            validate_positive_dataframe(df, inp + outp)
-            df_eff = _run_dea_internal(
-                df=df,
-                dmu_col_name=dmu_column,
-                inputs=inp,
-                outputs=outp,
-                model=model,
-                orientation="input",
-                super_eff=False
-            )
-            avg_eff = float(df_eff["efficiency"].mean()) if not df_eff.empty and "efficiency" in df_eff.columns else np.nan
-        except ValueError as e:
-            print(f"Skipping candidate {inp}/{outp} due to validation error: {e}")
-            avg_eff = np.nan
+    all_vars = input_cols + output_cols
+    block, invalid = _validated_block(df, all_vars)
+    m = len(input_cols)
 
-        eee_sim = avg_eff * 100 if not np.isnan(avg_eff) else np.nan
+    impacts = np.full(len(all_vars), np.nan)
+    dual_stats = {"lp_solves": 0}
+    if not invalid:
+        if base_results is None and dmu_column is not None:
+            base_results = _cached_base_run(df, dmu_column, input_cols, output_cols)
+        duals = _base_duals(base_results, input_cols, output_cols, block.shape[1])
+        # Las eficiencias u·y de la cota dual no son puntuaciones primales:
+        # no se guardan en la caché que leen run_ccr y evaluate_candidates
+        impacts, _ = _dual_drop_impacts(block[:m], block[m:], duals=duals, stats=dual_stats)
 
+    corr = np.corrcoef(block) if block.shape[1] > 1 else np.eye(len(all_vars))
+    corr = np.nan_to_num(np.abs(corr), nan=0.0)
+    tree_text = _tree_text(inquiry_tree).lower()
+
+    rows = []
+    for k, var in enumerate(all_vars):
+        same_role = range(0, m) if k < m else range(m, len(all_vars))
+        redundancy = max((corr[k, j] for j in same_role if j != k), default=0.0)
+        delta = -impacts[k] * (1.0 - redundancy)
         rows.append({
-            "candidate_id": cand["candidate_id"],
-            "inputs": inp,
-            "outputs": outp,
-            "avg_efficiency": avg_eff,
-            "eee_score_sim": eee_sim,
-            "delta_eff": None,
-            "delta_eee": None
+            "variable": var,
+            "role": "input" if k < m else "output",
+            "estimated_delta_eff": float(delta),
+            "mentioned": re.search(rf"(?<!\w){re.escape(var.lower())}(?!\w)", tree_text) is not None,
         })
 
+    ranked = pd.DataFrame(rows, columns=["variable", "role", "estimated_delta_eff", "mentioned"])
+    scale = np.nanmax(np.abs(ranked["estimated_delta_eff"])) if ranked["estimated_delta_eff"].notna().any() else 0.0
+    impact = ranked["estimated_delta_eff"].abs().fillna(0.0) / scale if scale > 0 else 0.0
+    ranked["priority"] = impact + float(eee_score or 0.0) * ranked["mentioned"]
+    # Orden estable: a igualdad de prioridad se respeta el orden de columnas
+    ranked = ranked.sort_values("priority", ascending=False, kind="stable").reset_index(drop=True)
+    ranked.attrs["base_lp_solves"] = dual_stats["lp_solves"]
+    return ranked
+
+
+def _cached_base_run(df, dmu_column, input_cols, output_cols) -> DEAResults | None:
+    """Ejecución ``run_ccr`` por defecto (orientación input u output) ya en la caché, o ``None``."""
+    try:
+        data = as_dea_data(df, dmu_column, input_cols, output_cols)
+    except (ValueError, KeyError):
+        return None
+    for orientation in ("input", "output"):
+        cached = get_cached(_run_ccr_key(data, orientation)[1])
+        if isinstance(cached, DEAResults):
+            return cached
+    return None
+
+
+def _base_duals(results, input_cols, output_cols, n) -> tuple[np.ndarray, np.ndarray] | None:
+    """
+    ``(U, V)`` de un resultado CCR sin supereficiencia sobre las mismas
+    variables y DMUs, o ``None``. Con CRS los duales de ambas orientaciones
+    coinciden salvo el factor que fija la normalización ``v·x_i = 1``.
+    """
+    if not isinstance(results, DEAResults) or results.certificate is None or results.super_eff:
+        return None
+    if results.efficiency_column != "tec_efficiency_ccr" or len(results.dmus) != n:
+        return None
+    if list(results.input_cols) != list(input_cols) or list(results.output_cols) != list(output_cols):
+        return None
+    return results.certificate["u"], results.certificate["v"]
+
+
+def _dual_drop_impacts(
+    X: np.ndarray,
+    Y: np.ndarray,
+    duals: tuple[np.ndarray, np.ndarray] | None = None,
+    chunk_size: int = 1024,
+    stats: dict | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Caída media de la cota dual de eficiencia al quitar cada variable
+    (inputs primero, luego outputs) y las eficiencias ``u·y`` (cota dual) de
+    la ejecución base. ``duals=(U, V)`` reutiliza los de una ejecución CCR;
+    solo se resuelven las DMUs sin ellos (``stats["lp_solves"]``).
+    Ver :func:`rank_variables`.
+    """
+    m, n = X.shape
+    s = Y.shape[0]
+
+    # Precios sombra de la ejecución base: u (outputs) y v (inputs) por DMU
+    U = np.full((n, s), np.nan)
+    V = np.full((n, m), np.nan)
+    if duals is not None:
+        U[:], V[:] = duals
+    missing = np.flatnonzero(np.isnan(U).any(axis=1) | np.isnan(V).any(axis=1))
+    if stats is not None:
+        stats["lp_solves"] = int(len(missing))
+    if len(missing):
+        compiled = _build_radial_problem(n, m, s, rts="CRS", orientation="input")
+        _set_reference(compiled, X, Y)
+    for i in missing:
+        duals = None if np.isnan(_solve_radial_problem(compiled, X[:, [i]], Y[:, [i]])) else _radial_duals(compiled, "CRS")
+        if duals is None:
+            continue
+        U[i], V[i], _ = duals
+    # Normalización v·x_i = 1 (el dual ya la cumple salvo error numérico); u
+    # se reescala con el mismo factor para seguir siendo la misma solución dual
+    norm = np.einsum("ik,ki->i", V, X)[:, None]
+    V /= norm
+    U /= norm
+    eff = np.einsum("ir,ri->i", U, Y)
+
+    impacts = np.empty(m + s)
+    for k in range(m + s):
+        lower = np.empty(n)
+        for start in range(0, n, chunk_size):
+            rows = slice(start, start + chunk_size)
+            virt_in = V[rows] @ X
+            virt_out = U[rows] @ Y
+            if k < m:
+                share = V[rows, k] * X[k, rows]
+                virt_in = virt_in - np.outer(V[rows, k], X[k])
+                own = eff[rows] / np.where(share < 1.0 - 1e-9, 1.0 - share, np.nan)
+            else:
+                r = k - m
+                virt_out = virt_out - np.outer(U[rows, r], Y[r])
+                own = eff[rows] - U[rows, r] * Y[r, rows]
+            # Reescalado máximo que mantiene factibles las restricciones u·y_j <= v·x_j
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = np.where(virt_out > 0, virt_in / virt_out, np.inf)
+            c = np.min(ratio, axis=1)
+            lower[rows] = np.nan_to_num(own * np.where(np.isfinite(c), c, 0.0), nan=0.0)
+        impacts[k] = np.nanmean(eff - np.minimum(lower, eff))
+    return impacts, eff
+
+
+def _tree_text(tree) -> str:
+    """Concatena todas las preguntas de un árbol de indagación anidado."""
+    if not isinstance(tree, dict):
+        return ""
+    return " ".join(f"{key} {_tree_text(value)}" for key, value in tree.items())
+
+
+def evaluate_candidates(
+    df: pd.DataFrame,
+    dmu_column: str,
+    candidates: list[dict],
+    model: str = "CCR",
+    n_jobs: int | None = 1,
+    on_result=None
+) -> pd.DataFrame:
+    """
+    Para cada candidato (inputs/outputs), calcula eficiencia promedio y EEE simulado.
+
+    Los candidatos se evalúan con :func:`iter_evaluate_candidates`; si se pasa
+    ``on_result``, se llama con cada fila según va terminando (útil para mostrar
+    tablas parciales en la interfaz).
+    """
+    rows = [None] * len(candidates)
+    for pos, row in iter_evaluate_candidates(df, dmu_column, candidates, model=model, n_jobs=n_jobs):
+        rows[pos] = row
+        if on_result is not None:
+            on_result(row)
+
     df_cand = pd.DataFrame(rows)
     if not df_cand.empty and len(df_cand) > 1:
         base_eff = df_cand.loc[0, "avg_efficiency"]
@@ -105,3 +301,252 @@ def evaluate_candidates(
             df_cand["delta_eee"] = df_cand["eee_score_sim"] - base_eee
 
     return df_cand
+
+
+def iter_evaluate_candidates(
+    df: pd.DataFrame,
+    dmu_column: str,
+    candidates: list[dict],
+    model: str = "CCR",
+    n_jobs: int | None = 1
+):
+    """
+    Evalúa los candidatos y produce tuplas ``(posición, fila)`` a medida que terminan.
+
+    Todas las columnas usadas por algún candidato se validan una sola vez y se
+    convierten en un único bloque numérico; cada candidato solo selecciona
+    índices de fila de ese bloque. Con ``n_jobs`` > 1 (``-1`` = todos los
+    núcleos) el bloque se publica en memoria compartida y los candidatos se
+    reparten entre procesos; el orden de llegada no está garantizado.
+    """
+    used_cols = list(dict.fromkeys(c for cand in candidates for c in cand["inputs"] + cand["outputs"]))
+    block, invalid = _validated_block(df, used_cols)
+    col_pos = {c: k for k, c in enumerate(used_cols)}
+    rts = "CRS" if model.upper() == "CCR" else "VRS"
+    model = "CCR" if rts == "CRS" else "BCC"
+
+    tasks = []
+    for pos, cand in enumerate(candidates):
+        inp, outp = cand["inputs"], cand["outputs"]
+        bad = [c for c in inp + outp if c in invalid]
+        if bad:
+            print(f"Skipping candidate {inp}/{outp} due to validation error: {invalid[bad[0]]}")
+            yield pos, _candidate_row(cand, np.nan)
+            continue
+        key = _subset_key(block, col_pos, inp, outp, model)
+        cached = get_cached(key)
+        if cached is not None:
+            yield pos, _candidate_row(cand, _mean_efficiency(cached))
+            continue
+        tasks.append((pos, key, [col_pos[c] for c in inp], [col_pos[c] for c in outp]))
+
+    n_workers = min(resolve_n_jobs(n_jobs), len(tasks))
+    if n_workers <= 1:
+        for pos, key, in_idx, out_idx in tasks:
+            eff = _candidate_efficiencies(in_idx, out_idx, rts, block)
+            store_cached(key, eff)
+            yield pos, _candidate_row(candidates[pos], _mean_efficiency(eff))
+        return
+
+    handles, specs = share_arrays({"block": block})
+    try:
+        with make_pool(n_workers, specs) as pool:
+            futures = {
+                pool.submit(_candidate_efficiencies, in_idx, out_idx, rts): (pos, key)
+                for pos, key, in_idx, out_idx in tasks
+            }
+            for fut in as_completed(futures):
+                pos, key = futures[fut]
+                eff = fut.result()
+                store_cached(key, eff)
+                yield pos, _candidate_row(candidates[pos], _mean_efficiency(eff))
+    finally:
+        release_arrays(handles)
+
+
+def _validated_block(df: pd.DataFrame, cols: list[str]) -> tuple[np.ndarray, dict[str, str]]:
+    """
+    Valida una sola vez las columnas (mismo recorrido que
+    :func:`~dea_models.utils.validation_report`) y devuelve el bloque
+    ``(len(cols), n)`` en float64 junto con ``{columna: motivo}`` para las
+    columnas no utilizables (ausentes, no numéricas, con nulos, infinitos,
+    ceros o negativos).
+    """
+    block, report = _scan_columns(df, cols, [])
+    invalid = {}
+    for col, info in report["columns"].items():
+        if info["missing"]:
+            invalid[col] = f"Faltan columnas: {{'{col}'}}"
+            continue
+        reasons = [issue for issue in report["issues"] if issue.startswith(f"Columna '{col}' ")]
+        if reasons:
+            invalid[col] = reasons[0]
+    return block, invalid
+
+
+def _candidate_efficiencies(in_idx: list[int], out_idx: list[int], rts: str, block: np.ndarray = None) -> np.ndarray:
+    """Eficiencias (orientación input) de un candidato; en procesos hijos usa el bloque compartido."""
+    if block is None:
+        block = get_shared_array("block")
+    return np.round(_dea_core(block[in_idx], block[out_idx], rts=rts, orientation="input", prefilter_dominated=True), 6)
+
+
+def _mean_efficiency(eff: np.ndarray) -> float:
+    """Media ignorando DMUs sin solución (``NaN`` si no hay ninguna)."""
+    return float(np.nanmean(eff)) if eff.size and not np.isnan(eff).all() else np.nan
+
+
+def _subset_key(block: np.ndarray, rows_of: dict[str, int], inputs: list[str], outputs: list[str], model: str) -> tuple:
+    """
+    Clave de caché (ver :mod:`dea_models.cache`) del vector de eficiencias
+    input-orientado de un subconjunto; coincide con la que guarda ``run_ccr``/``run_bcc``.
+    """
+    rows = [rows_of[c] for c in sorted(inputs) + sorted(outputs)]
+    rts = "CRS" if model.upper() == "CCR" else "VRS"
+    return spec_key(block[rows], inputs, outputs, model, "input", rts)
+
+
+def _candidate_row(cand: dict, avg_eff: float) -> dict:
+    """Fila de resultados de un candidato (los deltas se completan al final)."""
+    return {
+        "candidate_id": cand["candidate_id"],
+        "inputs": cand["inputs"],
+        "outputs": cand["outputs"],
+        "avg_efficiency": avg_eff,
+        "eee_score_sim": avg_eff * 100 if not np.isnan(avg_eff) else np.nan,
+        "delta_eff": None,
+        "delta_eee": None
+    }
+
+
+def search_variable_subsets(
+    df: pd.DataFrame,
+    dmu_column: str,
+    input_cols: list[str],
+    output_cols: list[str],
+    model: str = "CCR",
+    min_vars: int | None = None,
+    max_vars: int | None = None,
+    top_k: int = 5,
+    time_budget: float | None = None
+) -> pd.DataFrame:
+    """
+    Búsqueda branch-and-bound de la especificación más discriminante.
+
+    Recorre el retículo de subconjuntos de ``input_cols`` + ``output_cols``
+    (cada variable conserva su papel) buscando los ``top_k`` subconjuntos con
+    menor eficiencia media entre los que tienen al menos un input, un output y
+    entre ``min_vars`` y ``max_vars`` variables. Por defecto ``min_vars`` es la
+    mitad (redondeada hacia arriba) de las variables y ``max_vars`` respeta la
+    regla n >= 3·(m + s).
+
+    Añadir variables nunca reduce la eficiencia DEA de ninguna DMU, así que la
+    eficiencia de cualquier subconjunto incluido en S es una cota inferior, DMU
+    a DMU, de la de S. Las cotas se obtienen sin PL a partir de los pares
+    (input, output) (cociente CRS normalizado, válido también para VRS) y de
+    los subconjuntos ya resueltos. La exploración es *best-first* por la cota
+    media y se detiene cuando ninguna rama pendiente puede mejorar el
+    ``top_k`` actual, o al agotar ``time_budget`` segundos. Los resultados se
+    memorizan por subconjunto, así que revisitar uno no cuesta ningún PL.
+
+    Retorna DataFrame con columnas ``inputs, outputs, n_vars, avg_efficiency``
+    ordenado de más a menos discriminante; ``df.attrs`` incluye
+    ``n_evaluated``, ``n_cached``, ``n_pruned``, ``timed_out`` y ``excluded``
+    (``{variable: motivo}`` de las variables que no superan la validación).
+    """
+    all_vars = input_cols + output_cols
+    block, invalid = _validated_block(df, all_vars)
+    variables = [v for v in all_vars if v not in invalid]
+    is_input = [v in input_cols for v in variables]
+    rows_of = {v: all_vars.index(v) for v in variables}
+
+    n_dmus = len(df)
+    min_vars = min_vars if min_vars is not None else max(2, -(-len(variables) // 2))
+    max_vars = max_vars if max_vars is not None else max(min_vars, min(len(variables), n_dmus // 3))
+    rts = "CRS" if model.upper() == "CCR" else "VRS"
+    model = "CCR" if rts == "CRS" else "BCC"
+
+    # Cotas por pares: eficiencia CRS de un input y un output, sin PL
+    pair_eff = {}
+    for a in range(len(variables)):
+        for b in range(len(variables)):
+            if is_input[a] and not is_input[b]:
+                ratio = block[rows_of[variables[b]]] / block[rows_of[variables[a]]]
+                pair_eff[(a, b)] = ratio / ratio.max()
+
+    stats = {"n_evaluated": 0, "n_cached": 0, "n_pruned": 0, "timed_out": False, "excluded": dict(invalid)}
+
+    def solve(subset):
+        ins = [variables[k] for k in subset if is_input[k]]
+        outs = [variables[k] for k in subset if not is_input[k]]
+        key = _subset_key(block, rows_of, ins, outs, model)
+        eff = get_cached(key)
+        if eff is not None:
+            stats["n_cached"] += 1
+        else:
+            stats["n_evaluated"] += 1
+            eff = _candidate_efficiencies(
+                [rows_of[v] for v in ins], [rows_of[v] for v in outs], rts, block
+            )
+            store_cached(key, eff)
+        return eff
+
+    def child_bound(parent_vec, child):
+        # Pares nuevos que aporta la última variable frente a las del papel contrario
+        k = child[-1]
+        vec = parent_vec
+        for j in child[:-1]:
+            if is_input[k] != is_input[j]:
+                vec = np.maximum(vec, pair_eff[(k, j) if is_input[k] else (j, k)])
+        return vec
+
+    best = []  # max-heap (por -media) con los top_k mejores: (-media, subconjunto)
+    tie = 0
+    frontier = [(0.0, tie, (), np.zeros(n_dmus))]  # (cota media, desempate, subconjunto, cota por DMU)
+    start = time.monotonic()
+
+    while frontier:
+        if time_budget is not None and time.monotonic() - start > time_budget:
+            stats["timed_out"] = True
+            break
+        bound, _, subset, vec = heapq.heappop(frontier)
+        if len(best) == top_k and bound >= -best[0][0]:
+            stats["n_pruned"] += len(frontier) + 1
+            break
+
+        has_in = any(is_input[j] for j in subset)
+        has_out = any(not is_input[j] for j in subset)
+        if has_in and has_out and min_vars <= len(subset) <= max_vars:
+            # Se resuelve: su eficiencia es la cota más fuerte para sus descendientes
+            vec = np.fmax(vec, solve(subset))
+            mean = float(np.nanmean(vec))
+            if len(best) < top_k:
+                heapq.heappush(best, (-mean, subset))
+            elif mean < -best[0][0]:
+                heapq.heapreplace(best, (-mean, subset))
+
+        if len(subset) >= max_vars:
+            continue
+        last = subset[-1] if subset else -1
+        for k in range(last + 1, len(variables)):
+            child = subset + (k,)
+            child_vec = child_bound(vec, child)
+            child_mean = float(child_vec.mean())
+            if len(best) == top_k and child_mean >= -best[0][0]:
+                stats["n_pruned"] += 1
+                continue
+            tie += 1
+            heapq.heappush(frontier, (child_mean, tie, child, child_vec))
+
+    rows = [
+        {
+            "inputs": [variables[k] for k in subset if is_input[k]],
+            "outputs": [variables[k] for k in subset if not is_input[k]],
+            "n_vars": len(subset),
+            "avg_efficiency": -neg_mean,
+        }
+        for neg_mean, subset in sorted(best, reverse=True)
+    ]
+    df_out = pd.DataFrame(rows, columns=["inputs", "outputs", "n_vars", "avg_efficiency"])
+    df_out.attrs.update(stats)
+    return df_out
@@ -0,0 +1,186 @@
+# src/dea_models/cache.py
+
+"""
+Caché de resultados DEA compartida por todo el proceso.
+
+Las claves combinan la huella del bloque de datos (columnas en orden
+canónico), los conjuntos ordenados de inputs/outputs, el modelo, la
+orientación y los rendimientos a escala; así la misma especificación
+resuelta desde ``execute_analysis``, el auto-tuner o un escenario clonado
+se reutiliza sin volver a resolver ningún PL.
+
+Los valores se guardan serializados (pickle), de modo que quien los recupera
+recibe siempre una copia independiente. El nivel en memoria es LRU; el nivel
+en disco es opcional (:func:`configure_cache` o la variable de entorno
+``DEA_CACHE_DIR``) y sobrevive entre procesos.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from .utils import data_fingerprint
+from .data import DEAData
+from .solver import resolve_preset
+
+_LOCK = threading.Lock()
+_MEMORY: "OrderedDict[tuple, bytes]" = OrderedDict()
+_CONFIG = {
+    "max_entries": 512,
+    "disk_dir": os.environ.get("DEA_CACHE_DIR") or None,
+}
+_STATS = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+
+def configure_cache(max_entries: int | None = None, disk_dir: str | None = None) -> None:
+    """
+    Ajusta el tamaño del nivel en memoria y activa el nivel en disco.
+
+    ``max_entries=0`` desactiva la caché en memoria; ``disk_dir=""`` desactiva
+    el nivel en disco.
+    """
+    with _LOCK:
+        if max_entries is not None:
+            if max_entries < 0:
+                raise ValueError("max_entries debe ser >= 0.")
+            _CONFIG["max_entries"] = int(max_entries)
+            _evict()
+        if disk_dir is not None:
+            _CONFIG["disk_dir"] = disk_dir or None
+            if disk_dir:
+                os.makedirs(disk_dir, exist_ok=True)
+
+
+def clear_cache(disk: bool = False) -> None:
+    """Vacía la caché en memoria (y los ficheros del nivel en disco si ``disk``)."""
+    with _LOCK:
+        _MEMORY.clear()
+        for k in _STATS:
+            _STATS[k] = 0
+        disk_dir = _CONFIG["disk_dir"]
+    if disk and disk_dir and os.path.isdir(disk_dir):
+        for name in os.listdir(disk_dir):
+            if name.endswith(".pkl"):
+                os.remove(os.path.join(disk_dir, name))
+
+
+def cache_info() -> dict:
+    """Estadísticas: aciertos en memoria y disco, fallos y entradas en memoria."""
+    with _LOCK:
+        return {**_STATS, "entries": len(_MEMORY), **_CONFIG}
+
+
+def spec_key(
+    block: np.ndarray,
+    inputs: list[str],
+    outputs: list[str],
+    model: str,
+    orientation: str = "input",
+    rts: str | None = None,
+    extra: tuple = (),
+    solver_preset: str | None = None,
+) -> tuple:
+    """
+    Clave de una especificación. ``block`` contiene las filas de
+    ``sorted(inputs) + sorted(outputs)`` en ese orden (ver :func:`frame_block`).
+    ``extra`` distingue distintos tipos de resultado sobre la misma especificación.
+    El preset de solver efectivo forma parte de la clave (``None`` = el
+    preset por defecto en el momento de la llamada).
+    """
+    return (
+        data_fingerprint(block),
+        tuple(sorted(inputs)),
+        tuple(sorted(outputs)),
+        model.upper(),
+        orientation,
+        rts,
+        resolve_preset(solver_preset),
+        *extra,
+    )
+
+
+def frame_block(df, inputs: list[str], outputs: list[str]) -> np.ndarray:
+    """
+    Bloque ``(m + s, n)`` en float64 con las columnas en el orden canónico de
+    :func:`spec_key`; ``df`` puede ser un DataFrame o un :class:`DEAData`.
+    """
+    if isinstance(df, DEAData):
+        rows = [df.X[df.input_cols.index(c)] for c in sorted(inputs)]
+        rows += [df.Y[df.output_cols.index(c)] for c in sorted(outputs)]
+        return np.ascontiguousarray(np.vstack(rows))
+    return np.ascontiguousarray(df[sorted(inputs) + sorted(outputs)].to_numpy(dtype=float).T)
+
+
+def labels_fingerprint(labels) -> str:
+    """Huella de las etiquetas de DMU (forman parte de los resultados tabulares)."""
+    return data_fingerprint(np.asarray(pd.Series(labels).astype(str).to_numpy(), dtype=str))
+
+
+def get_cached(key: tuple, default=None):
+    """Devuelve una copia del valor guardado con ``key`` o ``default``."""
+    with _LOCK:
+        payload = _MEMORY.get(key)
+        if payload is not None:
+            _MEMORY.move_to_end(key)
+            _STATS["hits"] += 1
+        disk_dir = _CONFIG["disk_dir"]
+    if payload is None and disk_dir:
+        path = _disk_path(disk_dir, key)
+        if os.path.exists(path):
+            try:
+                with open(path, "rb") as fh:
+                    payload = fh.read()
+                value = pickle.loads(payload)
+            except Exception:
+                value = None  # fichero corrupto o incompatible: se trata como fallo
+            if value is not None:
+                with _LOCK:
+                    _STATS["disk_hits"] += 1
+                    _remember(key, payload)
+                return value
+        payload = None
+    if payload is None:
+        with _LOCK:
+            _STATS["misses"] += 1
+        return default
+    return pickle.loads(payload)
+
+
+def store_cached(key: tuple, value) -> None:
+    """Guarda ``value`` (serializable con pickle) en memoria y, si está activo, en disco."""
+    payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    with _LOCK:
+        _remember(key, payload)
+        disk_dir = _CONFIG["disk_dir"]
+    if disk_dir:
+        # Escritura atómica: nunca queda a medias un fichero que otro proceso pueda leer
+        os.makedirs(disk_dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=disk_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(payload)
+        os.replace(tmp, _disk_path(disk_dir, key))
+
+
+def _remember(key: tuple, payload: bytes) -> None:
+    """Inserta en el nivel en memoria (llamar con ``_LOCK`` tomado)."""
+    if _CONFIG["max_entries"] == 0:
+        return
+    _MEMORY[key] = payload
+    _MEMORY.move_to_end(key)
+    _evict()
+
+
+def _evict() -> None:
+    while len(_MEMORY) > _CONFIG["max_entries"]:
+        _MEMORY.popitem(last=False)
+
+
+def _disk_path(disk_dir: str, key: tuple) -> str:
+    digest = hashlib.sha256(repr(key).encode()).hexdigest()
+    return os.path.join(disk_dir, f"{digest}.pkl")
@@ -0,0 +1,200 @@
+# src/dea_models/certificates.py
+
+"""
+Certificados de optimalidad de los PL radiales (CCR/BCC) sin volver a resolver.
+
+Con las lambdas, los duales ``(u, v, w)`` y la puntuación de todas las DMUs
+apilados, la optimalidad de cada PL se comprueba con unos pocos productos
+matriciales:
+
+- factibilidad primal: ``Y·λ >= y0`` y ``X·λ <= theta·x0`` (input) o
+  ``Y·λ >= phi·y0`` y ``X·λ <= x0`` (output), ``λ >= 0`` y, con VRS,
+  ``Σλ = 1``;
+- factibilidad dual: ``u, v >= 0``, normalización ``v·x0 = 1`` (input) o
+  ``u·y0 = 1`` (output) y coste reducido ``v·x_j - u·y_j + w >= 0`` para
+  toda DMU de referencia ``j``;
+- brecha de dualidad: ``theta = u·y0 - w`` (input) o ``phi = v·x0 + w``
+  (output).
+
+Las DMUs que no pasan se marcan y, si se pide, se vuelven a resolver con el
+preset ``"exact"``; solo esas pagan un PL nuevo.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from .data import DEAData, as_dea_data
+from .radial import _build_radial_problem, _set_reference, _solve_radial_problem, _radial_duals
+from .results import DEAResults
+
+
+def verify_radial(
+    X: np.ndarray,
+    Y: np.ndarray,
+    scores: np.ndarray,
+    lambdas,
+    u: np.ndarray,
+    v: np.ndarray,
+    w: np.ndarray | None = None,
+    rts: str = "CRS",
+    orientation: str = "input",
+    tol: float = 1e-6,
+    exclude_self: bool = False,
+    chunk_size: int = 1024,
+) -> pd.DataFrame:
+    """
+    Residuos de optimalidad de ``n`` PL radiales frente a las DMUs ``(X, Y)``.
+
+    ``scores`` son ``theta``/``phi`` sin redondear ``(n,)``; ``lambdas`` es
+    ``(n, n)`` (denso o disperso, fila ``i`` = lambdas de la DMU ``i``);
+    ``u`` ``(n, s)``, ``v`` ``(n, m)`` y ``w`` ``(n,)`` son los duales.
+    ``exclude_self`` (supereficiencia) omite el coste reducido de la propia
+    DMU. Los residuos son relativos a los datos de cada DMU; ``certified``
+    exige que los tres sean ``<= tol``. Filas con ``NaN`` no se certifican.
+    """
+    if orientation not in ("input", "output"):
+        raise ValueError("orientation debe ser 'input' u 'output'.")
+    X, Y = np.asarray(X, dtype=float), np.asarray(Y, dtype=float)
+    n = X.shape[1]
+    scores = np.asarray(scores, dtype=float)
+    u, v = np.asarray(u, dtype=float), np.asarray(v, dtype=float)
+    w = np.zeros(n) if w is None or rts == "CRS" else np.asarray(w, dtype=float)
+    L = sparse.csr_matrix(lambdas)
+
+    # 1) Factibilidad primal (un producto por bloque de variables)
+    achieved_in = np.asarray(L @ X.T)  # (n, m)
+    achieved_out = np.asarray(L @ Y.T)  # (n, s)
+    if orientation == "input":
+        in_res = (achieved_in - scores[:, None] * X.T) / X.T
+        out_res = (Y.T - achieved_out) / Y.T
+    else:
+        in_res = (achieved_in - X.T) / X.T
+        out_res = (scores[:, None] * Y.T - achieved_out) / Y.T
+    primal = np.maximum(np.max(in_res, axis=1), np.max(out_res, axis=1))
+    primal = np.maximum(primal, -L.min(axis=1).toarray().ravel())
+    if rts == "VRS":
+        primal = np.maximum(primal, np.abs(np.asarray(L.sum(axis=1)).ravel() - 1.0))
+    primal = np.maximum(primal, 0.0)
+
+    # 2) Factibilidad dual: signos, normalización y costes reducidos por bloques
+    dual = np.maximum(np.max(-u * Y.T, axis=1), np.max(-v * X.T, axis=1))
+    norm = np.einsum("ik,ki->i", v, X) if orientation == "input" else np.einsum("ir,ri->i", u, Y)
+    dual = np.maximum(dual, np.abs(norm - 1.0))
+    for i0 in range(0, n, chunk_size):
+        rows = slice(i0, min(i0 + chunk_size, n))
+        reduced = v[rows] @ X - u[rows] @ Y + w[rows, None]
+        if exclude_self:
+            reduced[np.arange(rows.stop - rows.start), np.arange(rows.start, rows.stop)] = np.inf
+        dual[rows] = np.maximum(dual[rows], -reduced.min(axis=1))
+    dual = np.maximum(dual, 0.0)
+
+    # 3) Brecha de dualidad
+    if orientation == "input":
+        dual_obj = np.einsum("ir,ri->i", u, Y) - w
+    else:
+        dual_obj = np.einsum("ik,ki->i", v, X) + w
+    gap = np.abs(scores - dual_obj) / (1.0 + np.abs(scores))
+
+    with np.errstate(invalid="ignore"):
+        certified = (primal <= tol) & (dual <= tol) & (gap <= tol)
+    return pd.DataFrame({
+        "primal_residual": primal,
+        "dual_residual": dual,
+        "duality_gap": gap,
+        "certified": certified,
+    })
+
+
+def certify_results(
+    df: pd.DataFrame | DEAData,
+    results: DEAResults,
+    dmu_column: str | None = None,
+    input_cols: list[str] | None = None,
+    output_cols: list[str] | None = None,
+    rts: str | None = None,
+    orientation: str | None = None,
+    tol: float = 1e-6,
+    resolve: bool = True,
+) -> pd.DataFrame:
+    """
+    Verifica un :class:`DEAResults` de ``run_ccr``/``run_bcc``
+    (``compact=True``) frente a sus datos. ``rts`` se deduce de la columna de
+    eficiencia y ``orientation`` del resultado (``run_ccr`` no la guarda: por
+    defecto ``"input"``).
+
+    Devuelve una fila por DMU con los residuos y ``certified``. Con
+    ``resolve`` las DMUs no certificadas se resuelven de nuevo con el preset
+    ``"exact"`` y se verifican otra vez: ``resolved_score`` (``theta`` o
+    ``phi``) y ``certified_after``. Las DMUs sin solución (``NaN``) no se
+    certifican ni se re-resuelven. ``df.attrs["certification"]`` resume los
+    recuentos.
+    """
+    if not isinstance(results, DEAResults):
+        raise ValueError("certify_results necesita un DEAResults (run_ccr/run_bcc con compact=True).")
+    if results.certificate is None:
+        raise ValueError("El resultado no incluye duales; vuelve a ejecutar el modelo.")
+    data = as_dea_data(df, dmu_column, input_cols, output_cols)
+    if list(map(str, results.dmus)) != list(data.dmus):
+        raise ValueError("Las DMUs del resultado no coinciden con las de los datos.")
+    frame = results.frame
+    if rts is None:
+        rts = "CRS" if results.efficiency_column == "tec_efficiency_ccr" else "VRS"
+    if orientation is None:
+        orientation = str(frame["orientation"].iloc[0]) if "orientation" in frame.columns and len(frame) else "input"
+
+    cert = results.certificate
+    X, Y = data.X, data.Y
+    report = verify_radial(
+        X, Y, cert["score"], results.peers, cert["u"], cert["v"], cert["w"],
+        rts=rts, orientation=orientation, tol=tol, exclude_self=results.super_eff,
+    )
+    report.insert(0, data.dmu_column, data.dmus)
+
+    # Sin solución (p. ej. supereficiencia BCC infactible): nada que certificar ni re-resolver
+    unsolved = np.isnan(cert["score"])
+    failed = np.flatnonzero(~report["certified"].to_numpy() & ~unsolved)
+    report["resolved_score"] = np.nan
+    report["certified_after"] = report["certified"]
+    if resolve and len(failed):
+        score, lambdas, U, V, W = _resolve(X, Y, failed, rts, orientation, results.super_eff)
+        again = verify_radial(
+            X, Y, score, lambdas, U, V, W,
+            rts=rts, orientation=orientation, tol=tol, exclude_self=results.super_eff,
+        )
+        report.loc[failed, "resolved_score"] = score[failed]
+        report.loc[failed, "certified_after"] = again["certified"].to_numpy()[failed]
+
+    report.attrs["certification"] = {
+        "n_checked": int((~unsolved).sum()),
+        "n_unsolved": int(unsolved.sum()),
+        "n_failed": int(len(failed)),
+        "n_resolved": int(len(failed)) if resolve else 0,
+        "n_certified_after": int(report["certified_after"].sum()),
+        "tol": tol,
+    }
+    return report
+
+
+def _resolve(X, Y, rows, rts, orientation, super_eff):
+    """Vuelve a resolver las DMUs ``rows`` (preset ``"exact"``) con lambdas y duales apilados ``(n, ·)``."""
+    m, n = X.shape
+    s = Y.shape[0]
+    score = np.full(n, np.nan)
+    U, V, W = np.full((n, s), np.nan), np.full((n, m), np.nan), np.full(n, np.nan)
+    lambdas = sparse.lil_matrix((n, n))
+    compiled = {}
+    for i in rows:
+        keep = np.arange(n) != i if super_eff and n > 1 else np.ones(n, dtype=bool)
+        size = int(keep.sum())
+        if size not in compiled:
+            compiled[size] = _build_radial_problem(size, m, s, rts=rts, orientation=orientation)
+        problem = compiled[size]
+        _set_reference(problem, X[:, keep], Y[:, keep])
+        score[i] = _solve_radial_problem(problem, X[:, [i]], Y[:, [i]], solver_preset="exact")
+        duals = _radial_duals(problem, rts)
+        if np.isnan(score[i]) or duals is None or problem["lambdas"].value is None:
+            continue
+        U[i], V[i], W[i] = duals
+        lambdas[i, np.flatnonzero(keep)] = np.ravel(problem["lambdas"].value)
+    return score, lambdas.tocsr(), U, V, W
@@ -10,6 +10,30 @@ DEFAULT_TOLERANCE = 1e-6
 # Máximo número de iteraciones para solvers (por si luego quieres exponerlo como parámetro)
 DEFAULT_MAX_ITER = 10000
 
+# Presets de solver (ECOS). "fast" y "balanced" vuelven a resolver con
+# "refine_preset" los PL que fallan, acaban OPTIMAL_INACCURATE o cuya
+# puntuación queda a menos de "refine_band" de 1 (la clasificación eficiente /
+# ineficiente se decide con la tolerancia estricta). En "balanced" la banda es
+# estrecha: solo las DMUs en la frontera o pegadas a ella pagan un segundo PL.
+SOLVER_PRESETS = {
+    "fast": {"abstol": 1e-4, "reltol": 1e-4, "feastol": DEFAULT_TOLERANCE, "max_iters": DEFAULT_MAX_ITER,
+             "refine_band": 1e-3, "refine_preset": "exact"},
+    "balanced": {"abstol": 1e-7, "reltol": 1e-7, "feastol": 1e-7, "max_iters": DEFAULT_MAX_ITER,
+                 "refine_band": 1e-5, "refine_preset": "exact"},
+    "exact": {"abstol": 1e-9, "reltol": 1e-9, "feastol": 1e-9, "max_iters": DEFAULT_MAX_ITER},
+}
+
+# Preset usado cuando una función no recibe uno explícito
+DEFAULT_SOLVER_PRESET = "balanced"
+
+# Margen del cribado de candidatos a frontera (frontier.candidate_mask): solo
+# se descartan DMUs con theta < 1 - margen, muy por encima del error del preset
+# "exact", para no perder nunca un punto extremo por precisión del solver
+SCREEN_TOLERANCE = 1e-4
+
+# A partir de este número de DMUs _dea_core usa generación de columnas
+COLUMN_GENERATION_MIN_DMUS = 50000
+
 # Otros parámetros globales que empleen varios modelos 
 EPS = 1e-9
 BIG_M = 1e6
@@ -4,6 +4,7 @@ import pandas as pd
 import cvxpy as cp
 
 from .utils import validate_positive_dataframe
+from .solver import solve_lp
 
 def _solve_ccr_dual(X: np.ndarray, Y: np.ndarray, dmu_index: int):
     """
@@ -28,7 +29,7 @@ def _solve_ccr_dual(X: np.ndarray, Y: np.ndarray, dmu_index: int):
     obj = cp.Maximize(u.T @ y_k)
     
     prob = cp.Problem(obj, cons)
-    prob.solve(solver=cp.ECOS, abstol=1e-8)
+    solve_lp(prob, score=lambda: obj.value)
     
     if prob.status in [cp.OPTIMAL, cp.OPTIMAL_INACCURATE] and u.value is not None and v.value is not None:
         return u.value, v.value
@@ -0,0 +1,211 @@
+# src/dea_models/data.py
+
+"""
+Contenedor DEAData: datos de una especificación DEA validados una sola vez.
+
+Se construye a partir de un DataFrame; guarda X ``(m, n)`` e Y ``(s, n)``
+como arrays float64 contiguos de solo lectura, los identificadores de DMU
+codificados como enteros y el informe de validación. Todos los modelos
+aceptan un ``DEAData`` en lugar del DataFrame y, en ese caso, no vuelven a
+validar ni a copiar los datos.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .utils import data_fingerprint, _scan_columns
+
+
+class DEAData:
+    """
+    Datos DEA inmutables.
+
+    Atributos
+    ---------
+    X, Y : np.ndarray
+        Inputs ``(m, n)`` y outputs ``(s, n)`` en float64, solo lectura.
+    input_cols, output_cols : tuple[str, ...]
+        Nombres de las filas de ``X`` e ``Y``.
+    dmu_column : str
+        Nombre de la columna de DMU (se usa en los resultados).
+    dmu_codes : np.ndarray
+        Código entero de cada fila en ``dmu_labels``.
+    dmu_labels : np.ndarray
+        Etiquetas únicas (texto) de DMU.
+    periods : np.ndarray | None
+        Valor de ``period_column`` por fila, si se indicó.
+    report : dict
+        Informe de validación (ver :func:`dea_models.utils.validation_report`).
+    """
+
+    __slots__ = (
+        "X", "Y", "input_cols", "output_cols", "dmu_column", "dmu_codes",
+        "dmu_labels", "period_column", "periods", "report", "_fingerprint",
+    )
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        dmu_column: str | None,
+        input_cols: list[str],
+        output_cols: list[str],
+        period_column: str | None = None,
+        allow_zero: bool = False,
+        allow_negative: bool = False,
+        strict: bool = True,
+    ):
+        """
+        Valida ``input_cols`` + ``output_cols`` en una sola pasada y construye
+        el contenedor. Con ``strict=True`` (por defecto) lanza ``ValueError``
+        con el primer problema encontrado, igual que ``validate_dataframe``;
+        con ``strict=False`` los problemas solo quedan en ``report``.
+        """
+        if dmu_column is not None and dmu_column not in df.columns:
+            raise ValueError(f"La columna DMU '{dmu_column}' no existe en el DataFrame.")
+        if period_column is not None and period_column not in df.columns:
+            raise ValueError(f"La columna de periodo '{period_column}' no existe.")
+
+        block, report = _scan_columns(df, list(input_cols), list(output_cols), allow_zero, allow_negative)
+        if strict and report["issues"]:
+            raise ValueError(report["issues"][0])
+        block.flags.writeable = False  # X e Y son vistas de solo lectura del bloque
+
+        labels = df[dmu_column] if dmu_column is not None else df.index.to_series()
+        codes, uniques = pd.factorize(labels.astype(str), sort=False)
+        m = len(input_cols)
+        self._init(
+            X=block[:m], Y=block[m:],
+            input_cols=input_cols, output_cols=output_cols,
+            dmu_column=dmu_column if dmu_column is not None else "DMU",
+            dmu_codes=codes, dmu_labels=np.asarray(uniques, dtype=str),
+            period_column=period_column,
+            periods=df[period_column].to_numpy() if period_column is not None else None,
+            report=report,
+        )
+
+    @classmethod
+    def _from_arrays(cls, X, Y, input_cols, output_cols, dmu_column, dmu_codes, dmu_labels,
+                     period_column=None, periods=None, report=None) -> "DEAData":
+        """Construye sin validar, a partir de arrays ya validados (uso interno)."""
+        obj = cls.__new__(cls)
+        obj._init(X, Y, input_cols, output_cols, dmu_column, dmu_codes, dmu_labels,
+                  period_column, periods, report)
+        return obj
+
+    def _init(self, X, Y, input_cols, output_cols, dmu_column, dmu_codes, dmu_labels,
+              period_column, periods, report):
+        values = {
+            "X": _read_only(X),
+            "Y": _read_only(Y),
+            "input_cols": tuple(input_cols),
+            "output_cols": tuple(output_cols),
+            "dmu_column": dmu_column,
+            "dmu_codes": _read_only(np.asarray(dmu_codes, dtype=np.int64)),
+            "dmu_labels": _read_only(np.asarray(dmu_labels, dtype=str)),
+            "period_column": period_column,
+            "periods": _read_only(periods) if periods is not None else None,
+            "report": report if report is not None else {"valid": True, "issues": [], "columns": {}},
+            "_fingerprint": None,
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DEAData es inmutable; usa select() o take() para derivar otro contenedor.")
+
+    def __len__(self) -> int:
+        return self.X.shape[1]
+
+    def __repr__(self) -> str:
+        return (f"DEAData(n={len(self)}, inputs={list(self.input_cols)}, "
+                f"outputs={list(self.output_cols)}, dmu_column={self.dmu_column!r})")
+
+    @property
+    def dmus(self) -> list[str]:
+        """Etiqueta de DMU de cada fila (texto), en el orden original."""
+        return self.dmu_labels[self.dmu_codes].tolist()
+
+    @property
+    def fingerprint(self) -> str:
+        """Huella SHA-256 de X, Y y los identificadores (se calcula una vez)."""
+        if self._fingerprint is None:
+            object.__setattr__(self, "_fingerprint", data_fingerprint(self.X, self.Y, self.dmu_labels[self.dmu_codes]))
+        return self._fingerprint
+
+    def select(self, input_cols: list[str] | None = None, output_cols: list[str] | None = None) -> "DEAData":
+        """
+        Subconjunto de variables sin revalidar (solo se copian las filas
+        elegidas de X/Y).
+        """
+        input_cols = list(self.input_cols if input_cols is None else input_cols)
+        output_cols = list(self.output_cols if output_cols is None else output_cols)
+        missing = (set(input_cols) - set(self.input_cols)) | (set(output_cols) - set(self.output_cols))
+        if missing:
+            raise ValueError(f"Faltan columnas: {missing}")
+        X = self.X[[self.input_cols.index(c) for c in input_cols]]
+        Y = self.Y[[self.output_cols.index(c) for c in output_cols]]
+        return DEAData._from_arrays(
+            X, Y, input_cols, output_cols, self.dmu_column, self.dmu_codes, self.dmu_labels,
+            self.period_column, self.periods, self.report,
+        )
+
+    def take(self, rows, dmu_labels: list[str] | None = None) -> "DEAData":
+        """
+        Subconjunto de DMUs (máscara booleana o índices) sin revalidar.
+        ``dmu_labels`` permite renombrar las DMUs resultantes (p. ej. ventanas).
+        """
+        rows = np.asarray(rows)
+        X, Y = self.X[:, rows], self.Y[:, rows]
+        if dmu_labels is None:
+            codes, uniques = pd.factorize(self.dmu_labels[self.dmu_codes[rows]], sort=False)
+        else:
+            codes, uniques = pd.factorize(pd.Series(dmu_labels).astype(str), sort=False)
+        periods = self.periods[rows] if self.periods is not None else None
+        return DEAData._from_arrays(
+            X, Y, self.input_cols, self.output_cols, self.dmu_column, codes, uniques,
+            self.period_column, periods, self.report,
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame con la columna de DMU, (periodo) e inputs/outputs."""
+        data = {self.dmu_column: self.dmus}
+        if self.periods is not None:
+            data[self.period_column] = self.periods
+        data.update({c: self.X[k] for k, c in enumerate(self.input_cols)})
+        data.update({c: self.Y[r] for r, c in enumerate(self.output_cols)})
+        return pd.DataFrame(data)
+
+
+def as_dea_data(
+    df,
+    dmu_column: str | None,
+    input_cols: list[str] | None,
+    output_cols: list[str] | None,
+    period_column: str | None = None,
+    allow_zero: bool = False,
+    allow_negative: bool = False,
+) -> DEAData:
+    """
+    Punto de entrada común de los modelos: devuelve ``df`` si ya es un
+    ``DEAData`` (limitado a las columnas pedidas, sin revalidar) o lo construye
+    validando el DataFrame una sola vez.
+    """
+    if isinstance(df, DEAData):
+        if period_column is not None and df.period_column != period_column:
+            raise ValueError(f"La columna de periodo '{period_column}' no existe.")
+        if (input_cols is None or list(input_cols) == list(df.input_cols)) and \
+                (output_cols is None or list(output_cols) == list(df.output_cols)):
+            return df
+        return df.select(input_cols, output_cols)
+    return DEAData(
+        df, dmu_column, input_cols, output_cols,
+        period_column=period_column, allow_zero=allow_zero, allow_negative=allow_negative,
+    )
+
+
+def _read_only(arr: np.ndarray) -> np.ndarray:
+    arr = np.ascontiguousarray(arr)
+    if arr.flags.writeable and arr.base is not None:
+        arr = arr.copy()  # no bloquear la escritura de un array ajeno
+    arr.flags.writeable = False
+    return arr
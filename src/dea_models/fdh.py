@@ -0,0 +1,136 @@
+# src/dea_models/fdh.py
+
+"""
+Modelo FDH (Free Disposal Hull) sin programación lineal.
+
+La tecnología FDH solo admite libre disponibilidad, no combinaciones
+convexas, así que cada DMU se compara con DMUs observadas de una en una:
+
+- orientación input:  ``theta_i = min_{j: y_j >= y_i} max_k x_jk / x_ik``
+- orientación output: ``phi_i   = max_{j: x_j <= x_i} min_r y_jr / y_ir``
+
+Solo las DMUs no dominadas pueden ser la referencia óptima (una dominada
+nunca mejora a su dominadora), así que el cálculo es ``n × k`` con ``k`` el
+tamaño del *skyline*, recorrido por bloques para acotar la memoria.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .data import DEAData, as_dea_data
+from .dominance import dominance_index
+from .cache import spec_key, frame_block, labels_fingerprint, get_cached, store_cached
+from .results import DEAResults, build_results
+
+
+def run_fdh(
+    df: pd.DataFrame | DEAData,
+    dmu_column: str | None = None,
+    input_cols: list[str] | None = None,
+    output_cols: list[str] | None = None,
+    orientation: str = "input",
+    compact: bool = False,
+    chunk_size: int = 2048,
+) -> pd.DataFrame | DEAResults:
+    """
+    Eficiencia FDH con el mismo esquema de resultados que :func:`run_ccr`
+    (columna ``efficiency_fdh`` en ``(0, 1]``; en orientación output se
+    reporta ``1/phi``). La única DMU de referencia de cada unidad aparece con
+    lambda 1. ``compact`` como en ``run_ccr``.
+    """
+    if orientation not in ("input", "output"):
+        raise ValueError("orientation debe ser 'input' u 'output'.")
+    data = as_dea_data(df, dmu_column, input_cols, output_cols)
+    dmu_column, input_cols, output_cols = data.dmu_column, list(data.input_cols), list(data.output_cols)
+    dmus = data.dmus
+
+    key = spec_key(
+        frame_block(data, input_cols, output_cols), input_cols, output_cols, "FDH", orientation, "FDH",
+        extra=("run_fdh", dmu_column, labels_fingerprint(dmus), tuple(input_cols), tuple(output_cols)),
+    )
+    cached = get_cached(key)
+    if isinstance(cached, DEAResults):
+        return cached if compact else cached.to_legacy()
+
+    X, Y = data.X, data.Y
+    n = X.shape[1]
+    reference = dominance_index(X, Y, count_dominators=False)["non_dominated"]
+    score, peer = _fdh_scores(X, Y, X[:, reference], Y[:, reference], orientation, chunk_size)
+    peer = reference[peer]
+
+    X_t, Y_t = X[:, peer].T, Y[:, peer].T
+    if orientation == "input":
+        slacks_in = score[:, None] * X.T - X_t
+        slacks_out = Y_t - Y.T
+        efficiency = score
+    else:
+        slacks_in = X.T - X_t
+        slacks_out = Y_t - score[:, None] * Y.T
+        efficiency = 1.0 / score
+    slacks_in[slacks_in < 1e-9] = 0
+    slacks_out[slacks_out < 1e-9] = 0
+
+    res = build_results(
+        dmus, dmu_column, input_cols, output_cols,
+        {"efficiency_fdh": np.round(efficiency, 6), "model": "FDH", "orientation": orientation},
+        slacks_in, slacks_out, X_t, Y_t,
+        [([j], [1.0]) for j in peer.tolist()],
+        efficiency_column="efficiency_fdh",
+        legacy_columns=[dmu_column, "efficiency_fdh", "model", "orientation", "lambda_vector", "slacks_inputs", "slacks_outputs"],
+    )
+    store_cached(key, res)
+    return res if compact else res.to_legacy()
+
+
+def _fdh_scores(
+    X: np.ndarray,
+    Y: np.ndarray,
+    X_ref: np.ndarray,
+    Y_ref: np.ndarray,
+    orientation: str = "input",
+    chunk_size: int = 2048,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    ``(score, peer)`` de cada columna de ``(X, Y)`` frente a ``(X_ref, Y_ref)``;
+    ``peer`` indexa las columnas de la referencia. ``theta`` (input) o ``phi``
+    (output); ``NaN`` y peer 0 si ninguna referencia es admisible.
+    """
+    n, k = X.shape[1], X_ref.shape[1]
+    maximize = orientation == "output"
+    best = np.full(n, -np.inf if maximize else np.inf)
+    peer = np.zeros(n, dtype=np.int64)
+
+    # Lo que se compara (cocientes) y lo que filtra (admisibilidad)
+    ratio_num, ratio_den = (Y_ref, Y) if maximize else (X_ref, X)
+    feas_ref, feas_own = (X_ref, X) if maximize else (Y_ref, Y)
+
+    for i0 in range(0, n, chunk_size):
+        rows = slice(i0, min(i0 + chunk_size, n))
+        for j0 in range(0, k, chunk_size):
+            cols = slice(j0, min(j0 + chunk_size, k))
+            nr, nc = rows.stop - rows.start, cols.stop - cols.start
+            # Dimensión a dimensión: sin temporales (filas × referencias × variables)
+            admissible = np.ones((nr, nc), dtype=bool)
+            for r in range(feas_ref.shape[0]):
+                own, ref = feas_own[r, rows][:, None], feas_ref[r, cols][None, :]
+                admissible &= (ref <= own) if maximize else (ref >= own)
+            value = np.full((nr, nc), np.inf if maximize else -np.inf)
+            for q in range(ratio_num.shape[0]):
+                ratio = ratio_num[q, cols][None, :] / ratio_den[q, rows][:, None]
+                value = np.minimum(value, ratio) if maximize else np.maximum(value, ratio)
+
+            if maximize:
+                value[~admissible] = -np.inf
+                arg = value.argmax(axis=1)
+                chunk_best = value[np.arange(nr), arg]
+                better = chunk_best > best[rows]
+            else:
+                value[~admissible] = np.inf
+                arg = value.argmin(axis=1)
+                chunk_best = value[np.arange(nr), arg]
+                better = chunk_best < best[rows]
+            best[rows] = np.where(better, chunk_best, best[rows])
+            peer[rows] = np.where(better, arg + j0, peer[rows])
+
+    best[~np.isfinite(best)] = np.nan
+    return best, peer
@@ -0,0 +1,216 @@
+# src/dea_models/frontier.py
+
+"""
+Frontera DEA reutilizable para puntuar DMUs nuevas sin recalcular el resto.
+
+Un :class:`Frontier` guarda solo el conjunto de referencia eficiente de una
+ejecución de ``run_ccr``/``run_bcc`` (las DMUs con eficiencia 1 y holguras
+nulas, que incluyen todos los puntos extremos de la tecnología), junto con
+los rendimientos a escala y la orientación. La tecnología que generan es la
+misma que la de todas las DMUs, así que una observación nueva obtiene la
+puntuación que tendría frente a la muestra original.
+
+``score`` evalúa un lote de observaciones de una vez: con ``m + s <= 3`` por
+disparo de rayos contra la envolvente convexa; en otro caso con un único PL
+parametrizado (DPP) que se compila una vez y se reutiliza. La frontera se
+guarda en un ``.npz`` (sin pickle) con :meth:`Frontier.save`.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from .data import DEAData, as_dea_data
+from .constants import SCREEN_TOLERANCE
+from .dominance import dominance_index
+from .hull import hull_efficiencies
+from .radial import _build_radial_problem, _set_reference, _solve_radial_problem, _dea_core
+from .results import DEAResults, SLACK_IN, SLACK_OUT
+from .utils import data_fingerprint
+
+_FORMAT_VERSION = 1
+
+
+def candidate_mask(
+    X: np.ndarray,
+    Y: np.ndarray,
+    rts: str = "CRS",
+    screen: bool = True,
+    tol: float = SCREEN_TOLERANCE,
+) -> np.ndarray:
+    """
+    Máscara de las DMUs que pueden generar la tecnología: las no dominadas y,
+    con ``screen``, además no claramente interiores (``theta >= 1 - tol``
+    frente a las propias no dominadas). Las DMUs descartadas quedan dentro de
+    la tecnología de las restantes, así que esta no cambia.
+
+    El cribado resuelve con el preset ``"exact"`` y ``tol`` debe quedar muy
+    por encima de su error: una DMU interior de más no cambia la tecnología,
+    pero un punto extremo descartado por precisión del solver sí (como en
+    :meth:`Frontier.from_results`). Las puntuaciones ``NaN`` se conservan.
+    """
+    keep = ~dominance_index(X, Y, count_dominators=False)["dominated"]
+    if screen and keep.sum() > 1:
+        idx = np.flatnonzero(keep)
+        theta = _dea_core(X[:, idx], Y[:, idx], rts=rts, orientation="input", solver_preset="exact")
+        keep[idx[theta < 1 - tol]] = False
+    return keep
+
+
+class Frontier:
+    """
+    Conjunto de referencia eficiente con sus supuestos.
+
+    Atributos
+    ---------
+    X_ref, Y_ref : np.ndarray
+        Inputs ``(m, k)`` y outputs ``(s, k)`` de las DMUs de referencia.
+    reference_dmus : list[str]
+    input_cols, output_cols : list[str]
+    rts : str
+        ``"CRS"`` o ``"VRS"``.
+    orientation : str
+        ``"input"`` u ``"output"``.
+    """
+
+    def __init__(self, X_ref, Y_ref, reference_dmus, input_cols, output_cols, rts="CRS", orientation="input"):
+        if rts not in ("CRS", "VRS"):
+            raise ValueError("rts debe ser 'CRS' o 'VRS'.")
+        if orientation not in ("input", "output"):
+            raise ValueError("orientation debe ser 'input' u 'output'.")
+        self.X_ref = np.ascontiguousarray(X_ref, dtype=float)
+        self.Y_ref = np.ascontiguousarray(Y_ref, dtype=float)
+        self.reference_dmus = [str(d) for d in reference_dmus]
+        self.input_cols = list(input_cols)
+        self.output_cols = list(output_cols)
+        self.rts = rts
+        self.orientation = orientation
+        self._compiled = None
+
+    def __repr__(self) -> str:
+        return (f"Frontier(n_ref={len(self.reference_dmus)}, rts={self.rts!r}, "
+                f"orientation={self.orientation!r}, inputs={self.input_cols}, outputs={self.output_cols})")
+
+    @property
+    def fingerprint(self) -> str:
+        return data_fingerprint(self.X_ref, self.Y_ref, np.asarray(self.reference_dmus, dtype=str))
+
+    @classmethod
+    def from_results(
+        cls,
+        df: pd.DataFrame | DEAData,
+        results: pd.DataFrame | DEAResults,
+        dmu_column: str | None = None,
+        input_cols: list[str] | None = None,
+        output_cols: list[str] | None = None,
+        rts: str | None = None,
+        orientation: str | None = None,
+        tol: float = 1e-4,
+    ) -> "Frontier":
+        """
+        Construye la frontera a partir de los datos y del resultado de
+        ``run_ccr``/``run_bcc`` (tabla clásica o :class:`DEAResults`).
+        ``rts`` y ``orientation`` se deducen del resultado si no se indican
+        (``run_ccr`` no guarda la orientación: por defecto ``"input"``).
+
+        ``tol`` (sobre la eficiencia y las holguras relativas) es holgado a
+        propósito: una DMU de más en la referencia no cambia la tecnología,
+        pero una DMU extrema perdida por la precisión del solver sí.
+        """
+        data = as_dea_data(df, dmu_column, input_cols, output_cols)
+        if isinstance(results, DEAResults):
+            frame, eff_col = results.frame, results.efficiency_column
+            s_in = frame[[SLACK_IN + c for c in results.input_cols]].to_numpy(dtype=float)
+            s_out = frame[[SLACK_OUT + c for c in results.output_cols]].to_numpy(dtype=float)
+        else:
+            frame = results
+            eff_col = "tec_efficiency_ccr" if "tec_efficiency_ccr" in frame.columns else "efficiency"
+            s_in = np.array([list(d.values()) for d in frame["slacks_inputs"]], dtype=float).reshape(len(frame), -1)
+            s_out = np.array([list(d.values()) for d in frame["slacks_outputs"]], dtype=float).reshape(len(frame), -1)
+        if rts is None:
+            rts = "CRS" if eff_col == "tec_efficiency_ccr" else "VRS"
+        if orientation is None:
+            orientation = str(frame["orientation"].iloc[0]) if "orientation" in frame.columns and len(frame) else "input"
+
+        if data.dmu_column not in frame.columns:
+            raise ValueError(f"El resultado no contiene la columna DMU '{data.dmu_column}'.")
+        eff = frame[eff_col].to_numpy(dtype=float)
+        # Holguras relativas al valor observado de cada DMU del resultado
+        position = {d: k for k, d in enumerate(data.dmus)}
+        idx = np.array([position.get(str(d), -1) for d in frame[data.dmu_column]])
+        observed = np.hstack([data.X.T, data.Y.T])[np.maximum(idx, 0)]
+        relative = np.nan_to_num(np.hstack([s_in, s_out]), nan=np.inf) / observed
+        efficient = (idx >= 0) & (eff >= 1 - tol) & (relative <= tol).all(axis=1)
+        # Posición de cada DMU eficiente en los datos (por etiqueta)
+        efficient_labels = set(frame.loc[efficient, data.dmu_column].astype(str))
+        rows = np.array([d in efficient_labels for d in data.dmus], dtype=bool)
+        if not rows.any():
+            raise ValueError("El resultado no contiene DMUs eficientes con holguras nulas.")
+        return cls(
+            data.X[:, rows], data.Y[:, rows], [d for d, r in zip(data.dmus, rows) if r],
+            data.input_cols, data.output_cols, rts=rts, orientation=orientation,
+        )
+
+    def score(self, X_new, Y_new=None) -> np.ndarray:
+        """
+        Eficiencia de cada observación nueva frente a la frontera, en la
+        escala de ``run_ccr``/``run_bcc`` (``theta``, o ``1/phi`` en
+        orientación output). Acepta ``X_new (m, k)`` e ``Y_new (s, k)`` o un
+        DataFrame con las columnas de la frontera. Valores > 1 indican que la
+        observación está fuera de la frontera; ``NaN``, que el PL es infactible
+        (p. ej. outputs por encima de todas las DMUs con VRS en orientación input).
+        """
+        if isinstance(X_new, pd.DataFrame):
+            X_new, Y_new = X_new[self.input_cols].to_numpy(dtype=float).T, X_new[self.output_cols].to_numpy(dtype=float).T
+        X_new = np.atleast_2d(np.asarray(X_new, dtype=float))
+        Y_new = np.atleast_2d(np.asarray(Y_new, dtype=float))
+        if X_new.shape[0] != len(self.input_cols) or Y_new.shape[0] != len(self.output_cols):
+            raise ValueError("X_new/Y_new deben tener una fila por input/output de la frontera.")
+
+        raw = hull_efficiencies(self.X_ref, self.Y_ref, self.rts, self.orientation, X_new, Y_new)
+        if raw is None:
+            if self._compiled is None:
+                self._compiled = _build_radial_problem(
+                    self.X_ref.shape[1], self.X_ref.shape[0], self.Y_ref.shape[0],
+                    rts=self.rts, orientation=self.orientation,
+                )
+                _set_reference(self._compiled, self.X_ref, self.Y_ref)
+            raw = np.array([
+                _solve_radial_problem(self._compiled, X_new[:, [j]], Y_new[:, [j]])
+                for j in range(X_new.shape[1])
+            ])
+        return raw if self.orientation == "input" else 1.0 / raw
+
+    def score_frame(self, df: pd.DataFrame, dmu_column: str | None = None) -> pd.DataFrame:
+        """Como :meth:`score`, devolviendo un DataFrame con la columna ``efficiency``."""
+        eff = self.score(df)
+        out = pd.DataFrame({"efficiency": np.round(eff, 6)}, index=df.index)
+        if dmu_column is not None:
+            out.insert(0, dmu_column, df[dmu_column].to_numpy())
+        return out
+
+    def save(self, path: str) -> None:
+        """Guarda la frontera en ``path`` (formato ``.npz``, sin pickle)."""
+        meta = {
+            "version": _FORMAT_VERSION,
+            "reference_dmus": self.reference_dmus,
+            "input_cols": self.input_cols,
+            "output_cols": self.output_cols,
+            "rts": self.rts,
+            "orientation": self.orientation,
+        }
+        with open(path, "wb") as fh:
+            np.savez(fh, X_ref=self.X_ref, Y_ref=self.Y_ref, meta=np.array(json.dumps(meta)))
+
+    @classmethod
+    def load(cls, path: str) -> "Frontier":
+        """Carga una frontera guardada con :meth:`save`."""
+        with np.load(path, allow_pickle=False) as payload:
+            meta = json.loads(str(payload["meta"]))
+            if meta.get("version") != _FORMAT_VERSION:
+                raise ValueError(f"Versión de frontera no soportada: {meta.get('version')}")
+            return cls(
+                payload["X_ref"], payload["Y_ref"], meta["reference_dmus"],
+                meta["input_cols"], meta["output_cols"], rts=meta["rts"], orientation=meta["orientation"],
+            )
@@ -0,0 +1,196 @@
+# src/dea_models/hull.py
+
+"""
+Eficiencias radiales exactas sin PL para problemas de baja dimensión.
+
+Con ``m + s <= 3`` la tecnología DEA es un poliedro de pocas dimensiones cuyas
+caras se obtienen con una envolvente convexa:
+
+- CRS: basta la sección normalizada (inputs por unidad de output si ``s == 1``,
+  outputs por unidad de input si ``m == 1``), que es de dimensión 1 o 2.
+- VRS: la envolvente en el espacio ``(x, y)``, de dimensión 2 o 3.
+
+La libre disponibilidad se incorpora añadiendo a cada DMU no dominada sus
+copias con coordenadas llevadas a los límites de una caja (inputs al doble del
+máximo, outputs a 0); las caras de la caja se descartan por el signo de su
+normal y quedan exactamente las caras de la tecnología ``A·z <= b``.
+
+La puntuación de cada DMU es un disparo de rayo contra esas caras: para la
+orientación input se busca el menor ``t`` con ``(t·x0, y0)`` dentro de la
+tecnología, lo que son unas pocas operaciones matriciales ``(n, caras)`` para
+todas las DMUs a la vez.
+
+En 2D la envolvente se calcula con la cadena monótona de Andrew; en 3D se usa
+``scipy.spatial.ConvexHull`` (qhull) si está disponible. Si no lo está, o si
+qhull falla, :func:`hull_efficiencies` devuelve ``None`` y el llamador
+resuelve los PL.
+"""
+
+import itertools
+
+import numpy as np
+
+from .dominance import dominance_index
+
+try:
+    from scipy.spatial import ConvexHull
+except ImportError:  # scipy es opcional: sin él solo hay vía rápida en 2D
+    ConvexHull = None
+
+_NORMAL_TOL = 1e-8
+
+
+def hull_efficiencies(
+    X: np.ndarray,
+    Y: np.ndarray,
+    rts: str = "CRS",
+    orientation: str = "input",
+    X_eval: np.ndarray | None = None,
+    Y_eval: np.ndarray | None = None,
+    chunk_size: int = 4096,
+) -> np.ndarray | None:
+    """
+    Puntuaciones radiales de ``(X_eval, Y_eval)`` (por defecto las propias
+    DMUs) frente a la tecnología de ``X`` ``(m, n)`` e ``Y`` ``(s, n)``.
+
+    Devuelve lo mismo que ``_dea_core``: ``theta`` en orientación input y
+    ``phi`` en orientación output (``NaN`` si el PL sería infactible), o
+    ``None`` si el caso no admite la vía rápida (``m + s > 3``, datos no
+    estrictamente positivos, 3D sin scipy o envolvente degenerada).
+    """
+    X = np.asarray(X, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    X_eval = X if X_eval is None else np.asarray(X_eval, dtype=float)
+    Y_eval = Y if Y_eval is None else np.asarray(Y_eval, dtype=float)
+    m, n = X.shape
+    s = Y.shape[0]
+    if m + s > 3 or m == 0 or s == 0 or n == 0:
+        return None
+    if not (np.all(X > 0) and np.all(Y > 0) and np.all(X_eval > 0) and np.all(Y_eval > 0)):
+        return None
+
+    if rts == "CRS":
+        if m == 1 and s == 1:
+            theta = (Y_eval[0] / X_eval[0]) / np.max(Y[0] / X[0])
+        elif s == 1:
+            # Sección y = 1: inputs por unidad de output, disponibles hacia arriba
+            facets = _technology_facets((X / Y).T, np.array([True, True]))
+            if facets is None:
+                return None
+            P = (X_eval / Y_eval).T
+            theta = _ray_scores(*facets, np.zeros_like(P), P, maximize=False, chunk_size=chunk_size)
+        else:
+            # Sección x = 1: outputs por unidad de input, disponibles hacia abajo
+            facets = _technology_facets((Y / X).T, np.array([False, False]))
+            if facets is None:
+                return None
+            P = (Y_eval / X_eval).T
+            theta = 1.0 / _ray_scores(*facets, np.zeros_like(P), P, maximize=True, chunk_size=chunk_size)
+        return theta if orientation == "input" else 1.0 / theta
+
+    facets = _technology_facets(np.vstack([X, Y]).T, np.array([True] * m + [False] * s))
+    if facets is None:
+        return None
+    zeros_x, zeros_y = np.zeros_like(X_eval.T), np.zeros_like(Y_eval.T)
+    if orientation == "input":
+        base, direction = np.hstack([zeros_x, Y_eval.T]), np.hstack([X_eval.T, zeros_y])
+        return _ray_scores(*facets, base, direction, maximize=False, chunk_size=chunk_size)
+    base, direction = np.hstack([X_eval.T, zeros_y]), np.hstack([zeros_x, Y_eval.T])
+    return _ray_scores(*facets, base, direction, maximize=True, chunk_size=chunk_size)
+
+
+def _technology_facets(Z: np.ndarray, up: np.ndarray):
+    """
+    Caras ``A·z <= b`` de ``conv(Z) + disponibilidad`` (``up[k]``: la
+    coordenada ``k`` se puede aumentar; si no, disminuir). ``None`` si la
+    envolvente no puede calcularse.
+    """
+    d = Z.shape[1]
+    if d == 1:
+        # Una sola coordenada: la tecnología es una semirrecta
+        z = Z[:, 0]
+        return (np.array([[-1.0]]), np.array([-z.min()])) if up[0] else (np.array([[1.0]]), np.array([z.max()]))
+    if d == 3 and ConvexHull is None:
+        return None
+
+    keep = ~dominance_index(Z[:, up].T, Z[:, ~up].T, count_dominators=False)["dominated"]
+    P = Z[keep]
+    bound = np.where(up, 2.0 * Z.max(axis=0), 0.0)
+    variants = []
+    for mask in itertools.product([False, True], repeat=d):
+        V = P.copy()
+        V[:, list(mask)] = bound[list(mask)]
+        variants.append(V)
+    points = np.unique(np.vstack(variants), axis=0)
+
+    if d == 2:
+        A, b = _chain_facets(points)
+    else:
+        try:
+            hull = ConvexHull(points)
+        except Exception:
+            return None
+        A, b = hull.equations[:, :-1], -hull.equations[:, -1]
+
+    # Las caras de la caja tienen normal +e_k (inputs) o -e_k (outputs)
+    signed = np.where(up, A, -A)
+    valid = (signed <= _NORMAL_TOL).all(axis=1)
+    A = np.where(np.abs(A) < _NORMAL_TOL, 0.0, A)[valid]
+    return A, b[valid]
+
+
+def _chain_facets(points: np.ndarray):
+    """Aristas de la envolvente 2D (cadena monótona de Andrew) como ``A·z <= b``."""
+    pts = sorted(map(tuple, points))
+    if len(pts) < 3:
+        raise ValueError("Se necesitan al menos tres puntos distintos para la envolvente.")
+
+    def half(seq):
+        chain = []
+        for p in seq:
+            while len(chain) >= 2 and (
+                (chain[-1][0] - chain[-2][0]) * (p[1] - chain[-2][1])
+                - (chain[-1][1] - chain[-2][1]) * (p[0] - chain[-2][0])
+            ) <= 0:
+                chain.pop()
+            chain.append(p)
+        return chain
+
+    lower, upper = half(pts), half(reversed(pts))
+    hull = np.array(lower[:-1] + upper[:-1])  # vértices en sentido antihorario
+    edges = np.roll(hull, -1, axis=0) - hull
+    A = np.column_stack([edges[:, 1], -edges[:, 0]])  # normal exterior
+    A /= np.linalg.norm(A, axis=1, keepdims=True)
+    return A, np.einsum("ij,ij->i", A, hull)
+
+
+def _ray_scores(
+    A: np.ndarray,
+    b: np.ndarray,
+    base: np.ndarray,
+    direction: np.ndarray,
+    maximize: bool,
+    chunk_size: int = 4096,
+) -> np.ndarray:
+    """
+    Para cada fila, el menor (o mayor) ``t`` con ``A·(base + t·direction) <= b``.
+    ``NaN`` si ningún ``t`` es factible.
+    """
+    n = base.shape[0]
+    out = np.empty(n)
+    scale = max(1.0, float(np.abs(b).max()))
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        num = b[None, :] - base[start:stop] @ A.T
+        den = direction[start:stop] @ A.T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = num / den
+        if maximize:
+            t = np.where(den > _NORMAL_TOL, ratio, np.inf).min(axis=1)
+        else:
+            t = np.where(den < -_NORMAL_TOL, ratio, -np.inf).max(axis=1)
+        # Caras paralelas al rayo: si la base las viola no hay solución
+        infeasible = ((np.abs(den) <= _NORMAL_TOL) & (num < -_NORMAL_TOL * scale)).any(axis=1)
+        t[infeasible | ~np.isfinite(t)] = np.nan
+        out[start:stop] = t
+    return out
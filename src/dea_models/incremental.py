@@ -0,0 +1,205 @@
+# src/dea_models/incremental.py
+
+"""
+Actualización incremental de un análisis radial (CCR/BCC).
+
+Se guardan, para cada DMU, su puntuación, sus pares (lambdas > 0) y los
+duales ``(u, v, w)`` de su PL. Con eso, al cambiar los datos solo se
+vuelven a resolver las DMUs cuya solución puede dejar de ser óptima:
+
+- Al añadir DMUs, la solución de ``k`` sigue siendo óptima si ninguna
+  columna nueva tiene coste reducido negativo con sus duales
+  (``v_k·x_new - u_k·y_new + w_k >= 0``). Un recién llegado ineficiente
+  queda dentro de la tecnología y no afecta a nadie.
+- Al eliminar DMUs, solo cambian las DMUs que las usaban como pares; quitar
+  una columna con lambda 0 no altera el óptimo.
+- Editar una DMU equivale a eliminarla y añadirla con los datos nuevos.
+
+Las DMUs nuevas o editadas siempre se resuelven.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .data import DEAData, as_dea_data
+from .radial import _build_radial_problem, _set_reference, _solve_radial_problem, _radial_duals
+
+_PEER_TOL = 1e-9
+
+
+class IncrementalDEA:
+    """
+    Motor radial incremental.
+
+    Ejemplo::
+
+        engine = IncrementalDEA(df, "DMU", inputs, outputs, rts="VRS")
+        engine.add(df_nuevas)          # solo se resuelven las afectadas
+        engine.remove(["S12"])
+        engine.sync(df_editado)        # diferencias por etiqueta de DMU
+        engine.results()               # DataFrame con la eficiencia actual
+
+    ``last_update`` describe la última operación (``resolved``, ``skipped``).
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame | DEAData,
+        dmu_column: str | None,
+        input_cols: list[str] | None,
+        output_cols: list[str] | None,
+        rts: str = "CRS",
+        orientation: str = "input",
+        tol: float = 1e-7,
+    ):
+        if rts not in ("CRS", "VRS"):
+            raise ValueError("rts debe ser 'CRS' o 'VRS'.")
+        if orientation not in ("input", "output"):
+            raise ValueError("orientation debe ser 'input' u 'output'.")
+        data = as_dea_data(df, dmu_column, input_cols, output_cols)
+        if len(set(data.dmus)) != len(data):
+            raise ValueError("IncrementalDEA necesita etiquetas de DMU únicas.")
+        self.dmu_column = data.dmu_column
+        self.input_cols = list(data.input_cols)
+        self.output_cols = list(data.output_cols)
+        self.rts = rts
+        self.orientation = orientation
+        self.tol = tol
+
+        self._labels = list(data.dmus)
+        self._X = np.array(data.X, dtype=float)
+        self._Y = np.array(data.Y, dtype=float)
+        n, m, s = len(self._labels), len(self.input_cols), len(self.output_cols)
+        self._score = np.full(n, np.nan)
+        self._U, self._V, self._W = np.zeros((n, s)), np.zeros((n, m)), np.zeros(n)
+        self._peers: list[dict] = [{} for _ in range(n)]
+        self._compiled = None
+        self._resolve(np.arange(n))
+        self.last_update = {"operation": "init", "resolved": n, "skipped": 0}
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    # --------------------------------------------------------------
+    # Operaciones
+    # --------------------------------------------------------------
+    def add(self, df: pd.DataFrame) -> list[str]:
+        """Añade DMUs (mismas columnas). Devuelve las etiquetas re-resueltas."""
+        labels, X_new, Y_new = self._rows(df)
+        clash = set(labels) & set(self._labels)
+        if clash:
+            raise ValueError(f"Las DMUs {sorted(clash)} ya existen; usa update() o sync().")
+        return self._apply(removed=[], labels=labels, X_new=X_new, Y_new=Y_new, operation="add")
+
+    def remove(self, labels: list[str]) -> list[str]:
+        """Elimina DMUs por etiqueta. Devuelve las etiquetas re-resueltas."""
+        labels = [str(l) for l in labels]
+        missing = set(labels) - set(self._labels)
+        if missing:
+            raise ValueError(f"Las DMUs {sorted(missing)} no existen.")
+        return self._apply(removed=labels, labels=[], X_new=None, Y_new=None, operation="remove")
+
+    def update(self, df: pd.DataFrame) -> list[str]:
+        """Sustituye los datos de DMUs existentes. Devuelve las etiquetas re-resueltas."""
+        labels, X_new, Y_new = self._rows(df)
+        missing = set(labels) - set(self._labels)
+        if missing:
+            raise ValueError(f"Las DMUs {sorted(missing)} no existen; usa add().")
+        return self._apply(removed=labels, labels=labels, X_new=X_new, Y_new=Y_new, operation="update")
+
+    def sync(self, df: pd.DataFrame) -> list[str]:
+        """
+        Lleva el motor al estado de ``df`` (filas identificadas por la columna
+        de DMU): añade, elimina y edita lo necesario en una sola actualización.
+        """
+        labels, X_all, Y_all = self._rows(df)
+        current = {l: k for k, l in enumerate(self._labels)}
+        target = set(labels)
+        removed = [l for l in self._labels if l not in target]
+        changed = [
+            j for j, l in enumerate(labels)
+            if l not in current
+            or not (np.array_equal(X_all[:, j], self._X[:, current[l]]) and np.array_equal(Y_all[:, j], self._Y[:, current[l]]))
+        ]
+        removed += [labels[j] for j in changed if labels[j] in current]
+        return self._apply(
+            removed=removed, labels=[labels[j] for j in changed],
+            X_new=X_all[:, changed], Y_new=Y_all[:, changed], operation="sync",
+        )
+
+    def results(self) -> pd.DataFrame:
+        """Eficiencia actual (``theta`` o ``1/phi``), en ``(0, 1]``, y número de pares."""
+        eff = self._score if self.orientation == "input" else 1.0 / self._score
+        return pd.DataFrame({
+            self.dmu_column: self._labels,
+            "efficiency": np.round(eff, 6),
+            "n_peers": [len(p) for p in self._peers],
+            "model": "CCR" if self.rts == "CRS" else "BCC",
+            "orientation": self.orientation,
+        })
+
+    # --------------------------------------------------------------
+    # Internos
+    # --------------------------------------------------------------
+    def _rows(self, df):
+        data = as_dea_data(df, self.dmu_column, self.input_cols, self.output_cols)
+        labels = list(data.dmus)
+        if len(set(labels)) != len(labels):
+            raise ValueError("Las etiquetas de DMU deben ser únicas.")
+        return labels, np.array(data.X, dtype=float), np.array(data.Y, dtype=float)
+
+    def _apply(self, removed, labels, X_new, Y_new, operation) -> list[str]:
+        removed_set = set(removed)
+        # 1) DMUs que usaban como par alguna DMU eliminada
+        stale = {
+            self._labels[k] for k in range(len(self._labels))
+            if self._labels[k] not in removed_set and (removed_set & self._peers[k].keys() or np.isnan(self._score[k]))
+        }
+        # 2) DMUs para las que alguna columna nueva tiene coste reducido negativo
+        if labels:
+            reduced = self._V @ X_new - self._U @ Y_new + self._W[:, None]
+            priced = np.flatnonzero((reduced < -self.tol).any(axis=1))
+            stale |= {self._labels[k] for k in priced if self._labels[k] not in removed_set}
+
+        keep = np.array([l not in removed_set for l in self._labels], dtype=bool)
+        self._labels = [l for l, k in zip(self._labels, keep) if k] + list(labels)
+        self._X = np.hstack([self._X[:, keep], X_new]) if labels else self._X[:, keep]
+        self._Y = np.hstack([self._Y[:, keep], Y_new]) if labels else self._Y[:, keep]
+        n_new = len(labels)
+        self._score = np.concatenate([self._score[keep], np.full(n_new, np.nan)])
+        self._U = np.vstack([self._U[keep], np.zeros((n_new, self._U.shape[1]))])
+        self._V = np.vstack([self._V[keep], np.zeros((n_new, self._V.shape[1]))])
+        self._W = np.concatenate([self._W[keep], np.zeros(n_new)])
+        self._peers = [p for p, k in zip(self._peers, keep) if k] + [{} for _ in range(n_new)]
+        self._compiled = None
+
+        position = {l: k for k, l in enumerate(self._labels)}
+        targets = sorted({position[l] for l in stale} | set(range(len(self._labels) - n_new, len(self._labels))))
+        self._resolve(np.array(targets, dtype=np.int64))
+        self.last_update = {
+            "operation": operation,
+            "resolved": len(targets),
+            "skipped": len(self._labels) - len(targets),
+        }
+        return [self._labels[k] for k in targets]
+
+    def _resolve(self, targets: np.ndarray) -> None:
+        """Resuelve el PL de las posiciones ``targets`` frente a todas las DMUs actuales."""
+        if len(targets) == 0:
+            return
+        n, m, s = len(self._labels), self._X.shape[0], self._Y.shape[0]
+        if self._compiled is None:
+            self._compiled = _build_radial_problem(n, m, s, rts=self.rts, orientation=self.orientation)
+            _set_reference(self._compiled, self._X, self._Y)
+        for i in targets:
+            score = _solve_radial_problem(self._compiled, self._X[:, [i]], self._Y[:, [i]])
+            duals = _radial_duals(self._compiled, self.rts)
+            lambdas = self._compiled["lambdas"].value
+            if np.isnan(score) or duals is None or lambdas is None:
+                self._score[i], self._peers[i] = np.nan, {}
+                self._U[i], self._V[i], self._W[i] = 0.0, 0.0, 0.0
+                continue
+            self._score[i] = score
+            self._U[i], self._V[i], self._W[i] = duals
+            lambdas = np.ravel(lambdas)
+            self._peers[i] = {self._labels[j]: float(lambdas[j]) for j in np.flatnonzero(lambdas > _PEER_TOL)}
@@ -4,46 +4,50 @@ import pandas as pd
 import cvxpy as cp
 
 from .utils import validate_positive_dataframe
+from .data import DEAData, as_dea_data
+from .solver import solve_lp
 
 def compute_malmquist_phi(
-    df_panel: pd.DataFrame,
-    dmu_column: str,
-    period_column: str,
-    input_cols: list[str],
-    output_cols: list[str],
+    df_panel: pd.DataFrame | DEAData,
+    dmu_column: str | None,
+    period_column: str | None,
+    input_cols: list[str] | None,
+    output_cols: list[str] | None,
     rts: str = "CRS"
 ) -> pd.DataFrame:
     """
     Calcula el índice de Malmquist para cada par de períodos consecutivos.
+    ``df_panel`` puede ser un :class:`DEAData` construido con ``period_column``.
     """
-    if dmu_column not in df_panel.columns:
-        raise ValueError(f"La columna DMU '{dmu_column}' no existe.")
-    if period_column not in df_panel.columns:
-        raise ValueError(f"La columna de periodo '{period_column}' no existe.")
-
-    validate_positive_dataframe(df_panel, input_cols + output_cols)
-    periods = sorted(df_panel[period_column].unique())
+    data = as_dea_data(df_panel, dmu_column, input_cols, output_cols, period_column=period_column)
+    if data.periods is None:
+        raise ValueError("Para Malmquist los datos deben incluir una columna de período.")
+    periods = sorted(pd.unique(data.periods))
     if len(periods) < 2:
         raise ValueError("Se requieren al menos dos períodos para Malmquist.")
 
+    # Bloques X/Y por período y posición de cada DMU dentro de su período
+    labels = data.dmu_labels[data.dmu_codes]
+    by_period = {}
+    for t in periods:
+        mask = data.periods == t
+        positions = {}
+        for k, lab in enumerate(labels[mask]):
+            positions.setdefault(lab, k)
+        by_period[t] = (data.X[:, mask], data.Y[:, mask], positions)
+
     resultados = []
-    dmus_unique = df_panel[dmu_column].astype(str).unique().tolist()
+    dmus_unique = data.dmu_labels.tolist()
 
     for dmu_id in dmus_unique:
         for idx in range(len(periods) - 1):
             t, t1 = periods[idx], periods[idx + 1]
-            df_t = df_panel[df_panel[period_column] == t]
-            df_t1 = df_panel[df_panel[period_column] == t1]
-
-            dmu_in_t = df_t[df_t[dmu_column].astype(str) == dmu_id]
-            dmu_in_t1 = df_t1[df_t1[dmu_column].astype(str) == dmu_id]
-            if dmu_in_t.empty or dmu_in_t1.empty: continue
-
-            X_t_all, Y_t_all = df_t[input_cols].to_numpy().T, df_t[output_cols].to_numpy().T
-            X_t1_all, Y_t1_all = df_t1[input_cols].to_numpy().T, df_t1[output_cols].to_numpy().T
+            X_t_all, Y_t_all, pos_t = by_period[t]
+            X_t1_all, Y_t1_all, pos_t1 = by_period[t1]
+            if dmu_id not in pos_t or dmu_id not in pos_t1: continue
 
-            idx_in_t = df_t[dmu_column].astype(str).tolist().index(dmu_id)
-            idx_in_t1 = df_t1[dmu_column].astype(str).tolist().index(dmu_id)
+            idx_in_t = pos_t[dmu_id]
+            idx_in_t1 = pos_t1[dmu_id]
 
             # E_t_t, E_t1_t1, E_t_t1, E_t1_t
             eff_t_t = _run_dea_core_panel(X_t_all, Y_t_all, idx_in_t, rts)
@@ -75,7 +79,7 @@ def _run_dea_core_panel(X, Y, idx, rts):
     if rts == "VRS": cons.append(cp.sum(lambdas) == 1)
     prob = cp.Problem(cp.Minimize(theta), cons)
     try:
-        prob.solve(solver=cp.ECOS, abstol=1e-8)
+        solve_lp(prob, score=lambda: theta.value)
         return float(theta.value) if prob.status in [cp.OPTIMAL, cp.OPTIMAL_INACCURATE] else np.nan
     except Exception: return np.nan
 
@@ -86,6 +90,6 @@ def _run_dea_core_cross_period(x_eval, y_eval, X_ref, Y_ref, rts):
     if rts == "VRS": cons.append(cp.sum(lambdas) == 1)
     prob = cp.Problem(cp.Minimize(theta), cons)
     try:
-        prob.solve(solver=cp.ECOS, abstol=1e-8)
+        solve_lp(prob, score=lambda: theta.value)
         return float(theta.value) if prob.status in [cp.OPTIMAL, cp.OPTIMAL_INACCURATE] else np.nan
     except Exception: return np.nan
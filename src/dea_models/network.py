@@ -5,6 +5,7 @@ import pandas as pd
 import cvxpy as cp
 
 from .utils import validate_positive_dataframe
+from .solver import solve_lp
 
 def run_network_dea(
     df: pd.DataFrame,
@@ -86,7 +87,7 @@ def run_network_dea(
         obj = cp.Minimize(theta1 + theta2)
 
         prob = cp.Problem(obj, cons)
-        prob.solve(solver=cp.ECOS, abstol=1e-6, reltol=1e-6, feastol=1e-8, verbose=False)
+        solve_lp(prob)
 
         theta1_val = float(theta1.value) if theta1.value is not None else np.nan
         theta2_val = float(theta2.value) if theta2.value is not None else np.nan
@@ -193,7 +194,7 @@ def run_multi_stage_network(
         # Objetivo: minimizar suma de thetas
         obj = cp.Minimize(sum(thetas))
         prob = cp.Problem(obj, cons)
-        prob.solve(solver=cp.ECOS, abstol=1e-6, reltol=1e-6, feastol=1e-8, verbose=False)
+        solve_lp(prob)
 
         # Leer valores
         theta_vals = [
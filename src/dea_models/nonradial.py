@@ -4,13 +4,15 @@ import pandas as pd
 import cvxpy as cp
 
 from .utils import validate_positive_dataframe
+from .data import DEAData, as_dea_data
 from .directions import get_direction_vector
+from .solver import solve_lp
 
 def run_sbm(
-    df: pd.DataFrame,
-    dmu_column: str,
-    input_cols: list[str],
-    output_cols: list[str],
+    df: pd.DataFrame | DEAData,
+    dmu_column: str | None = None,
+    input_cols: list[str] | None = None,
+    output_cols: list[str] | None = None,
     orientation: str = "non-oriented", # Opciones: "input", "output", "non-oriented"
     rts: str = "VRS"
 ) -> pd.DataFrame:
@@ -18,13 +20,11 @@ def run_sbm(
     SBM (slack-based measure).
     Retorna DataFrame con eficiencia, slacks y lambdas.
     """
-    if dmu_column not in df.columns:
-        raise ValueError(f"La columna DMU '{dmu_column}' no existe en el DataFrame.")
-    validate_positive_dataframe(df, input_cols + output_cols)
+    data = as_dea_data(df, dmu_column, input_cols, output_cols)
+    dmu_column, input_cols, output_cols = data.dmu_column, list(data.input_cols), list(data.output_cols)
 
-    X = df[input_cols].to_numpy().T
-    Y = df[output_cols].to_numpy().T
-    dmus = df[dmu_column].astype(str).tolist()
+    X, Y = data.X, data.Y
+    dmus = data.dmus
     n, m, s = X.shape[1], X.shape[0], Y.shape[0]
 
     resultados = []
@@ -64,7 +64,7 @@ def run_sbm(
             raise ValueError("orientation debe ser 'input', 'output' o 'non-oriented'")
             
         prob = cp.Problem(obj, cons)
-        prob.solve(solver=cp.ECOS, abstol=1e-7, reltol=1e-7, feastol=1e-7, verbose=False)
+        solve_lp(prob, score=lambda: obj.value)
 
         eff_val = float(obj.value) if prob.status in [cp.OPTIMAL, cp.OPTIMAL_INACCURATE] and obj.value is not None else np.nan
         
@@ -124,7 +124,7 @@ def run_radial_distance(
         # El objetivo es maximizar la ineficiencia (beta), no minimizarla.
         obj = cp.Maximize(beta)
         prob = cp.Problem(obj, cons)
-        prob.solve(solver=cp.ECOS, abstol=1e-7, reltol=1e-7, feastol=1e-7, verbose=False)
+        solve_lp(prob, score=lambda: 1.0 + obj.value)  # eficiente <=> beta = 0
 
         beta_val = float(obj.value) if prob.status in [cp.OPTIMAL, cp.OPTIMAL_INACCURATE] and obj.value is not None else np.nan
         lambdas_opt = lambdas.value if lambdas.value is not None else np.zeros((n, 1))
@@ -0,0 +1,74 @@
+# src/dea_models/parallel.py
+
+"""
+Utilidades para repartir trabajo DEA entre procesos.
+
+Los bloques de datos (matrices X/Y) se publican una sola vez en memoria
+compartida; cada proceso del pool se conecta a ellos en su inicialización,
+así que las tareas solo transportan índices y semillas, nunca los datos.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Arrays compartidos visibles dentro de cada proceso trabajador
+_WORKER_ARRAYS: dict[str, np.ndarray] = {}
+_WORKER_HANDLES: list[shared_memory.SharedMemory] = []
+
+
+def resolve_n_jobs(n_jobs: int | None) -> int:
+    """Traduce ``n_jobs`` (``None``/1 = secuencial, -1 = todos los núcleos) a un entero >= 1."""
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return max(1, int(n_jobs))
+
+
+def share_arrays(arrays: dict[str, np.ndarray]) -> tuple[list, dict]:
+    """
+    Copia cada array a un bloque de memoria compartida.
+
+    Devuelve ``(handles, specs)``: los *handles* deben cerrarse y liberarse con
+    :func:`release_arrays` cuando termine el trabajo; los *specs* son
+    serializables y se pasan a :func:`attach_arrays` en los procesos hijos.
+    """
+    handles, specs = [], {}
+    for name, arr in arrays.items():
+        arr = np.ascontiguousarray(arr)
+        shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+        view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)
+        view[...] = arr
+        handles.append(shm)
+        specs[name] = (shm.name, arr.shape, arr.dtype.str)
+    return handles, specs
+
+
+def release_arrays(handles: list) -> None:
+    """Cierra y elimina los bloques creados por :func:`share_arrays`."""
+    for shm in handles:
+        shm.close()
+        shm.unlink()
+
+
+def attach_arrays(specs: dict) -> None:
+    """Inicializador de proceso: conecta los arrays compartidos como solo lectura."""
+    for name, (shm_name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        arr = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        arr.flags.writeable = False
+        _WORKER_HANDLES.append(shm)
+        _WORKER_ARRAYS[name] = arr
+
+
+def get_shared_array(name: str) -> np.ndarray:
+    """Devuelve un array publicado con :func:`attach_arrays` en este proceso."""
+    return _WORKER_ARRAYS[name]
+
+
+def make_pool(n_workers: int, specs: dict) -> ProcessPoolExecutor:
+    """Crea un pool cuyos procesos ya tienen conectados los arrays de ``specs``."""
+    return ProcessPoolExecutor(max_workers=n_workers, initializer=attach_arrays, initargs=(specs,))
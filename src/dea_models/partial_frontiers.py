@@ -0,0 +1,206 @@
+# src/dea_models/partial_frontiers.py
+
+"""
+Fronteras parciales orden-m y orden-α (robustas frente a atípicos), sin PL.
+
+Para la DMU ``i`` en orientación input, las DMUs admisibles son las que
+producen al menos lo mismo (``y_j >= y_i``) y el cociente de cada una es
+``r_ij = max_k x_jk / x_ik`` (su puntuación FDH frente a ``j``):
+
+- orden-m: ``theta_m = E[min(r_ij1, ..., r_ijm)]`` con ``j1..jm`` extraídas
+  con reemplazo entre las admisibles; se estima por Monte Carlo.
+- orden-α: el cuantil ``(1 - α)`` de los cocientes admisibles; con ``α = 1``
+  coincide con FDH. Es un estadístico de orden, así que se calcula exacto.
+
+En orientación output se usan ``x_j <= x_i``, ``min_r y_jr / y_ir`` y el
+máximo/cuantil superior. Las DMUs se ordenan por la primera variable de
+admisibilidad, así que cada bloque solo se compara con un sufijo de las DMUs.
+Cada bloque tiene su propia ``SeedSequence`` hija, de modo que con la misma
+``seed`` el resultado no depende de ``n_jobs``.
+"""
+
+from concurrent.futures import as_completed
+
+import numpy as np
+import pandas as pd
+
+from .data import DEAData, as_dea_data
+from .parallel import resolve_n_jobs, share_arrays, release_arrays, make_pool, get_shared_array
+
+
+def run_order_m(
+    df: pd.DataFrame | DEAData,
+    dmu_column: str | None = None,
+    input_cols: list[str] | None = None,
+    output_cols: list[str] | None = None,
+    m: int = 25,
+    n_draws: int = 200,
+    orientation: str = "input",
+    seed: int | None = None,
+    n_jobs: int | None = 1,
+    chunk_size: int | None = None,
+) -> pd.DataFrame:
+    """
+    Eficiencia orden-m. Columnas: ``efficiency_order_m`` (``theta_m``, o
+    ``1/phi_m`` en orientación output; puede superar 1 si la DMU queda por
+    encima de la frontera parcial), ``std_error`` Monte Carlo y
+    ``n_reference`` (DMUs admisibles). ``df.attrs`` guarda ``m``,
+    ``n_draws`` y la ``seed`` efectiva.
+    """
+    if int(m) < 1:
+        raise ValueError("m debe ser un entero >= 1.")
+    if int(n_draws) < 2:
+        raise ValueError("n_draws debe ser >= 2.")
+    data = _prepare(df, dmu_column, input_cols, output_cols, orientation)
+    root = np.random.SeedSequence(seed)
+    score, spread, counts = _run_chunks(data, "m", int(m), int(n_draws), orientation, root, n_jobs, chunk_size)
+
+    if orientation == "output":
+        spread = spread / score**2  # método delta para 1/phi
+        score = 1.0 / score
+    out = pd.DataFrame({
+        data.dmu_column: data.dmus,
+        "efficiency_order_m": np.round(score, 6),
+        "std_error": spread,
+        "n_reference": counts,
+        "model": "ORDER_M",
+        "orientation": orientation,
+    })
+    out.attrs.update({"m": int(m), "n_draws": int(n_draws), "seed": root.entropy})
+    return out
+
+
+def run_order_alpha(
+    df: pd.DataFrame | DEAData,
+    dmu_column: str | None = None,
+    input_cols: list[str] | None = None,
+    output_cols: list[str] | None = None,
+    alpha: float = 0.95,
+    orientation: str = "input",
+    n_jobs: int | None = 1,
+    chunk_size: int | None = None,
+) -> pd.DataFrame:
+    """
+    Eficiencia orden-α (cuantil condicional). Columnas
+    ``efficiency_order_alpha`` (``theta_α`` o ``1/phi_α``) y ``n_reference``;
+    ``alpha=1`` reproduce FDH. ``df.attrs["alpha"]`` guarda el nivel.
+    """
+    if not 0 < alpha <= 1:
+        raise ValueError("alpha debe estar en (0, 1].")
+    data = _prepare(df, dmu_column, input_cols, output_cols, orientation)
+    score, _, counts = _run_chunks(data, "alpha", float(alpha), 0, orientation, None, n_jobs, chunk_size)
+
+    out = pd.DataFrame({
+        data.dmu_column: data.dmus,
+        "efficiency_order_alpha": np.round(score if orientation == "input" else 1.0 / score, 6),
+        "n_reference": counts,
+        "model": "ORDER_ALPHA",
+        "orientation": orientation,
+    })
+    out.attrs["alpha"] = float(alpha)
+    return out
+
+
+def _prepare(df, dmu_column, input_cols, output_cols, orientation) -> DEAData:
+    if orientation not in ("input", "output"):
+        raise ValueError("orientation debe ser 'input' u 'output'.")
+    return as_dea_data(df, dmu_column, input_cols, output_cols)
+
+
+def _run_chunks(data, kind, param, n_draws, orientation, root, n_jobs, chunk_size):
+    """Reparte las DMUs en bloques fijos (independientes de ``n_jobs``) y junta los resultados."""
+    # Orden creciente de la clave de admisibilidad: las admisibles de i van detrás de i
+    key = data.Y[0] if orientation == "input" else -data.X[0]
+    order = np.argsort(key, kind="stable")
+    X, Y, key = data.X[:, order], data.Y[:, order], key[order]
+    n = X.shape[1]
+    # Bloques de (filas × n) cocientes: ~4M valores como máximo
+    chunk_size = chunk_size or int(np.clip(4_000_000 // max(n, 1), 1, 1024))
+    bounds = [
+        (b0, min(b0 + chunk_size, n), int(np.searchsorted(key, key[b0], side="left")))
+        for b0 in range(0, n, chunk_size)
+    ]
+    seeds = root.spawn(len(bounds)) if root is not None else [None] * len(bounds)
+
+    score, spread = np.empty(n), np.full(n, np.nan)
+    counts = np.empty(n, dtype=np.int64)
+
+    def store(b, result):
+        rows = order[b[0]:b[1]]
+        score[rows], spread[rows], counts[rows] = result
+
+    n_workers = min(resolve_n_jobs(n_jobs), len(bounds))
+    if n_workers <= 1:
+        for b, ss in zip(bounds, seeds):
+            store(b, _partial_chunk(*b, kind, param, n_draws, orientation, ss, X, Y))
+        return score, spread, counts
+
+    handles, specs = share_arrays({"X": X, "Y": Y})
+    try:
+        with make_pool(n_workers, specs) as pool:
+            futures = {
+                pool.submit(_partial_chunk, *b, kind, param, n_draws, orientation, ss): b
+                for b, ss in zip(bounds, seeds)
+            }
+            for fut in as_completed(futures):
+                store(futures[fut], fut.result())
+    finally:
+        release_arrays(handles)
+    return score, spread, counts
+
+
+def _partial_chunk(start, stop, ref_start, kind, param, n_draws, orientation, seed_seq=None, X=None, Y=None):
+    """
+    Procesa las DMUs ``start:stop`` frente a las DMUs ``ref_start:``; en un
+    proceso hijo lee X/Y de memoria compartida. Devuelve ``(puntuación, error
+    estándar, n_admisibles)``.
+    """
+    if X is None:
+        X, Y = get_shared_array("X"), get_shared_array("Y")
+    admissible, ratio = _chunk_ratios(X, Y, start, stop, ref_start, orientation)
+    counts = admissible.sum(axis=1)  # >= 1: la propia DMU siempre es admisible
+    values = ratio[admissible]  # por filas, en el orden de las DMUs
+    offsets = np.cumsum(counts) - counts
+    maximize = orientation == "output"
+    c = stop - start
+
+    if kind == "alpha":
+        k = np.floor((1.0 - param) * counts).astype(np.int64)
+        score = np.empty(c)
+        for i in range(c):
+            seg = values[offsets[i]:offsets[i] + counts[i]]
+            kth = counts[i] - 1 - k[i] if maximize else k[i]
+            score[i] = np.partition(seg, kth)[kth]
+        return score, np.full(c, np.nan), counts
+
+    m = int(param)
+    rng = np.random.default_rng(seed_seq)
+    score, spread = np.empty(c), np.empty(c)
+    rows_per_block = max(1, 2_000_000 // (n_draws * m))  # acota (filas × draws × m)
+    for r0 in range(0, c, rows_per_block):
+        r1 = min(r0 + rows_per_block, c)
+        u = rng.random((r1 - r0, n_draws, m))
+        idx = offsets[r0:r1, None, None] + (u * counts[r0:r1, None, None]).astype(np.int64)
+        draws = values[idx]
+        best = draws.max(axis=2) if maximize else draws.min(axis=2)
+        score[r0:r1] = best.mean(axis=1)
+        spread[r0:r1] = best.std(axis=1, ddof=1) / np.sqrt(n_draws)
+    return score, spread, counts
+
+
+def _chunk_ratios(X, Y, start, stop, ref_start, orientation):
+    """Máscara de DMUs admisibles y cocientes de las filas ``start:stop`` frente a ``ref_start:``."""
+    if orientation == "input":
+        feas, ratio_src, pick = Y, X, np.maximum
+    else:
+        feas, ratio_src, pick = X, Y, np.minimum
+    ref = slice(ref_start, X.shape[1])
+    admissible = np.ones((stop - start, X.shape[1] - ref_start), dtype=bool)
+    # Dimensión a dimensión: sin temporales (filas × DMUs × variables)
+    for r in range(feas.shape[0]):
+        own = feas[r, start:stop][:, None]
+        admissible &= (feas[r, ref][None, :] >= own) if orientation == "input" else (feas[r, ref][None, :] <= own)
+    ratio = ratio_src[0, ref][None, :] / ratio_src[0, start:stop][:, None]
+    for k in range(1, ratio_src.shape[0]):
+        ratio = pick(ratio, ratio_src[k, ref][None, :] / ratio_src[k, start:stop][:, None])
+    return admissible, ratio
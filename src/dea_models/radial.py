@@ -1,9 +1,19 @@
 # jftmames/-dea-deliberativo-mvp/-dea-deliberativo-mvp-b44b8238c978ae0314af30717b9399634d28f8f9/src/dea_models/radial.py
+import time
+
 import numpy as np
 import cvxpy as cp
 import pandas as pd
 
-from .utils import validate_positive_dataframe, validate_dataframe
+from .constants import COLUMN_GENERATION_MIN_DMUS
+
+from .utils import validate_positive_dataframe, validate_dataframe, data_fingerprint, unique_columns
+from .data import DEAData, as_dea_data
+from .dominance import dominance_index
+from .hull import hull_efficiencies
+from .cache import spec_key, frame_block, labels_fingerprint, get_cached, store_cached
+from .results import DEAResults, build_results
+from .solver import resolve_preset, solve_lp
 
 # ------------------------------------------------------------------
 # 1. Núcleo DEA (utilizado por la función interna de más abajo)
@@ -14,16 +24,60 @@ def _dea_core(
     rts: str = "CRS",
     orientation: str = "input",
     super_eff: bool = False,
+    prefilter_dominated: bool = False,
+    use_hull: bool = True,
+    column_generation: bool | None = None,
+    stats: dict | None = None,
+    solver_preset: str | None = None,
+    rescale: bool = True,
 ) -> np.ndarray:
+    """
+    Puntuación radial (``theta`` o ``phi``) de cada DMU.
+
+    Con ``m + s <= 3`` se usa la envolvente convexa exacta (``use_hull``).
+    ``column_generation`` (por defecto, activa a partir de
+    ``COLUMN_GENERATION_MIN_DMUS``) resuelve PL maestros restringidos en lugar
+    del PL completo; sus estadísticas se vuelcan en ``stats`` si se pasa un dict.
+
+    Las DMUs con el mismo vector ``(x, y)`` se resuelven una sola vez y el
+    resultado se reparte a todas (``stats["solves_avoided"]``). Con
+    ``super_eff`` una DMU duplicada conserva a su gemela en la referencia.
+    ``solver_preset`` como en :func:`~dea_models.solver.solve_lp`. Con
+    ``rescale`` cada input/output se divide por su media antes de construir los
+    PL (ver :func:`_variable_scales`); las puntuaciones son las mismas salvo
+    la tolerancia del solver.
+    """
+    first, inverse, counts = unique_columns(X, Y)
+    if stats is not None:
+        stats["solves_avoided"] = int(X.shape[1] - len(first))
+        stats["rescaled"] = bool(rescale)
+    if len(first) < X.shape[1]:
+        X, Y = X[:, first], Y[:, first]
+    if rescale:
+        sx, sy = _variable_scales(X, Y)
+        X, Y = X * sx, Y * sy
     m, n_total_dmus = X.shape 
     s = Y.shape[0]
+    if use_hull and not super_eff and m + s <= 3:
+        # Vía exacta sin PL (envolvente convexa); None si el caso no la admite
+        eff = hull_efficiencies(X, Y, rts=rts, orientation=orientation)
+        if eff is not None:
+            return eff[inverse]
+    # Las DMUs estrictamente dominadas no cambian ninguna puntuación radial como referencia
+    reference = _reference_mask(X, Y, prefilter_dominated and not super_eff)
+    if column_generation is None:
+        column_generation = n_total_dmus > COLUMN_GENERATION_MIN_DMUS
+    if column_generation and not super_eff:
+        return _column_generation_core(
+            X, Y, rts, orientation, np.flatnonzero(reference), stats=stats, solver_preset=solver_preset,
+        )[inverse]
     eff = np.zeros(n_total_dmus)
 
     for i in range(n_total_dmus):
         x_i = X[:, [i]]
         y_i = Y[:, [i]]
 
-        if super_eff:
+        if super_eff and counts[i] == 1:
             mask = np.ones(n_total_dmus, dtype=bool)
             mask[i] = False
             X_ref, Y_ref = X[:, mask], Y[:, mask]
@@ -32,8 +86,8 @@ def _dea_core(
                 eff[i] = 1.0
                 continue
         else:
-            X_ref, Y_ref = X, Y
-            num_ref_dmus = n_total_dmus
+            X_ref, Y_ref = X[:, reference], Y[:, reference]
+            num_ref_dmus = X_ref.shape[1]
 
         lambdas = cp.Variable((num_ref_dmus, 1), nonneg=True)
 
@@ -52,20 +106,307 @@ def _dea_core(
 
         prob = cp.Problem(obj, cons)
         try:
-            prob.solve(solver=cp.ECOS, abstol=1e-7, reltol=1e-7, feastol=1e-7, verbose=False)
+            solve_lp(prob, solver_preset, score=lambda: obj.value, stats=stats)
             if prob.status in [cp.OPTIMAL, cp.OPTIMAL_INACCURATE]:
                 eff[i] = float(obj.value) if obj.value is not None else np.nan
             else:
                 eff[i] = np.nan
         except (cp.error.SolverError, Exception):
             eff[i] = np.nan
+    return eff[inverse]
+
+
+def _variable_scales(X: np.ndarray, Y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Factores ``(sx (m, 1), sy (s, 1))`` que llevan cada input/output a media 1.
+
+    El DEA radial es invariante a las unidades: con ``X·sx`` e ``Y·sy`` las
+    puntuaciones y las lambdas no cambian, las holguras y los objetivos quedan
+    multiplicados por el factor de su variable y los duales divididos por él.
+    Con variables de órdenes de magnitud muy distintos (costes en cientos de
+    miles junto a plantillas de decenas) la matriz escalada está mucho mejor
+    condicionada para el solver. La invariancia es exacta en el PL, no en la
+    solución de ECOS: las puntuaciones pueden moverse dentro de la tolerancia
+    del preset (las cercanas a 1 se refinan con ``"exact"``).
+    """
+    def factors(M):
+        mean = np.abs(M).mean(axis=1, keepdims=True) if M.shape[1] else np.ones((M.shape[0], 1))
+        return 1.0 / np.where(mean > 0, mean, 1.0)
+    return factors(X), factors(Y)
+
+
+def _reference_mask(X: np.ndarray, Y: np.ndarray, prefilter_dominated: bool) -> np.ndarray:
+    """DMUs admitidas en el conjunto de referencia (todas, o solo las no dominadas)."""
+    if not prefilter_dominated:
+        return np.ones(X.shape[1], dtype=bool)
+    return ~dominance_index(X, Y, count_dominators=False)["dominated"]
+
+
+# ------------------------------------------------------------------
+# 1b. Problema radial compilado (parametrizado, DPP)
+# ------------------------------------------------------------------
+def _build_radial_problem(
+    n_ref: int,
+    m: int,
+    s: int,
+    rts: str = "CRS",
+    orientation: str = "input",
+) -> dict:
+    """
+    Construye una única vez el PL radial con los datos como ``cp.Parameter``.
+
+    cvxpy cachea la compilación de problemas DPP, de modo que resolver muchas
+    DMUs (o muchas réplicas bootstrap del mismo tamaño) solo cambia los valores
+    de los parámetros en lugar de reconstruir el problema en cada llamada.
+
+    La referencia se fija con :func:`_set_reference`, que escala cada
+    input/output (:func:`_variable_scales`); :func:`_solve_radial_problem` y
+    :func:`_radial_duals` aplican y deshacen ese escalado.
+    """
+    X_ref = cp.Parameter((m, n_ref), nonneg=True)
+    Y_ref = cp.Parameter((s, n_ref), nonneg=True)
+    x0 = cp.Parameter((m, 1), nonneg=True)
+    y0 = cp.Parameter((s, 1), nonneg=True)
+    lambdas = cp.Variable((n_ref, 1), nonneg=True)
+    score = cp.Variable()
+
+    if orientation == "input":
+        cons = [Y_ref @ lambdas >= y0, X_ref @ lambdas <= score * x0]
+        obj = cp.Minimize(score)
+    else:
+        cons = [Y_ref @ lambdas >= score * y0, X_ref @ lambdas <= x0]
+        obj = cp.Maximize(score)
+    if rts == "VRS":
+        cons.append(cp.sum(lambdas) == 1)
+
+    return {
+        "problem": cp.Problem(obj, cons),
+        "constraints": cons,
+        "X_ref": X_ref,
+        "Y_ref": Y_ref,
+        "x0": x0,
+        "y0": y0,
+        "lambdas": lambdas,
+        "score": score,
+        "scales": (np.ones((m, 1)), np.ones((s, 1))),
+    }
+
+
+def _set_reference(compiled: dict, X_ref: np.ndarray, Y_ref: np.ndarray, rescale: bool = True) -> None:
+    """
+    Fija la referencia de un problema de ``_build_radial_problem``. Con
+    ``rescale`` cada input/output se divide por su media en la referencia; el
+    PL es equivalente y queda mejor condicionado.
+    """
+    m, s = X_ref.shape[0], Y_ref.shape[0]
+    sx, sy = _variable_scales(X_ref, Y_ref) if rescale else (np.ones((m, 1)), np.ones((s, 1)))
+    compiled["scales"] = (sx, sy)
+    compiled["X_ref"].value = X_ref * sx
+    compiled["Y_ref"].value = Y_ref * sy
+
+
+def _solve_radial_problem(
+    compiled: dict,
+    x0: np.ndarray,
+    y0: np.ndarray,
+    solver_preset: str | None = None,
+    stats: dict | None = None,
+) -> float:
+    """
+    Resuelve un problema de ``_build_radial_problem`` para la DMU ``(x0, y0)``
+    (en unidades originales; se escala como la referencia).
+    """
+    sx, sy = compiled["scales"]
+    compiled["x0"].value = x0 * sx
+    compiled["y0"].value = y0 * sy
+    prob = compiled["problem"]
+    try:
+        solve_lp(prob, solver_preset, score=lambda: compiled["score"].value, stats=stats)
+    except (cp.error.SolverError, Exception):
+        return np.nan
+    if prob.status in [cp.OPTIMAL, cp.OPTIMAL_INACCURATE] and compiled["score"].value is not None:
+        return float(compiled["score"].value)
+    return np.nan
+
+# ------------------------------------------------------------------
+# 1c. Generación de columnas para n grande
+# ------------------------------------------------------------------
+def _column_generation_core(
+    X: np.ndarray,
+    Y: np.ndarray,
+    rts: str = "CRS",
+    orientation: str = "input",
+    reference: np.ndarray | None = None,
+    initial_size: int = 64,
+    batch_size: int = 32,
+    tol: float = 1e-7,
+    compare_sample: int = 3,
+    stats: dict | None = None,
+    solver_preset: str | None = None,
+) -> np.ndarray:
+    """
+    Puntuaciones radiales por generación de columnas.
+
+    Cada DMU se resuelve sobre un conjunto de trabajo de DMUs de referencia
+    (más la propia DMU, que garantiza factibilidad). Con los duales del
+    maestro restringido, un único producto matricial da el coste reducido
+    ``v·x_j - u·y_j + w`` de todas las columnas; las ``batch_size`` más
+    negativas entran al conjunto y se vuelve a resolver hasta que ninguna
+    mejora. El conjunto de trabajo se comparte entre DMUs consecutivas, así
+    que tras las primeras suele contener ya la frontera relevante.
+
+    El PL compilado (DPP) tiene una capacidad fija de columnas; las libres se
+    rellenan con copias de la DMU evaluada y la capacidad se duplica cuando
+    hace falta. ``stats`` recibe tiempos, PL resueltos, rondas de precios y
+    memoria de la matriz de restricciones frente al PL completo (cuyo tiempo
+    se estima resolviendo ``compare_sample`` DMUs).
+    """
+    m, n = X.shape
+    s = Y.shape[0]
+    reference = np.arange(n) if reference is None else np.asarray(reference)
+    X_ref_all, Y_ref_all = X[:, reference], Y[:, reference]
+    eff = np.full(n, np.nan)
+
+    # Conjunto inicial: las DMUs con mejor cociente agregado output/input
+    proxy = (Y_ref_all / Y_ref_all.mean(axis=1, keepdims=True)).sum(axis=0) / \
+        (X_ref_all / X_ref_all.mean(axis=1, keepdims=True)).sum(axis=0)
+    working = list(np.argsort(-proxy, kind="stable")[:initial_size])  # posiciones en reference
+    in_working = np.zeros(len(reference), dtype=bool)
+    in_working[working] = True
+
+    capacity, compiled = 0, None
+    counters = {"lp_solves": 0, "pricing_rounds": 0, "columns_added": 0, "fallbacks": 0}
+    start = time.perf_counter()
+
+    for i in range(n):
+        while True:
+            if len(working) + 1 > capacity:
+                capacity = 1 << int(np.ceil(np.log2(len(working) + 1)))
+                compiled = _build_radial_problem(capacity, m, s, rts=rts, orientation=orientation)
+            cols = X_ref_all[:, working], Y_ref_all[:, working]
+            pad = capacity - len(working)
+            _set_reference(
+                compiled,
+                np.hstack([cols[0], np.repeat(X[:, [i]], pad, axis=1)]),
+                np.hstack([cols[1], np.repeat(Y[:, [i]], pad, axis=1)]),
+            )
+            score = _solve_radial_problem(compiled, X[:, [i]], Y[:, [i]], solver_preset, stats)
+            counters["lp_solves"] += 1
+            duals = _radial_duals(compiled, rts)
+            if np.isnan(score) or duals is None:
+                # Maestro sin solución fiable: PL completo para esta DMU
+                counters["fallbacks"] += 1
+                eff[i] = _score_full(X_ref_all, Y_ref_all, X[:, [i]], Y[:, [i]], rts, orientation, solver_preset)
+                break
+
+            u, v, w = duals
+            counters["pricing_rounds"] += 1
+            reduced = v @ X_ref_all - u @ Y_ref_all + w
+            reduced[in_working] = np.inf
+            candidates = np.flatnonzero(reduced < -tol)
+            if candidates.size == 0:
+                eff[i] = score
+                break
+            new = candidates[np.argsort(reduced[candidates], kind="stable")[:batch_size]]
+            working.extend(new.tolist())
+            in_working[new] = True
+            counters["columns_added"] += len(new)
+
+    elapsed = time.perf_counter() - start
+    if stats is not None:
+        sample = min(compare_sample, n)
+        t0 = time.perf_counter()
+        for i in range(sample):
+            _score_full(X_ref_all, Y_ref_all, X[:, [i]], Y[:, [i]], rts, orientation, solver_preset)
+        per_full = (time.perf_counter() - t0) / sample if sample else np.nan
+        stats.update({
+            "mode": "column_generation",
+            **counters,
+            "working_set_size": len(working),
+            "capacity": capacity,
+            "n_columns_full": len(reference),
+            "time_s": elapsed,
+            "full_lp_time_estimate_s": per_full * n,
+            "matrix_bytes": (m + s) * capacity * 8,
+            "matrix_bytes_full": (m + s) * len(reference) * 8,
+        })
     return eff
 
+
+def _radial_duals(compiled: dict, rts: str):
+    """
+    ``(u, v, w)`` del último PL resuelto de ``_build_radial_problem`` (en
+    unidades originales) o ``None``.
+    """
+    cons = compiled["constraints"]
+    if cons[0].dual_value is None or cons[1].dual_value is None:
+        return None
+    sx, sy = compiled["scales"]
+    u, v = np.ravel(cons[0].dual_value) * np.ravel(sy), np.ravel(cons[1].dual_value) * np.ravel(sx)
+    w = float(cons[2].dual_value) if rts == "VRS" and cons[2].dual_value is not None else 0.0
+    return u, v, w
+
+
+def _score_full(X_ref, Y_ref, x0, y0, rts, orientation, solver_preset=None) -> float:
+    """PL radial completo (no DPP) de una DMU frente a ``(X_ref, Y_ref)``."""
+    compiled = _build_radial_problem(X_ref.shape[1], X_ref.shape[0], Y_ref.shape[0], rts=rts, orientation=orientation)
+    _set_reference(compiled, X_ref, Y_ref)
+    return _solve_radial_problem(compiled, x0, y0, solver_preset)
+
+def _unique_plan(X: np.ndarray, Y: np.ndarray, prefilter_dominated: bool):
+    """
+    ``(first, members, reference)`` para resolver cada vector ``(x, y)`` una
+    sola vez: ``first[k]`` es la DMU que se resuelve, ``members[k]`` todas
+    las que comparten su vector y ``reference`` las columnas de referencia
+    (una por vector; las copias no cambian el PL).
+    """
+    first, inverse, counts = unique_columns(X, Y)
+    members = np.split(np.argsort(inverse, kind="stable"), np.cumsum(counts)[:-1])
+    reference = first[_reference_mask(X[:, first], Y[:, first], prefilter_dominated)]
+    return first, members, reference
+
+
+def _super_eff_reference(X, Y, first, rows):
+    """Referencia de supereficiencia: sin la propia DMU, salvo que tenga una gemela."""
+    others = first if len(rows) > 1 or len(first) == 1 else first[first != rows[0]]
+    return others.tolist(), X[:, others], Y[:, others]
+
+
+def _assign_peers(peer_rows, rows, ref_indices, lambdas, super_eff) -> None:
+    """Reparte los pares de un vector a todas sus DMUs (con ``super_eff`` nadie es su propio par)."""
+    for r in rows:
+        if super_eff and len(rows) > 1 and r == rows[0]:
+            peer_rows[r] = ([rows[1] if j == r else j for j in ref_indices], lambdas)
+        else:
+            peer_rows[r] = (ref_indices, lambdas)
+
+
+def _empty_certificate(n: int, m: int, s: int) -> dict:
+    """Arrays (``NaN``) para los datos de certificado de ``n`` PL radiales."""
+    return {"score": np.full(n, np.nan), "u": np.full((n, s), np.nan), "v": np.full((n, m), np.nan), "w": np.full(n, np.nan)}
+
+
+def _store_certificate(certificate, rows, score, output_cons, input_cons, convexity_cons=None, scales=None) -> None:
+    """
+    Guarda la puntuación sin redondear y los duales ``(u, v, w)`` del PL en las
+    filas ``rows``. Con ``scales=(sx, sy)`` (PL escalado) los duales se pasan a
+    las unidades originales.
+    """
+    sx, sy = scales if scales is not None else (1.0, 1.0)
+    certificate["score"][rows] = score
+    if output_cons.dual_value is not None and input_cons.dual_value is not None:
+        certificate["u"][rows] = np.ravel(output_cons.dual_value) * np.ravel(sy)
+        certificate["v"][rows] = np.ravel(input_cons.dual_value) * np.ravel(sx)
+        certificate["w"][rows] = 0.0
+        if convexity_cons is not None and convexity_cons.dual_value is not None:
+            certificate["w"][rows] = float(convexity_cons.dual_value)
+
+
 # ------------------------------------------------------------------
 # 2. Función interna que es utilizada por auto_tuner.py
 # ------------------------------------------------------------------
 def _run_dea_internal(
-    df: pd.DataFrame,
+    df: pd.DataFrame | DEAData,
     inputs: list[str],
     outputs: list[str],
     model: str = "CCR",
@@ -73,75 +414,131 @@ def _run_dea_internal(
     super_eff: bool = False,
     dmu_col_name: str = "DMU"
 ) -> pd.DataFrame:
-    df_num = df.copy()
-    validate_positive_dataframe(df_num, inputs + outputs)
+    data = as_dea_data(df, None, inputs, outputs)
+    if isinstance(df, DEAData):
+        dmu_ids = pd.Series(data.dmus, name=dmu_col_name)
+    else:
+        if dmu_col_name in df.columns:
+            dmu_ids = df[dmu_col_name].astype(str)
+        else:
+            dmu_ids = df.index.astype(str)
+            if dmu_ids.name is None:
+                dmu_ids.name = "DMU_Index"
 
-    X_data = df_num[inputs].to_numpy().T
-    Y_data = df_num[outputs].to_numpy().T
     rts_model = "CRS" if model.upper() == "CCR" else "VRS"
-    eff_scores = _dea_core(X_data, Y_data, rts=rts_model, orientation=orientation, super_eff=super_eff)
-
-    if dmu_col_name in df.columns:
-        dmu_ids = df[dmu_col_name].astype(str)
-    else:
-        dmu_ids = df.index.astype(str)
-        if dmu_ids.name is None:
-            dmu_ids.name = "DMU_Index"
+    key = spec_key(
+        frame_block(data, inputs, outputs), inputs, outputs, model, orientation, rts_model,
+        extra=("super_eff",) if super_eff else (),
+    )
+    eff_scores = get_cached(key)
+    solver_stats = {}
+    if eff_scores is None:
+        eff_scores = np.round(_dea_core(data.X, data.Y, rts=rts_model, orientation=orientation, super_eff=super_eff, prefilter_dominated=True, stats=solver_stats), 6)
+        store_cached(key, eff_scores)
 
-    return pd.DataFrame({
+    out = pd.DataFrame({
         dmu_col_name: dmu_ids,
         "efficiency": np.round(eff_scores, 6),
         "model": model.upper(),
         "orientation": orientation,
         "super_eff": bool(super_eff),
     })
+    if solver_stats:
+        out.attrs["solver_stats"] = solver_stats
+    return out
 
 # ------------------------------------------------------------------
 # 3. Función pública: run_ccr
 # ------------------------------------------------------------------
+def _run_ccr_key(data: DEAData, orientation="input", super_eff=False, prefilter_dominated=False,
+                 solver_preset=None, rescale=True) -> tuple:
+    """``(bloque, clave de caché)`` de una ejecución de :func:`run_ccr`; permite buscarla sin resolver."""
+    input_cols, output_cols = list(data.input_cols), list(data.output_cols)
+    block = frame_block(data, input_cols, output_cols)
+    key = spec_key(
+        block, input_cols, output_cols, "CCR", orientation, "CRS", solver_preset=resolve_preset(solver_preset),
+        extra=("run_ccr", data.dmu_column, labels_fingerprint(data.dmus), bool(super_eff), tuple(input_cols), tuple(output_cols), bool(prefilter_dominated), bool(rescale)),
+    )
+    return block, key
+
+
 def run_ccr(
-    df: pd.DataFrame,
-    dmu_column: str,
-    input_cols: list[str],
-    output_cols: list[str],
+    df: pd.DataFrame | DEAData,
+    dmu_column: str | None = None,
+    input_cols: list[str] | None = None,
+    output_cols: list[str] | None = None,
     orientation: str = "input", 
-    super_eff: bool = False
-) -> pd.DataFrame:
-    if dmu_column not in df.columns:
-        raise ValueError(f"La columna DMU '{dmu_column}' no existe en el DataFrame.")
-    validate_positive_dataframe(df.copy(), input_cols + output_cols)
+    super_eff: bool = False,
+    prefilter_dominated: bool = False,
+    compact: bool = False,
+    solver_preset: str | None = None,
+    rescale: bool = True,
+) -> pd.DataFrame | DEAResults:
+    """
+    Modelo CCR (CRS). Con ``prefilter_dominated=True`` las DMUs estrictamente
+    dominadas se excluyen del conjunto de referencia (PL más pequeños, mismas
+    eficiencias; sus lambdas aparecen como 0).
+
+    Con ``compact=True`` devuelve un :class:`DEAResults` (columnas planas y
+    matriz dispersa de pares); si no, la tabla clásica con diccionarios.
 
-    X = df[input_cols].to_numpy().T
-    Y = df[output_cols].to_numpy().T
-    dmus = df[dmu_column].astype(str).tolist()
+    ``solver_preset`` (``"fast"``, ``"balanced"``, ``"exact"``; por defecto
+    ``constants.DEFAULT_SOLVER_PRESET``) fija las tolerancias del solver. Los
+    atributos del resultado guardan el preset, los PL re-resueltos por
+    ``"fast"`` (``refined``) y los evitados por DMUs repetidas.
+
+    Con ``rescale`` (por defecto) los PL se construyen con cada input/output
+    dividido por su media; holguras, objetivos y duales se devuelven en las
+    unidades originales. ``solver_calls``, ``iterations`` y ``status_counts``
+    en los atributos permiten comparar ambas variantes (:func:`scaling_report`).
+    """
+    data = as_dea_data(df, dmu_column, input_cols, output_cols)
+    dmu_column, input_cols, output_cols = data.dmu_column, list(data.input_cols), list(data.output_cols)
+    dmus = data.dmus
+
+    solver_preset = resolve_preset(solver_preset)
+    block, key = _run_ccr_key(data, orientation, super_eff, prefilter_dominated, solver_preset, rescale)
+    cached = get_cached(key)
+    if isinstance(cached, DEAResults):
+        return cached if compact else cached.to_legacy()
+
+    X, Y = data.X, data.Y
     n, m, s = X.shape[1], X.shape[0], Y.shape[0]
-    
-    resultados = []
-    for i in range(n):
+    first, members, reference = _unique_plan(X, Y, prefilter_dominated and not super_eff)
+    full_ref = (reference.tolist(), X[:, reference], Y[:, reference])
+    sx, sy = _variable_scales(X, Y) if rescale else (np.ones((m, 1)), np.ones((s, 1)))
+
+    eff = np.full(n, np.nan)
+    slacks_in, slacks_out = np.full((n, m), np.nan), np.full((n, s), np.nan)
+    targets_in, targets_out = np.full((n, m), np.nan), np.full((n, s), np.nan)
+    peer_rows = [([], [])] * n
+    solver_stats = {"refined": 0, "solver_calls": 0, "iterations": 0, "status_counts": {}}
+    certificate = _empty_certificate(n, m, s)
+    for k, i in enumerate(first):
         x0, y0 = X[:, [i]], Y[:, [i]]
+        rows = members[k]
 
-        ref_indices, X_ref, Y_ref, dmus_ref = (
-            (list(range(n)), X, Y, dmus) 
-            if not super_eff or n == 1 
-            else ([j for j, v in enumerate(np.arange(n) != i) if v], X[:, np.arange(n) != i], Y[:, np.arange(n) != i], [d for j, d in enumerate(dmus) if j != i])
-        )
+        ref_indices, X_ref, Y_ref = _super_eff_reference(X, Y, first, rows) if super_eff else full_ref
         
         lambdas_var = cp.Variable((len(ref_indices), 1), nonneg=True)
 
         if orientation == "input":
             theta = cp.Variable()
             obj = cp.Minimize(theta)
-            cons = [X_ref @ lambdas_var <= theta * x0, Y_ref @ lambdas_var >= y0]
+            cons = [(X_ref * sx) @ lambdas_var <= theta * (x0 * sx), (Y_ref * sy) @ lambdas_var >= y0 * sy]
         else: # output
             phi = cp.Variable()
             obj = cp.Maximize(phi)
-            cons = [X_ref @ lambdas_var <= x0, Y_ref @ lambdas_var >= phi * y0]
+            cons = [(X_ref * sx) @ lambdas_var <= x0 * sx, (Y_ref * sy) @ lambdas_var >= phi * (y0 * sy)]
             
         prob = cp.Problem(obj, cons)
-        prob.solve(solver=cp.ECOS, abstol=1e-7, reltol=1e-7, feastol=1e-7, verbose=False)
+        try:
+            solve_lp(prob, solver_preset, score=lambda: obj.value, stats=solver_stats)
+        except cp.error.SolverError:
+            # Queda sin solución (NaN), como en _dea_core; status_counts lo registra
+            continue
 
         if prob.status not in [cp.OPTIMAL, cp.OPTIMAL_INACCURATE] or obj.value is None:
-             resultados.append({dmu_column: dmus[i], "tec_efficiency_ccr": np.nan, "lambda_vector": {},"slacks_inputs": {col: np.nan for col in input_cols},"slacks_outputs": {col: np.nan for col in output_cols}, "rts_label": "CRS"})
              continue
 
         eff_val = float(obj.value)
@@ -157,51 +554,103 @@ def run_ccr(
         slacks_in_vals[slacks_in_vals < 1e-9] = 0
         slacks_out_vals[slacks_out_vals < 1e-9] = 0
 
-        resultados.append({
-            dmu_column: dmus[i],
-            "tec_efficiency_ccr": np.round(1/eff_val if orientation=='output' else eff_val, 6),
-            "lambda_vector": {dmus_ref[j]: float(v) for j, v in enumerate(lambdas_opt.flatten())},
-            "slacks_inputs": {input_cols[k]: float(v) for k, v in enumerate(slacks_in_vals.flatten())},
-            "slacks_outputs": {output_cols[r]: float(v) for r, v in enumerate(slacks_out_vals.flatten())},
-            "rts_label": "CRS"
-        })
-    return pd.DataFrame(resultados)
+        eff[rows] = np.round(1/eff_val if orientation=='output' else eff_val, 6)
+        _store_certificate(certificate, rows, eff_val, cons[1], cons[0], scales=(sx, sy))
+        slacks_in[rows], slacks_out[rows] = slacks_in_vals.ravel(), slacks_out_vals.ravel()
+        targets_in[rows], targets_out[rows] = (X_ref @ lambdas_opt).ravel(), (Y_ref @ lambdas_opt).ravel()
+        _assign_peers(peer_rows, rows, ref_indices, lambdas_opt.ravel(), super_eff)
+
+    res = build_results(
+        dmus, dmu_column, input_cols, output_cols,
+        {"tec_efficiency_ccr": eff, "rts_label": "CRS"},
+        slacks_in, slacks_out, targets_in, targets_out, peer_rows,
+        efficiency_column="tec_efficiency_ccr", super_eff=super_eff, certificate=certificate,
+        legacy_columns=[dmu_column, "tec_efficiency_ccr", "lambda_vector", "slacks_inputs", "slacks_outputs", "rts_label"],
+    )
+    res.frame.attrs.update({
+        "solves_avoided": int(n - len(first)),
+        "solver_preset": solver_preset,
+        "refined": solver_stats["refined"],
+        "rescaled": bool(rescale),
+        "solver_calls": solver_stats["solver_calls"],
+        "iterations": solver_stats["iterations"],
+        "status_counts": dict(solver_stats["status_counts"]),
+    })
+    store_cached(key, res)
+    if orientation == "input" and not super_eff:
+        # Mismo vector que calcularía el auto-tuner para esta especificación
+        store_cached(spec_key(block, input_cols, output_cols, "CCR", "input", "CRS", solver_preset=solver_preset), eff)
+    return res if compact else res.to_legacy()
 
 
 # ------------------------------------------------------------------
 # 4. Función pública: run_bcc
 # ------------------------------------------------------------------
 def run_bcc(
-    df: pd.DataFrame,
-    dmu_column: str,
-    input_cols: list[str],
-    output_cols: list[str],
-    df_ccr_results: pd.DataFrame,
+    df: pd.DataFrame | DEAData,
+    dmu_column: str | None = None,
+    input_cols: list[str] | None = None,
+    output_cols: list[str] | None = None,
+    df_ccr_results: pd.DataFrame | DEAResults = None,
     orientation: str = "input",
     super_eff: bool = False,
-) -> pd.DataFrame:
+    prefilter_dominated: bool = False,
+    compact: bool = False,
+    solver_preset: str | None = None,
+    rescale: bool = True,
+) -> pd.DataFrame | DEAResults:
+    """
+    Modelo BCC (VRS). ``prefilter_dominated``, ``compact``, ``solver_preset``
+    y ``rescale`` como en :func:`run_ccr`; ``df_ccr_results`` puede ser la tabla o el
+    :class:`DEAResults` de ``run_ccr``.
+    """
     if df_ccr_results is None:
         print("--- DEBUG: `run_bcc` recibió `df_ccr_results` como None. Abortando BCC. ---")
         return pd.DataFrame() # Devolver un DF vacío en lugar de None
+    if isinstance(df_ccr_results, DEAResults):
+        df_ccr_results = df_ccr_results.frame
 
-    if dmu_column not in df.columns:
-        raise ValueError(f"La columna DMU '{dmu_column}' no existe en el DataFrame.")
-    validate_positive_dataframe(df.copy(), input_cols + output_cols)
+    data = as_dea_data(df, dmu_column, input_cols, output_cols)
+    dmu_column, input_cols, output_cols = data.dmu_column, list(data.input_cols), list(data.output_cols)
+    dmus = data.dmus
 
-    X = df[input_cols].to_numpy().T
-    Y = df[output_cols].to_numpy().T
-    dmus = df[dmu_column].astype(str).tolist()
+    block = frame_block(data, input_cols, output_cols)
+    ccr_part = df_ccr_results[[dmu_column, "tec_efficiency_ccr"]] if "tec_efficiency_ccr" in df_ccr_results.columns else df_ccr_results[[dmu_column]]
+    solver_preset = resolve_preset(solver_preset)
+    key = spec_key(
+        block, input_cols, output_cols, "BCC", orientation, "VRS", solver_preset=solver_preset,
+        extra=(
+            "run_bcc", dmu_column, labels_fingerprint(dmus), bool(super_eff), tuple(input_cols), tuple(output_cols), bool(prefilter_dominated), bool(rescale),
+            labels_fingerprint(ccr_part[dmu_column]), data_fingerprint(ccr_part.iloc[:, 1:].to_numpy(dtype=float)),
+        ),
+    )
+    cached = get_cached(key)
+    if isinstance(cached, DEAResults):
+        return cached if compact else cached.to_legacy()
+
+    X, Y = data.X, data.Y
     n, m, s = X.shape[1], X.shape[0], Y.shape[0]
-    
-    registros = []
-    for i in range(n):
+    first, members, reference = _unique_plan(X, Y, prefilter_dominated and not super_eff)
+    full_ref = (reference.tolist(), X[:, reference], Y[:, reference])
+    sx, sy = _variable_scales(X, Y) if rescale else (np.ones((m, 1)), np.ones((s, 1)))
+    ccr_lookup = (
+        ccr_part.drop_duplicates(dmu_column).set_index(dmu_column)["tec_efficiency_ccr"].to_dict()
+        if "tec_efficiency_ccr" in ccr_part.columns else {}
+    )
+
+    eff = np.full(n, np.nan)
+    scale = np.full(n, np.nan)
+    rts_labels = ["Error"] * n
+    slacks_in, slacks_out = np.full((n, m), np.nan), np.full((n, s), np.nan)
+    targets_in, targets_out = np.full((n, m), np.nan), np.full((n, s), np.nan)
+    peer_rows = [([], [])] * n
+    solver_stats = {"refined": 0, "solver_calls": 0, "iterations": 0, "status_counts": {}}
+    certificate = _empty_certificate(n, m, s)
+    for k, i in enumerate(first):
         x0, y0 = X[:, [i]], Y[:, [i]]
+        rows = members[k]
 
-        ref_indices, X_ref, Y_ref, dmus_ref = (
-            (list(range(n)), X, Y, dmus) 
-            if not super_eff or n == 1
-            else ([j for j, v in enumerate(np.arange(n) != i) if v], X[:, np.arange(n) != i], Y[:, np.arange(n) != i], [d for j, d in enumerate(dmus) if j != i])
-        )
+        ref_indices, X_ref, Y_ref = _super_eff_reference(X, Y, first, rows) if super_eff else full_ref
         
         lambdas_var = cp.Variable((len(ref_indices), 1), nonneg=True)
         convexity_constraint = cp.sum(lambdas_var) == 1
@@ -209,26 +658,25 @@ def run_bcc(
         if orientation == "input":
             theta = cp.Variable()
             obj = cp.Minimize(theta)
-            cons = [X_ref @ lambdas_var <= theta * x0, Y_ref @ lambdas_var >= y0, convexity_constraint]
+            cons = [(X_ref * sx) @ lambdas_var <= theta * (x0 * sx), (Y_ref * sy) @ lambdas_var >= y0 * sy, convexity_constraint]
         else:
             phi = cp.Variable()
             obj = cp.Maximize(phi)
-            cons = [X_ref @ lambdas_var <= x0, Y_ref @ lambdas_var >= phi * y0, convexity_constraint]
+            cons = [(X_ref * sx) @ lambdas_var <= x0 * sx, (Y_ref * sy) @ lambdas_var >= phi * (y0 * sy), convexity_constraint]
 
         prob = cp.Problem(obj, cons)
-        prob.solve(solver=cp.ECOS, abstol=1e-7, reltol=1e-7, feastol=1e-7, verbose=False)
+        try:
+            solve_lp(prob, solver_preset, score=lambda: obj.value, stats=solver_stats)
+        except cp.error.SolverError:
+            # Queda sin solución (NaN), como en _dea_core; status_counts lo registra
+            continue
 
         if prob.status not in [cp.OPTIMAL, cp.OPTIMAL_INACCURATE] or obj.value is None:
-            registros.append({dmu_column: dmus[i], "efficiency": np.nan, "model": "BCC", "orientation": orientation, "super_eff": bool(super_eff), "lambda_vector": {}, "slacks_inputs": {col: np.nan for col in input_cols},"slacks_outputs": {col: np.nan for col in output_cols}, "scale_efficiency": np.nan, "rts_label": "Error"})
             continue
 
         eff_val = float(obj.value)
         bcc_eff = 1/eff_val if orientation == 'output' else eff_val
         lambdas_opt = lambdas_var.value if lambdas_var.value is not None else np.zeros((len(ref_indices), 1))
-        
-        ccr_eff_series = df_ccr_results.loc[df_ccr_results[dmu_column] == dmus[i], "tec_efficiency_ccr"]
-        ccr_eff = ccr_eff_series.iloc[0] if not ccr_eff_series.empty else np.nan
-        scale_eff = (ccr_eff / bcc_eff) if not np.isnan(bcc_eff) and not np.isnan(ccr_eff) and bcc_eff != 0 else np.nan
 
         if orientation == "input":
             slacks_in_vals = (eff_val * x0) - (X_ref @ lambdas_opt)
@@ -247,12 +695,83 @@ def run_bcc(
             elif dual_val < 0: rts_label = "IRS"
             else: rts_label = "DRS"
         
-        registros.append({
-            dmu_column: dmus[i], "efficiency": np.round(bcc_eff, 6), "model": "BCC", "orientation": orientation, "super_eff": bool(super_eff),
-            "lambda_vector": {dmus_ref[j]: float(v) for j, v in enumerate(lambdas_opt.flatten())},
-            "slacks_inputs": {input_cols[k]: float(v) for k, v in enumerate(slacks_in_vals.flatten())},
-            "slacks_outputs": {output_cols[r]: float(v) for r, v in enumerate(slacks_out_vals.flatten())},
-            "scale_efficiency": np.round(scale_eff, 6) if not np.isnan(scale_eff) else np.nan,
-            "rts_label": rts_label
+        eff[rows] = np.round(bcc_eff, 6)
+        _store_certificate(certificate, rows, eff_val, cons[1], cons[0], convexity_constraint, scales=(sx, sy))
+        for r in rows:
+            # La eficiencia CCR se busca por etiqueta, así que se calcula por DMU
+            ccr_eff = ccr_lookup.get(dmus[r], np.nan)
+            scale_eff = (ccr_eff / bcc_eff) if not np.isnan(bcc_eff) and not np.isnan(ccr_eff) and bcc_eff != 0 else np.nan
+            scale[r] = np.round(scale_eff, 6) if not np.isnan(scale_eff) else np.nan
+            rts_labels[r] = rts_label
+        slacks_in[rows], slacks_out[rows] = slacks_in_vals.ravel(), slacks_out_vals.ravel()
+        targets_in[rows], targets_out[rows] = (X_ref @ lambdas_opt).ravel(), (Y_ref @ lambdas_opt).ravel()
+        _assign_peers(peer_rows, rows, ref_indices, lambdas_opt.ravel(), super_eff)
+
+    res = build_results(
+        dmus, dmu_column, input_cols, output_cols,
+        {"efficiency": eff, "model": "BCC", "orientation": orientation, "super_eff": bool(super_eff),
+         "scale_efficiency": scale, "rts_label": rts_labels},
+        slacks_in, slacks_out, targets_in, targets_out, peer_rows,
+        efficiency_column="efficiency", super_eff=super_eff, certificate=certificate,
+        legacy_columns=[dmu_column, "efficiency", "model", "orientation", "super_eff", "lambda_vector",
+                        "slacks_inputs", "slacks_outputs", "scale_efficiency", "rts_label"],
+    )
+    res.frame.attrs.update({
+        "solves_avoided": int(n - len(first)),
+        "solver_preset": solver_preset,
+        "refined": solver_stats["refined"],
+        "rescaled": bool(rescale),
+        "solver_calls": solver_stats["solver_calls"],
+        "iterations": solver_stats["iterations"],
+        "status_counts": dict(solver_stats["status_counts"]),
+    })
+    store_cached(key, res)
+    if orientation == "input" and not super_eff:
+        store_cached(spec_key(block, input_cols, output_cols, "BCC", "input", "VRS", solver_preset=solver_preset), eff)
+    return res if compact else res.to_legacy()
+
+
+# ------------------------------------------------------------------
+# 5. Diagnóstico del escalado
+# ------------------------------------------------------------------
+def scaling_report(
+    df: pd.DataFrame | DEAData,
+    dmu_column: str | None = None,
+    input_cols: list[str] | None = None,
+    output_cols: list[str] | None = None,
+    model: str = "CCR",
+    orientation: str = "input",
+    solver_preset: str | None = None,
+) -> pd.DataFrame:
+    """
+    Ejecuta ``run_ccr``/``run_bcc`` con y sin ``rescale`` y compara el
+    esfuerzo del solver: llamadas a ECOS, iteraciones (total y por llamada),
+    PL re-resueltos y un recuento por estado final. ``max_abs_diff`` es la
+    mayor diferencia de eficiencia frente a la variante sin escalar.
+    """
+    model = model.upper()
+    if model not in ("CCR", "BCC"):
+        raise ValueError("model debe ser 'CCR' o 'BCC'.")
+    data = as_dea_data(df, dmu_column, input_cols, output_cols)
+    rows, effs = [], {}
+    for rescale in (False, True):
+        ccr = run_ccr(data, orientation=orientation, compact=True, solver_preset=solver_preset, rescale=rescale)
+        res = ccr if model == "CCR" else run_bcc(
+            data, df_ccr_results=ccr, orientation=orientation, compact=True,
+            solver_preset=solver_preset, rescale=rescale,
+        )
+        attrs = res.frame.attrs
+        effs[rescale] = res.frame[res.efficiency_column].to_numpy(dtype=float)
+        rows.append({
+            "rescaled": rescale,
+            "solver_calls": attrs["solver_calls"],
+            "iterations": attrs["iterations"],
+            "iterations_per_call": attrs["iterations"] / attrs["solver_calls"] if attrs["solver_calls"] else np.nan,
+            "refined": attrs["refined"],
+            "max_abs_diff": float(np.nanmax(np.abs(effs[rescale] - effs[False]), initial=0.0)),
+            **{f"status_{k}": v for k, v in attrs["status_counts"].items()},
         })
-    return pd.DataFrame(registros)
+    report = pd.DataFrame(rows).set_index("rescaled")
+    status_cols = [c for c in report.columns if c.startswith("status_")]
+    report[status_cols] = report[status_cols].fillna(0).astype(int)
+    return report
@@ -0,0 +1,189 @@
+# src/dea_models/results.py
+
+"""
+Resultados DEA en formato columnar compacto.
+
+En lugar de guardar diccionarios de Python en cada celda (``lambda_vector``,
+``slacks_inputs``, ``slacks_outputs``), :class:`DEAResults` separa:
+
+- ``frame``: DataFrame plano, solo con columnas escalares. Las holguras van en
+  ``slack_in__<col>`` / ``slack_out__<col>`` y los objetivos (proyección sobre
+  la frontera, ``X·λ`` e ``Y·λ``) en ``target_in__<col>`` / ``target_out__<col>``.
+- ``peers``: matriz dispersa CSR ``(n, n)`` con las lambdas; la fila ``i``
+  contiene los pesos de las DMUs de referencia de la DMU ``i``.
+
+``to_legacy()`` reconstruye la tabla con diccionarios que devolvían
+``run_ccr`` y ``run_bcc``.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+SLACK_IN = "slack_in__"
+SLACK_OUT = "slack_out__"
+TARGET_IN = "target_in__"
+TARGET_OUT = "target_out__"
+PEER_TOL = 1e-9
+
+
+class DEAResults:
+    """
+    Resultado de un modelo radial.
+
+    Atributos
+    ---------
+    frame : pd.DataFrame
+        Una fila por DMU con columnas escalares (ver el docstring del módulo).
+    peers : scipy.sparse.csr_matrix
+        Lambdas ``(n, n)``; columnas en el orden de ``dmus``.
+    dmu_column : str
+    input_cols, output_cols : list[str]
+    efficiency_column : str
+        Columna de eficiencia (``tec_efficiency_ccr`` o ``efficiency``).
+    super_eff : bool
+        Si la DMU evaluada estaba excluida de su propia referencia.
+    legacy_columns : list[str]
+        Orden de columnas de la tabla clásica.
+    certificate : dict | None
+        Datos para verificar la optimalidad sin volver a resolver (ver
+        :mod:`dea_models.certificates`): ``score`` (``theta`` o ``phi`` sin
+        redondear) y los duales ``u`` ``(n, s)``, ``v`` ``(n, m)`` y ``w``
+        ``(n,)`` de cada PL.
+    """
+
+    certificate = None  # resultados guardados antes de existir el atributo
+
+    def __init__(
+        self,
+        frame: pd.DataFrame,
+        peers: sparse.csr_matrix,
+        dmu_column: str,
+        input_cols: list[str],
+        output_cols: list[str],
+        efficiency_column: str,
+        super_eff: bool = False,
+        legacy_columns: list[str] | None = None,
+        certificate: dict | None = None,
+    ):
+        self.frame = frame
+        self.peers = peers
+        self.dmu_column = dmu_column
+        self.input_cols = list(input_cols)
+        self.output_cols = list(output_cols)
+        self.efficiency_column = efficiency_column
+        self.super_eff = bool(super_eff)
+        self.legacy_columns = legacy_columns
+        self.certificate = certificate
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def __repr__(self) -> str:
+        return (f"DEAResults(n={len(self)}, efficiency_column={self.efficiency_column!r}, "
+                f"peers_nnz={self.peers.nnz})")
+
+    @property
+    def dmus(self) -> list:
+        return self.frame[self.dmu_column].tolist()
+
+    def slacks(self, kind: str = "in") -> pd.DataFrame:
+        """Holguras de inputs (``"in"``) u outputs (``"out"``) con las columnas originales."""
+        prefix, cols = (SLACK_IN, self.input_cols) if kind == "in" else (SLACK_OUT, self.output_cols)
+        return self.frame[[prefix + c for c in cols]].set_axis(cols, axis=1)
+
+    def targets(self, kind: str = "in") -> pd.DataFrame:
+        """Objetivos de inputs (``"in"``) u outputs (``"out"``) con las columnas originales."""
+        prefix, cols = (TARGET_IN, self.input_cols) if kind == "in" else (TARGET_OUT, self.output_cols)
+        return self.frame[[prefix + c for c in cols]].set_axis(cols, axis=1)
+
+    def peers_frame(self) -> pd.DataFrame:
+        """Formato largo ``(dmu, peer, lambda)`` con las lambdas no nulas."""
+        coo = self.peers.tocoo()
+        dmus = np.asarray(self.dmus, dtype=object)
+        return pd.DataFrame({
+            self.dmu_column: dmus[coo.row],
+            "peer": dmus[coo.col],
+            "lambda": coo.data,
+        })
+
+    def to_legacy(self) -> pd.DataFrame:
+        """
+        Tabla clásica: ``lambda_vector`` (todas las DMUs de referencia, con
+        ceros), ``slacks_inputs`` y ``slacks_outputs`` como diccionarios. Las
+        DMUs sin solución llevan ``{}`` y holguras ``NaN``.
+        """
+        dmus = self.dmus
+        n = len(dmus)
+        ok = self.frame[self.efficiency_column].notna().to_numpy()
+        s_in = self.frame[[SLACK_IN + c for c in self.input_cols]].to_numpy(dtype=float)
+        s_out = self.frame[[SLACK_OUT + c for c in self.output_cols]].to_numpy(dtype=float)
+        peers = self.peers.tocsr()
+
+        lambda_vectors = []
+        for i in range(n):
+            if not ok[i]:
+                lambda_vectors.append({})
+                continue
+            row = np.zeros(n)
+            start, end = peers.indptr[i], peers.indptr[i + 1]
+            row[peers.indices[start:end]] = peers.data[start:end]
+            lambda_vectors.append({
+                dmus[j]: float(row[j]) for j in range(n) if not (self.super_eff and j == i)
+            })
+
+        out = self.frame.drop(columns=[
+            c for c in self.frame.columns if c.startswith((SLACK_IN, SLACK_OUT, TARGET_IN, TARGET_OUT))
+        ])
+        out["lambda_vector"] = lambda_vectors
+        out["slacks_inputs"] = [dict(zip(self.input_cols, map(float, r))) for r in s_in]
+        out["slacks_outputs"] = [dict(zip(self.output_cols, map(float, r))) for r in s_out]
+        if self.legacy_columns is not None:
+            out = out[self.legacy_columns]
+        return out
+
+
+def build_results(
+    dmus: list,
+    dmu_column: str,
+    input_cols: list[str],
+    output_cols: list[str],
+    columns: dict,
+    slacks_in: np.ndarray,
+    slacks_out: np.ndarray,
+    targets_in: np.ndarray,
+    targets_out: np.ndarray,
+    peer_rows: list,
+    efficiency_column: str,
+    super_eff: bool = False,
+    legacy_columns: list[str] | None = None,
+    certificate: dict | None = None,
+) -> DEAResults:
+    """
+    Ensambla un :class:`DEAResults` a partir de los arrays de un modelo.
+
+    ``columns`` son las columnas escalares (eficiencia, etiquetas...) en orden;
+    ``slacks_*``/``targets_*`` son ``(n, m)`` y ``(n, s)``; ``peer_rows[i]`` es
+    ``(índices, valores)`` de las lambdas de la DMU ``i``; las lambdas por
+    debajo de ``PEER_TOL`` se guardan como 0.
+    """
+    n = len(dmus)
+    data = {dmu_column: dmus}
+    data.update({k: v for k, v in columns.items() if k not in ("rts_label",)})
+    data.update({SLACK_IN + c: slacks_in[:, k] for k, c in enumerate(input_cols)})
+    data.update({SLACK_OUT + c: slacks_out[:, r] for r, c in enumerate(output_cols)})
+    data.update({TARGET_IN + c: targets_in[:, k] for k, c in enumerate(input_cols)})
+    data.update({TARGET_OUT + c: targets_out[:, r] for r, c in enumerate(output_cols)})
+    if "rts_label" in columns:
+        data["rts_label"] = columns["rts_label"]
+    frame = pd.DataFrame(data)
+
+    counts = [len(idx) for idx, _ in peer_rows]
+    indptr = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+    indices = np.concatenate([np.asarray(idx, dtype=np.int64) for idx, _ in peer_rows]) if n else np.zeros(0, dtype=np.int64)
+    values = np.concatenate([np.asarray(v, dtype=float) for _, v in peer_rows]) if n else np.zeros(0)
+    values = np.where(values < PEER_TOL, 0.0, values)  # ruido del punto interior, como en las holguras
+    peers = sparse.csr_matrix((values, indices, indptr), shape=(n, n))
+    peers.eliminate_zeros()
+
+    return DEAResults(frame, peers, dmu_column, input_cols, output_cols, efficiency_column, super_eff, legacy_columns, certificate)
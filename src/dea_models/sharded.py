@@ -0,0 +1,224 @@
+# src/dea_models/sharded.py
+
+"""
+DEA radial repartido en fragmentos (*frontera de fronteras*).
+
+Las DMUs de la frontera global de un fragmento siguen en la frontera local
+de ese fragmento, así que la unión de los candidatos locales
+(:func:`~dea_models.frontier.candidate_mask`) genera la misma tecnología
+que todos los datos:
+
+1. Cada trabajador recibe su fragmento y calcula sus candidatos locales
+   (todos en paralelo).
+2. El coordinador une los candidatos, los vuelve a cribar y difunde la
+   frontera global.
+3. Cada trabajador puntúa su fragmento contra ella
+   (:class:`~dea_models.frontier.Frontier`).
+
+Los trabajadores hablan un protocolo mínimo sobre TCP con
+``multiprocessing.connection`` (mensajes ``(orden, *args)``; respuestas
+``("ok", datos)`` o ``("error", mensaje)``), autenticado con ``authkey``.
+:func:`start_local_workers` los lanza como procesos locales; en otras
+máquinas basta con ejecutar :func:`serve_worker` con la misma clave.
+
+Los mensajes se deserializan con pickle, así que la clave es obligatoria y
+no puede estar vacía (una clave vacía desactiva el desafío HMAC). Para
+escuchar fuera de ``127.0.0.1`` usa una clave secreta y aleatoria (p. ej.
+``os.urandom(32)``) compartida por un canal seguro y limita el acceso al
+puerto a las máquinas del clúster.
+"""
+
+import multiprocessing as mp
+import os
+from multiprocessing.connection import Client, Listener
+
+import numpy as np
+import pandas as pd
+
+from .constants import SCREEN_TOLERANCE
+from .data import DEAData, as_dea_data
+from .frontier import Frontier, candidate_mask
+from .parallel import resolve_n_jobs
+
+
+def serve_worker(address=("127.0.0.1", 0), *, authkey: bytes, ready=None) -> None:
+    """
+    Atiende conexiones del coordinador hasta recibir ``("shutdown",)``.
+    ``authkey`` es obligatoria (``ValueError`` si está vacía); ``ready`` (un
+    extremo de ``Pipe``) recibe la dirección real de escucha.
+
+    Órdenes: ``("load", X, Y, labels)``, ``("frontier", rts, tol)`` →
+    ``(X_c, Y_c, labels_c)``, ``("score", X_ref, Y_ref, labels, input_cols,
+    output_cols, rts, orientation)`` → eficiencias del fragmento, ``("close",)`` y
+    ``("shutdown",)``.
+    """
+    _check_authkey(authkey)
+    with Listener(address, authkey=authkey) as listener:
+        if ready is not None:
+            ready.send(listener.address)
+            ready.close()
+        running = True
+        while running:
+            with listener.accept() as conn:
+                shard = None
+                while True:
+                    try:
+                        message = conn.recv()
+                    except EOFError:
+                        break
+                    command, args = message[0], message[1:]
+                    if command == "close":
+                        break
+                    if command == "shutdown":
+                        running = False
+                        break
+                    try:
+                        if command == "load":
+                            shard = args
+                            conn.send(("ok", len(args[2])))
+                        elif command == "frontier":
+                            X, Y, labels = shard
+                            keep = candidate_mask(X, Y, args[0], screen=True, tol=args[1])
+                            conn.send(("ok", (X[:, keep], Y[:, keep], [l for l, k in zip(labels, keep) if k])))
+                        elif command == "score":
+                            X, Y, _ = shard
+                            frontier = Frontier(*args[:5], rts=args[5], orientation=args[6])
+                            conn.send(("ok", frontier.score(X, Y)))
+                        else:
+                            conn.send(("error", f"Orden desconocida: {command!r}"))
+                    except Exception as exc:  # el coordinador decide qué hacer
+                        conn.send(("error", f"{type(exc).__name__}: {exc}"))
+
+
+def start_local_workers(n_workers: int, authkey: bytes) -> tuple[list, list]:
+    """Lanza ``n_workers`` trabajadores locales. Devuelve ``(procesos, direcciones)``."""
+    _check_authkey(authkey)
+    processes, addresses = [], []
+    for _ in range(n_workers):
+        parent, child = mp.Pipe(duplex=False)
+        proc = mp.Process(
+            target=serve_worker, args=(("127.0.0.1", 0),), kwargs={"authkey": authkey, "ready": child}, daemon=True,
+        )
+        proc.start()
+        child.close()
+        addresses.append(parent.recv())
+        parent.close()
+        processes.append(proc)
+    return processes, addresses
+
+
+def stop_workers(addresses: list, authkey: bytes) -> None:
+    """Envía ``("shutdown",)`` a cada trabajador."""
+    for address in addresses:
+        with Client(address, authkey=authkey) as conn:
+            conn.send(("shutdown",))
+
+
+def run_sharded_dea(
+    df: pd.DataFrame | DEAData,
+    dmu_column: str | None = None,
+    input_cols: list[str] | None = None,
+    output_cols: list[str] | None = None,
+    rts: str = "CRS",
+    orientation: str = "input",
+    workers: list | None = None,
+    authkey: bytes | None = None,
+    n_shards: int | None = None,
+    tol: float = SCREEN_TOLERANCE,
+) -> pd.DataFrame:
+    """
+    Eficiencia radial (``theta`` o ``1/phi``, como ``run_ccr``/``run_bcc``)
+    calculada por fragmentos. ``workers`` son direcciones ``(host, puerto)``
+    de trabajadores ya en marcha (con ``authkey``); sin ellas se lanzan
+    ``n_shards`` procesos locales (por defecto, uno por núcleo) que se
+    detienen al terminar.
+
+    ``tol`` es el margen de los cribados local y global
+    (:func:`~dea_models.frontier.candidate_mask`).
+
+    ``df.attrs["sharding"]`` guarda el número de fragmentos, el tamaño de
+    cada frontera local y el de la global.
+    """
+    if rts not in ("CRS", "VRS"):
+        raise ValueError("rts debe ser 'CRS' o 'VRS'.")
+    if orientation not in ("input", "output"):
+        raise ValueError("orientation debe ser 'input' u 'output'.")
+    data = as_dea_data(df, dmu_column, input_cols, output_cols)
+
+    processes = []
+    if workers is None:
+        authkey = authkey or os.urandom(32)
+        n_shards = max(1, min(n_shards or resolve_n_jobs(-1), len(data)))
+        processes, workers = start_local_workers(n_shards, authkey)
+    else:
+        _check_authkey(authkey)
+    shards = [s for s in np.array_split(np.arange(len(data)), len(workers)) if len(s)]
+    labels = list(data.dmus)
+
+    conns = [Client(address, authkey=authkey) for address in workers[:len(shards)]]
+    try:
+        # 1) Reparto y fronteras locales (todas en paralelo)
+        for conn, idx in zip(conns, shards):
+            conn.send(("load", data.X[:, idx], data.Y[:, idx], [labels[i] for i in idx]))
+        _gather(conns)
+        for conn in conns:
+            conn.send(("frontier", rts, tol))
+        local = _gather(conns)
+
+        # 2) Frontera global a partir de la unión de candidatos
+        X_c = np.hstack([f[0] for f in local])
+        Y_c = np.hstack([f[1] for f in local])
+        labels_c = [l for f in local for l in f[2]]
+        keep = candidate_mask(X_c, Y_c, rts, screen=True, tol=tol)
+        X_ref, Y_ref = X_c[:, keep], Y_c[:, keep]
+        reference = [l for l, k in zip(labels_c, keep) if k]
+
+        # 3) Puntuación final de cada fragmento
+        for conn in conns:
+            conn.send(("score", X_ref, Y_ref, reference, data.input_cols, data.output_cols, rts, orientation))
+        scores = _gather(conns)
+    finally:
+        for conn in conns:
+            try:
+                conn.send(("close",))
+            except OSError:
+                pass
+            conn.close()
+        if processes:
+            stop_workers(workers, authkey)
+            for proc in processes:
+                proc.join()
+
+    efficiency = np.empty(len(data))
+    for idx, part in zip(shards, scores):
+        efficiency[idx] = part
+    out = pd.DataFrame({
+        data.dmu_column: labels,
+        "efficiency": np.round(efficiency, 6),
+        "model": "CCR" if rts == "CRS" else "BCC",
+        "orientation": orientation,
+    })
+    out.attrs["sharding"] = {
+        "n_shards": len(shards),
+        "local_frontier_sizes": [len(f[2]) for f in local],
+        "n_reference": len(reference),
+        "reference_dmus": reference,
+    }
+    return out
+
+
+def _check_authkey(authkey) -> None:
+    """Una clave vacía desactiva la autenticación de ``multiprocessing.connection``."""
+    if not authkey:
+        raise ValueError("authkey es obligatoria y no puede estar vacía (usa p. ej. os.urandom(32)).")
+    if not isinstance(authkey, bytes):
+        raise ValueError("authkey debe ser de tipo bytes.")
+
+
+def _gather(conns) -> list:
+    """Recibe una respuesta de cada trabajador; un error remoto se relanza aquí."""
+    replies = [conn.recv() for conn in conns]
+    for status, payload in replies:
+        if status != "ok":
+            raise RuntimeError(f"Error en un trabajador DEA: {payload}")
+    return [payload for _, payload in replies]
@@ -0,0 +1,91 @@
+# src/dea_models/solver.py
+
+"""
+Resolución de los PL con los presets de ``constants.SOLVER_PRESETS``.
+
+Todos los modelos llaman a :func:`solve_lp` en lugar de fijar tolerancias
+propias. Sin preset explícito se usa ``constants.DEFAULT_SOLVER_PRESET``
+(leído en cada llamada, así que basta con cambiarlo para toda la sesión).
+"""
+
+import cvxpy as cp
+
+from . import constants
+
+
+def resolve_preset(preset: str | None = None) -> str:
+    """Nombre del preset efectivo; ``ValueError`` si no existe."""
+    name = preset or constants.DEFAULT_SOLVER_PRESET
+    if name not in constants.SOLVER_PRESETS:
+        raise ValueError(f"Preset de solver desconocido: {name!r}. Opciones: {sorted(constants.SOLVER_PRESETS)}.")
+    return name
+
+
+def solver_options(preset: str | None = None) -> dict:
+    """Parámetros de ECOS del preset (sin las claves de refinamiento)."""
+    config = constants.SOLVER_PRESETS[resolve_preset(preset)]
+    return {k: v for k, v in config.items() if k not in ("refine_band", "refine_preset")}
+
+
+def solve_lp(prob: cp.Problem, preset: str | None = None, score=None, stats: dict | None = None) -> str:
+    """
+    Resuelve ``prob`` con ECOS según ``preset`` y devuelve su estado.
+
+    Si el preset tiene ``refine_band`` (``"fast"``, ``"balanced"``), el PL se vuelve a
+    resolver con ``refine_preset`` cuando el solver falla, cuando el estado
+    es ``OPTIMAL_INACCURATE`` o cuando ``score()`` (la puntuación radial)
+    queda a menos de ``refine_band`` de 1. ``stats["refined"]`` cuenta los
+    PL re-resueltos, ``stats["solver_calls"]``/``stats["iterations"]`` las
+    llamadas a ECOS y sus iteraciones, y ``stats["status_counts"]`` el estado
+    final de cada PL. Los errores del solver sin refinamiento se propagan.
+    """
+    config = constants.SOLVER_PRESETS[resolve_preset(preset)]
+    band = config.get("refine_band")
+    try:
+        prob.solve(solver=cp.ECOS, verbose=False, **solver_options(preset))
+        failed = False
+    except cp.error.SolverError:
+        if band is None:
+            _record(stats, prob, "solver_error")
+            raise
+        failed = True
+    if band is None:
+        _record(stats, prob)
+        return prob.status
+
+    solved = not failed and prob.status in (cp.OPTIMAL, cp.OPTIMAL_INACCURATE)
+    value = score() if score is not None and solved else None
+    if failed or prob.status == cp.OPTIMAL_INACCURATE or (value is not None and abs(float(value) - 1.0) <= band):
+        if stats is not None:
+            stats["refined"] = stats.get("refined", 0) + 1
+            if not failed:
+                _count_iterations(stats, prob)
+        try:
+            prob.solve(solver=cp.ECOS, verbose=False, **solver_options(config["refine_preset"]))
+        except cp.error.SolverError:
+            _record(stats, prob, "solver_error")
+            raise
+    _record(stats, prob)
+    return prob.status
+
+
+def _count_iterations(stats: dict, prob: cp.Problem) -> None:
+    iters = getattr(prob.solver_stats, "num_iters", None) if prob.solver_stats is not None else None
+    stats["solver_calls"] = stats.get("solver_calls", 0) + 1
+    stats["iterations"] = stats.get("iterations", 0) + int(iters or 0)
+
+
+def _record(stats: dict | None, prob: cp.Problem, status: str | None = None) -> None:
+    """Acumula iteraciones y el estado final del último PL en ``stats``."""
+    if stats is None:
+        return
+    if status is None:
+        _count_iterations(stats, prob)
+        status = prob.status
+    counts = stats.setdefault("status_counts", {})
+    counts[status] = counts.get(status, 0) + 1
+
+
+def configure_solver(preset: str) -> None:
+    """Cambia el preset por defecto de toda la sesión (``constants.DEFAULT_SOLVER_PRESET``)."""
+    constants.DEFAULT_SOLVER_PRESET = resolve_preset(preset)
@@ -0,0 +1,123 @@
+# src/dea_models/streaming.py
+
+"""
+DEA radial por flujo (fuera de memoria) para CSV más grandes que la RAM.
+
+Primera pasada: el CSV se lee por bloques y se mantiene un conjunto de
+candidatos a frontera. Cada bloque se une a los candidatos y se descartan
+las DMUs estrictamente dominadas, que nunca generan la tecnología. Cuando
+los candidatos superan ``screen_threshold``, se eliminan además los que
+quedan estrictamente dentro de la tecnología de los candidatos
+(``theta < 1 - tol``, con el preset ``"exact"``); el umbral se duplica tras
+cada cribado. La poda por dominancia es exacta y la de los PL es
+conservadora: ``tol`` (por defecto ``SCREEN_TOLERANCE``) queda muy por
+encima del error del solver, así que una DMU de la frontera nunca se
+descarta y la tecnología de los candidatos sigue siendo la de todas las
+filas leídas.
+
+Segunda pasada: se vuelve a leer el CSV por bloques, cada bloque se puntúa
+contra la frontera final (:class:`~dea_models.frontier.Frontier`) y los
+resultados se añaden a ``out_path``. La memoria máxima depende del tamaño
+de la frontera y de ``chunksize``, no del número de filas.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from .constants import SCREEN_TOLERANCE
+from .data import DEAData
+from .frontier import Frontier, candidate_mask
+
+
+def run_streaming_dea(
+    source,
+    dmu_column: str | None,
+    input_cols: list[str],
+    output_cols: list[str],
+    out_path: str,
+    rts: str = "CRS",
+    orientation: str = "input",
+    chunksize: int = 50000,
+    screen_threshold: int = 2000,
+    tol: float = SCREEN_TOLERANCE,
+    read_csv_kwargs: dict | None = None,
+) -> dict:
+    """
+    Puntúa todas las filas de ``source`` (ruta o fichero con ``seek``) y
+    escribe ``out_path`` (CSV con la columna de DMU y ``efficiency``, en la
+    escala de ``run_ccr``/``run_bcc``).
+
+    Retorna ``{"out_path", "n_rows", "n_chunks", "n_reference",
+    "max_candidates", "n_screens", "frontier"}``; ``frontier`` puede
+    guardarse con ``Frontier.save`` para reutilizarla.
+    """
+    if rts not in ("CRS", "VRS"):
+        raise ValueError("rts debe ser 'CRS' o 'VRS'.")
+    read_csv_kwargs = dict(read_csv_kwargs or {})
+    usecols = list(input_cols) + list(output_cols) + ([dmu_column] if dmu_column else [])
+
+    # 1) Candidatos a frontera, bloque a bloque
+    cand_X = np.zeros((len(input_cols), 0))
+    cand_Y = np.zeros((len(output_cols), 0))
+    cand_labels: list[str] = []
+    n_rows = n_chunks = n_screens = max_candidates = 0
+    threshold = screen_threshold
+
+    for chunk, labels in _chunks(source, usecols, dmu_column, chunksize, read_csv_kwargs):
+        data = DEAData(chunk, dmu_column, input_cols, output_cols)
+        n_rows += len(data)
+        n_chunks += 1
+        X = np.hstack([cand_X, data.X])
+        Y = np.hstack([cand_Y, data.Y])
+        all_labels = cand_labels + labels
+        keep = candidate_mask(X, Y, rts, screen=False)
+        if keep.sum() > threshold:
+            keep[keep] = candidate_mask(X[:, keep], Y[:, keep], rts, screen=True, tol=tol)
+            n_screens += 1
+            threshold = max(threshold, 2 * int(keep.sum()))
+        cand_X, cand_Y = X[:, keep], Y[:, keep]
+        cand_labels = [l for l, k in zip(all_labels, keep) if k]
+        max_candidates = max(max_candidates, len(cand_labels))
+
+    if n_rows == 0:
+        raise ValueError("El CSV no contiene filas.")
+    frontier = Frontier(cand_X, cand_Y, cand_labels, input_cols, output_cols, rts=rts, orientation=orientation)
+
+    # 2) Puntuación contra la frontera final, escribiendo por bloques
+    if os.path.exists(out_path):
+        os.remove(out_path)
+    first = True
+    for chunk, labels in _chunks(source, usecols, dmu_column, chunksize, read_csv_kwargs):
+        data = DEAData(chunk, dmu_column, input_cols, output_cols)
+        eff = frontier.score(np.asarray(data.X), np.asarray(data.Y))
+        pd.DataFrame({dmu_column or "DMU": labels, "efficiency": np.round(eff, 6)}).to_csv(
+            out_path, mode="w" if first else "a", header=first, index=False,
+        )
+        first = False
+
+    return {
+        "out_path": out_path,
+        "n_rows": n_rows,
+        "n_chunks": n_chunks,
+        "n_reference": len(cand_labels),
+        "max_candidates": max_candidates,
+        "n_screens": n_screens,
+        "frontier": frontier,
+    }
+
+
+def _chunks(source, usecols, dmu_column, chunksize, read_csv_kwargs):
+    """Itera ``(bloque, etiquetas)``; sin columna de DMU se usa el número de fila global."""
+    if hasattr(source, "seek"):
+        source.seek(0)
+    offset = 0
+    for chunk in pd.read_csv(source, usecols=usecols, chunksize=chunksize, **read_csv_kwargs):
+        chunk = chunk.reset_index(drop=True)
+        if dmu_column:
+            labels = chunk[dmu_column].astype(str).tolist()
+        else:
+            labels = [str(offset + k) for k in range(len(chunk))]
+        offset += len(chunk)
+        yield chunk, labels
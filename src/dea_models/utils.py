@@ -1,5 +1,8 @@
 # src/dea_models/utils.py
 
+import hashlib
+
+import numpy as np
 import pandas as pd
 
 
@@ -14,9 +17,13 @@ def validate_dataframe(
     Valida que todas las columnas de ``input_cols`` + ``output_cols`` existan y sean
     numéricas.
 
+    - Siempre se rechazan valores nulos (``NaN``) e infinitos (``±inf``).
     - Si ``allow_zero`` es ``False``, se rechazan valores cero.
     - Si ``allow_negative`` es ``False``, se rechazan valores negativos.
 
+    Las comprobaciones son las de :func:`validation_report`; se lanza la
+    primera incidencia del informe.
+
     Parameters
     ----------
     df : pd.DataFrame
@@ -40,28 +47,109 @@ def validate_dataframe(
     ValueError
         Si alguna de las verificaciones falla.
     """
-    cols = input_cols + output_cols
-    faltantes = set(cols) - set(df.columns)
-    if faltantes:
-        raise ValueError(f"Faltan columnas: {faltantes}")
+    report = validation_report(df, input_cols, output_cols, allow_zero=allow_zero, allow_negative=allow_negative)
+    if report["issues"]:
+        raise ValueError(report["issues"][0])
 
-    for col in cols:
-        if not pd.api.types.is_numeric_dtype(df[col]):
-            raise ValueError(f"Columna '{col}' no es numérica.")
+    return True
 
-        if not allow_zero and (df[col] == 0).any():
-            cnt = int((df[col] == 0).sum())
-            raise ValueError(
-                f"Columna '{col}' tiene {cnt} ceros; no permitidos."
-            )
 
-        if not allow_negative and (df[col] < 0).any():
-            cnt = int((df[col] < 0).sum())
-            raise ValueError(
-                f"Columna '{col}' tiene {cnt} valores negativos; no permitidos."
-            )
+def validation_report(
+    df: pd.DataFrame,
+    input_cols: list[str],
+    output_cols: list[str],
+    allow_zero: bool = False,
+    allow_negative: bool = False
+) -> dict:
+    """
+    Valida todas las columnas seleccionadas de una vez y devuelve un informe
+    en lugar de lanzar una excepción.
 
-    return True
+    Las columnas numéricas se apilan en un único bloque y se clasifican todas
+    a la vez (``np.isfinite`` + signo): nulo, infinito, negativo, cero o
+    positivo.
+
+    Returns
+    -------
+    dict
+        ``{"valid": bool, "n_rows": int, "issues": [str, ...],
+        "columns": {col: {"role", "missing", "numeric", "nulls", "infinite",
+        "zeros", "negatives"}}}``. ``issues`` usa los mismos mensajes que
+        :func:`validate_dataframe`, columna a columna y en orden.
+    """
+    return _scan_columns(df, input_cols, output_cols, allow_zero, allow_negative)[1]
+
+
+def _scan_columns(
+    df: pd.DataFrame,
+    input_cols: list[str],
+    output_cols: list[str],
+    allow_zero: bool = False,
+    allow_negative: bool = False
+) -> tuple[np.ndarray, dict]:
+    """
+    Núcleo de :func:`validation_report`: devuelve además el bloque
+    ``(m + s, n)`` en float64 (``NaN`` en columnas ausentes o no numéricas).
+    """
+    cols = list(input_cols) + list(output_cols)
+    n = len(df)
+    block = np.full((len(cols), n), np.nan)
+    columns = {}
+    numeric = []
+    for k, col in enumerate(cols):
+        info = {
+            "role": "input" if k < len(input_cols) else "output",
+            "missing": col not in df.columns,
+            "numeric": False,
+            "nulls": 0, "infinite": 0, "zeros": 0, "negatives": 0,
+        }
+        columns[col] = info
+        if info["missing"]:
+            continue
+        if pd.api.types.is_numeric_dtype(df[col]):
+            info["numeric"] = True
+            numeric.append(k)
+        else:
+            info["nulls"] = int(df[col].isna().sum())
+
+    if numeric:
+        block[numeric] = df[[cols[k] for k in numeric]].to_numpy(dtype=float).T
+        sub = block[numeric]
+        # Clasificación por celda sobre el bloque apilado: signo solo para valores finitos
+        finite = np.isfinite(sub)
+        sign = np.where(finite, np.sign(sub), np.nan)
+        nulls = np.isnan(sub).sum(axis=1)
+        counts = {
+            "zeros": (sign == 0).sum(axis=1),
+            "negatives": (sign < 0).sum(axis=1),
+            "nulls": nulls,
+            "infinite": (~finite).sum(axis=1) - nulls,
+        }
+        for j, k in enumerate(numeric):
+            columns[cols[k]].update({name: int(c[j]) for name, c in counts.items()})
+
+    issues = []
+    missing = [c for c in cols if columns[c]["missing"]]
+    if missing:
+        issues.append(f"Faltan columnas: {set(missing)}")
+    for col in cols:
+        info = columns[col]
+        if info["missing"]:
+            continue
+        if not info["numeric"]:
+            issues.append(f"Columna '{col}' no es numérica.")
+            continue
+        if info["nulls"]:
+            issues.append(f"Columna '{col}' tiene {info['nulls']} valores nulos; no permitidos.")
+        if info["infinite"]:
+            issues.append(f"Columna '{col}' tiene {info['infinite']} valores infinitos; no permitidos.")
+        if not allow_zero and info["zeros"]:
+            issues.append(f"Columna '{col}' tiene {info['zeros']} ceros; no permitidos.")
+        if not allow_negative and info["negatives"]:
+            issues.append(f"Columna '{col}' tiene {info['negatives']} valores negativos; no permitidos.")
+
+    report = {"valid": not issues, "n_rows": n, "issues": issues, "columns": columns}
+    return np.ascontiguousarray(block), report
 
 
 def check_positive_data(df: pd.DataFrame, columns: list[str]):
@@ -133,20 +221,78 @@ def format_lambda_table(lambda_dicts: list[dict[str, float]]) -> pd.DataFrame:
     return df_result
 
 
+def data_fingerprint(*arrays: np.ndarray) -> str:
+    """Huella SHA-256 del contenido (forma, tipo y bytes) de uno o varios arrays."""
+    h = hashlib.sha256()
+    for arr in arrays:
+        arr = np.ascontiguousarray(arr)
+        h.update(f"{arr.shape}|{arr.dtype.str}|".encode())
+        h.update(arr.tobytes())
+    return h.hexdigest()
+
+
+def unique_columns(X: np.ndarray, Y: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    DMUs con vectores ``(x, y)`` distintos. Devuelve ``(first, inverse,
+    counts)``: ``first`` son las posiciones de la primera aparición de cada
+    vector (en orden de aparición), ``inverse[j]`` el vector de la DMU ``j``
+    y ``counts`` cuántas DMUs lo comparten; ``eff[inverse]`` reparte a todas
+    las DMUs un resultado calculado sobre ``first``.
+    """
+    Z = np.vstack([X, Y])
+    n = Z.shape[1]
+    if n == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, empty
+    _, first, inverse, counts = np.unique(Z, axis=1, return_index=True, return_inverse=True, return_counts=True)
+    order = np.argsort(first, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return first[order], rank[np.ravel(inverse)], counts[order]
+
+
 def check_monotonic_data(df: pd.DataFrame, input_cols: list[str], output_cols: list[str]) -> list[str]:
     """
     Checks for monotonicity assumption in DEA (more inputs -> more outputs, less inputs -> less outputs).
-    This is a conceptual check, not a formal mathematical one.
-    Returns a list of warnings/issues if obvious non-monotonicity is detected.
+    A DMU with at least as many inputs and at most as many outputs as another (strictly worse in
+    some variable) is Pareto-dominated; the report is built from :func:`dea_models.dominance.dominance_index`.
+    Returns a list of warnings/issues (empty if nothing stands out).
     """
+    from .dominance import dominance_index
+
     issues = []
-    # This is a complex check to implement rigorously without a full production possibility set.
-    # For a simple heuristic: if a DMU has strictly more inputs and strictly less outputs than another,
-    # but still considered efficient, it might indicate issues.
-    # For MVP, this might be better handled by LLM suggestions or manual review rather than strict code.
-    # Placeholder for future more advanced checks.
-    
-    # Simple check: If any input increases while all outputs decrease (or stay same), it's problematic.
-    # Or if any output increases while all inputs decrease (or stay same), and still inefficient.
-    # This often relates to outliers.
+    block, report = _scan_columns(df, input_cols, output_cols)
+    if report["issues"]:
+        # Sin datos válidos no hay relación de dominancia que analizar
+        return issues
+    m = len(input_cols)
+    n = block.shape[1]
+    if n == 0:
+        return issues
+    # El recuento de dominadoras es cuadrático en d > 2; para paneles enormes basta con las marcas
+    index = dominance_index(block[:m], block[m:], count_dominators=n <= 20_000)
+    n_dominated = int(index["dominated"].sum())
+    n_frontier = n - n_dominated
+
+    if n_dominated:
+        issues.append(
+            f"{n_dominated} de {n} DMUs ({n_dominated / n:.0%}) están dominadas: otra DMU usa "
+            f"como mucho sus inputs y produce al menos sus outputs."
+        )
+    if n > 1 and n_frontier == 1:
+        issues.append(
+            "Una única DMU domina a todas las demás; revisa si es un valor atípico, porque "
+            "determinará por sí sola la frontera."
+        )
+    if n > 1 and n_dominated == 0:
+        issues.append(
+            "Ninguna DMU está dominada por otra: con estas variables el DEA discriminará poco "
+            "(considera reducir inputs/outputs o añadir DMUs)."
+        )
+    counts = index["n_dominators"]
+    if counts is not None and n_dominated:
+        worst = np.argsort(-counts, kind="stable")[:3]
+        labels = df.index.astype(str)
+        detail = ", ".join(f"'{labels[i]}' ({int(counts[i])})" for i in worst if counts[i] > 0)
+        issues.append(f"DMUs con más dominadoras (fila: nº de DMUs que la dominan): {detail}.")
     return issues
@@ -4,27 +4,32 @@ import numpy as np
 
 from .radial import run_ccr, run_bcc
 from .utils import validate_dataframe
+from .data import DEAData, as_dea_data
 
 def run_window_dea(
-    df_panel: pd.DataFrame,
-    dmu_column: str,
-    period_column: str,
-    input_cols: list[str],
-    output_cols: list[str],
+    df_panel: pd.DataFrame | DEAData,
+    dmu_column: str | None,
+    period_column: str | None,
+    input_cols: list[str] | None,
+    output_cols: list[str] | None,
     window_size: int = 3,
     rts: str = "CRS" # Se pasa a run_ccr o run_bcc
 ) -> pd.DataFrame:
     """
     Corre DEA sobre ventanas temporales deslizantes.
+    ``df_panel`` puede ser un :class:`DEAData` construido con ``period_column``.
     """
-    if dmu_column not in df_panel.columns or period_column not in df_panel.columns:
+    if isinstance(df_panel, pd.DataFrame) and (dmu_column not in df_panel.columns or period_column not in df_panel.columns):
+        raise ValueError("Las columnas de DMU y período deben existir.")
+    data = as_dea_data(df_panel, dmu_column, input_cols, output_cols, period_column=period_column)
+    if data.periods is None:
         raise ValueError("Las columnas de DMU y período deben existir.")
-    validate_dataframe(df_panel, input_cols, output_cols, allow_zero=False, allow_negative=False)
 
-    periods = sorted(df_panel[period_column].unique())
+    periods = sorted(pd.unique(data.periods))
     if len(periods) < window_size:
         raise ValueError("No hay suficientes períodos para la ventana solicitada.")
 
+    labels = data.dmu_labels[data.dmu_codes]
     all_results = []
 
     for i in range(len(periods) - window_size + 1):
@@ -32,48 +37,33 @@ def run_window_dea(
         start_p, end_p = current_window_periods[0], current_window_periods[-1]
         
         # --- CORRECCIÓN LÓGICA ---
-        # El DataFrame de referencia debe ser toda la ventana.
+        # El conjunto de referencia debe ser toda la ventana.
         # Las DMUs a evaluar son las del último período de la ventana.
-        df_window = df_panel[df_panel[period_column].isin(current_window_periods)].copy()
-        
+        rows = np.flatnonzero(np.isin(data.periods, current_window_periods))
+
         # Para evitar conflictos con nombres de DMU repetidos en distintos períodos,
-        # creamos un ID temporal único para el cálculo.
-        df_window['temp_dmu_id'] = df_window[dmu_column].astype(str) + " | P:" + df_window[period_column].astype(str)
-        
-        model_func = run_ccr if rts == "CRS" else run_bcc
+        # creamos un ID temporal único para el cálculo (sin revalidar ni copiar el panel).
+        temp_ids = [f"{lab} | P:{p}" for lab, p in zip(labels[rows], data.periods[rows])]
+        window_data = data.take(rows, dmu_labels=temp_ids)
         
         # Para BCC, necesitamos resultados de CCR para la eficiencia de escala
-        df_ccr_results = run_ccr(
-            df=df_window,
-            dmu_column='temp_dmu_id',
-            input_cols=input_cols,
-            output_cols=output_cols
-        )
-        # Renombramos columna para que run_bcc la encuentre
-        df_ccr_results = df_ccr_results.rename(columns={'tec_efficiency_ccr': 'efficiency'})
-
+        df_ccr_results = run_ccr(window_data)
 
         if rts == "CRS":
-            df_eff = df_ccr_results.rename(columns={'efficiency':'tec_efficiency_ccr'})
+            df_eff = df_ccr_results
         else:
-             df_eff = run_bcc(
-                df=df_window,
-                dmu_column='temp_dmu_id',
-                input_cols=input_cols,
-                output_cols=output_cols,
-                df_ccr_results=df_ccr_results
-            )
+            df_eff = run_bcc(window_data, df_ccr_results=df_ccr_results)
 
         # Filtramos para quedarnos solo con los resultados del último período de la ventana
-        results_end_period = df_eff[df_eff['temp_dmu_id'].str.contains(f"P:{end_p}")]
+        is_end = data.periods[rows] == end_p
+        efficiencies = df_eff["tec_efficiency_ccr" if rts == "CRS" else "efficiency"].to_numpy()[is_end]
 
-        for _, row in results_end_period.iterrows():
-            original_dmu = row['temp_dmu_id'].split(" | P:")[0]
+        for original_dmu, eff in zip(labels[rows][is_end], efficiencies):
             all_results.append({
                 "DMU": original_dmu,
                 "start_period": start_p,
                 "end_period": end_p,
-                "efficiency_window": row['tec_efficiency_ccr'] if rts == "CRS" else row['efficiency']
+                "efficiency_window": eff
             })
 
     return pd.DataFrame(all_results)
@@ -24,8 +24,16 @@ from data_validator import validate as validate_data
 from report_generator import generate_html_report, generate_excel_report
 from dea_models.visualizations import plot_hypothesis_distribution, plot_correlation
 from dea_models.auto_tuner import generate_candidates, evaluate_candidates 
+from dea_models.cache import clear_cache
 from openai_helpers import explain_inquiry_tree
 
+# Procesos para evaluar candidatos desde la interfaz. Por defecto secuencial:
+# cada clic del usuario se atiende dentro de una petición de Streamlit y un
+# pool con todos los núcleos por petición compite con las demás sesiones del
+# servidor. En un despliegue dedicado puede subirse con DEA_CANDIDATE_N_JOBS
+# (se limita a 4 procesos).
+CANDIDATE_N_JOBS = max(1, min(int(os.getenv("DEA_CANDIDATE_N_JOBS", "1")), 4))
+
 # --- 2) GESTIÓN DE ESTADO MULTI-ESCENARIO (Funciones Auxiliares de Lógica de Negocio/Estado) ---
 
 def create_new_scenario(name: str = "Modelo Base", source_scenario_id: str = None):
@@ -78,6 +86,7 @@ def reset_all():
     """Reinicia la aplicación a su estado inicial, eliminando todos los datos y escenarios."""
     st.cache_data.clear() # Clear all st.cache_data functions
     st.cache_resource.clear() # Clear all st.cache_resource functions if any
+    clear_cache() # Caché de resultados DEA del proceso (solo nivel en memoria)
 
     for key in list(st.session_state.keys()):
         del st.session_state[key]
@@ -107,9 +116,11 @@ def cached_explain_tree(_tree):
 def cached_generate_candidates(_df, dmu_col, input_cols, output_cols, inquiry_tree, eee_score):
     return generate_candidates(_df, dmu_col, input_cols, output_cols, inquiry_tree, eee_score)
 
-@st.cache_data
-def cached_evaluate_candidates(_df, dmu_col, candidates, model):
-    return evaluate_candidates(_df, dmu_col, candidates, model)
+def stream_evaluate_candidates(df, dmu_col, candidates, model, on_result=None):
+    # Sin st.cache_data: Streamlit reproduce las llamadas a elementos de las
+    # funciones cacheadas, así que la tabla parcial se actualiza aquí fuera.
+    # Los candidatos ya evaluados salen de la caché de dea_models sin PL nuevos.
+    return evaluate_candidates(df, dmu_col, candidates, model, n_jobs=CANDIDATE_N_JOBS, on_result=on_result)
 
 
 def get_openai_client():
@@ -416,12 +427,22 @@ class AppRenderer:
                 st.markdown("Una vez generados los candidatos, evalúa rápidamente su impacto en la eficiencia promedio y una métrica simulada de calidad de juicio (EEE).")
                 if st.button("Evaluar Candidatos Sugeridos", key=f"eval_candidates_{st.session_state.active_scenario_id}", help="Ejecuta un análisis preliminar de eficiencia para cada configuración sugerida por la IA."):
                     with st.spinner("Evaluando candidatos... Esto puede llevar un tiempo para un gran número de candidatos."):
-                        evaluations = cached_evaluate_candidates( # Call global cached function
+                        # Tabla parcial que se actualiza a medida que terminan los candidatos
+                        partial_table = st.empty()
+                        partial_rows = []
+
+                        def show_partial(row):
+                            partial_rows.append(row)
+                            partial_table.dataframe(pd.DataFrame(partial_rows))
+
+                        evaluations = stream_evaluate_candidates(
                             active_scenario['df'],
                             active_scenario['df'].columns[0],
                             active_scenario['optimization_candidates'],
-                            current_model
+                            current_model,
+                            on_result=show_partial
                         )
+                        partial_table.empty()
                         active_scenario['optimization_evaluations'] = evaluations
                 
                 if active_scenario.get('optimization_evaluations') is not None:
@@ -534,7 +555,7 @@ class AppRenderer:
 
         st.markdown("---")
 
-        model_options = {"Radial (CCR/BCC)": "CCR_BCC", "No Radial (SBM)": "SBM", "Productividad (Malmquist)": "MALMQUIST"}
+        model_options = {"Radial (CCR/BCC)": "CCR_BCC", "No Radial (SBM)": "SBM", "Free Disposal Hull (FDH)": "FDH", "Frontera Parcial (orden-m)": "ORDER_M", "Frontera Parcial (orden-α)": "ORDER_ALPHA", "Productividad (Malmquist)": "MALMQUIST"}
         
         current_model_key = active_scenario['dea_config'].get('model', 'CCR_BCC')
         current_model_name = [name for name, key in model_options.items() if key == current_model_key][0]
@@ -1546,6 +1567,14 @@ class AppRenderer:
             st.error("**Reto de Datos: Datos Problemáticos.** Se encontraron problemas de validación formal en los datos o columnas seleccionadas. El DEA requiere que los inputs y outputs sean estrictamente positivos. La presencia de valores nulos, negativos o cero, o columnas no numéricas, puede causar errores o resultados inválidos en el modelo.")
             for issue in validation_results['formal_issues']:
                 st.warning(f"- {issue}")
+            # Informe por columna: todos los problemas de una vez, sin tener que corregir y recargar uno a uno
+            formal_report = validation_results.get('formal_report')
+            if formal_report:
+                report_table = pd.DataFrame.from_dict(formal_report['columns'], orient='index')
+                st.dataframe(report_table.rename(columns={
+                    "role": "Rol", "missing": "Falta", "numeric": "Numérica", "nulls": "Nulos",
+                    "infinite": "Infinitos", "zeros": "Ceros", "negatives": "Negativos"
+                }), use_container_width=True)
             st.info("Por favor, regresa al Paso 2 para ajustar las columnas o el dataset. Es crucial que los datos cumplan con los requisitos del DEA.")
         else:
             st.success("La validación formal inicial de datos y columnas ha sido exitosa. ¡Buen trabajo!")
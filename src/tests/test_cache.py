@@ -0,0 +1,87 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dea_models.cache import cache_info, clear_cache, configure_cache, frame_block, get_cached, spec_key, store_cached
+from dea_models.radial import run_ccr
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+
+def _random_frame(seed, n=30):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "DMU": [f"D{i}" for i in range(n)],
+        "x1": rng.uniform(1, 10, n),
+        "x2": rng.uniform(1, 10, n),
+        "y1": rng.uniform(1, 10, n),
+    })
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    # Cada test parte de una caché vacía, solo en memoria
+    previous = cache_info()
+    configure_cache(max_entries=512, disk_dir="")
+    clear_cache()
+    yield
+    clear_cache()
+    configure_cache(max_entries=previous["max_entries"], disk_dir=previous["disk_dir"] or "")
+
+
+def _key(df, inputs, outputs, **kwargs):
+    return spec_key(frame_block(df, inputs, outputs), inputs, outputs, "CCR", **kwargs)
+
+
+def test_spec_key_ignores_column_order_and_tracks_spec():
+    df = _random_frame(0)
+    base = _key(df, ["x1", "x2"], ["y1"])
+    assert _key(df, ["x2", "x1"], ["y1"]) == base
+
+    assert _key(df, ["x1", "x2"], ["y1"], orientation="output") != base
+    assert _key(df, ["x1", "x2"], ["y1"], solver_preset="exact") != _key(df, ["x1", "x2"], ["y1"], solver_preset="fast")
+    assert _key(df, ["x1"], ["y1"]) != base
+
+    changed = df.copy()
+    changed.loc[3, "x1"] += 1e-9
+    assert _key(changed, ["x1", "x2"], ["y1"]) != base
+
+
+def test_run_ccr_hits_cache_and_invalidates_on_data_change():
+    df = _random_frame(1)
+    first = run_ccr(df, "DMU", ["x1", "x2"], ["y1"])
+    assert cache_info()["hits"] == 0
+
+    second = run_ccr(df, "DMU", ["x1", "x2"], ["y1"])
+    assert cache_info()["hits"] == 1
+    pd.testing.assert_frame_equal(first, second)
+
+    # El valor recuperado es una copia: modificarlo no altera la caché
+    second.loc[0, "tec_efficiency_ccr"] = -1.0
+    pd.testing.assert_frame_equal(first, run_ccr(df, "DMU", ["x1", "x2"], ["y1"]))
+
+    # Un dato distinto o una orientación distinta no reutilizan la entrada
+    changed = df.copy()
+    changed.loc[5, "y1"] *= 2
+    misses = cache_info()["misses"]
+    run_ccr(changed, "DMU", ["x1", "x2"], ["y1"])
+    run_ccr(df, "DMU", ["x1", "x2"], ["y1"], orientation="output")
+    assert cache_info()["misses"] == misses + 2
+
+
+def test_disk_tier_survives_memory_clear(tmp_path):
+    configure_cache(disk_dir=str(tmp_path))
+    key = ("spec", 1)
+    store_cached(key, {"efficiency": [1.0, 0.5]})
+    clear_cache()
+
+    assert get_cached(key) == {"efficiency": [1.0, 0.5]}
+    assert cache_info()["disk_hits"] == 1
+
+    # Un fichero corrupto se trata como fallo, no como error
+    clear_cache()
+    for path in tmp_path.glob("*.pkl"):
+        path.write_bytes(b"no es un pickle")
+    assert get_cached(key, default="miss") == "miss"
@@ -0,0 +1,70 @@
+import copy
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dea_models import certify_results
+from dea_models.radial import run_bcc, run_ccr
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+
+def _random_frame(seed, n=40):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "DMU": [f"D{i}" for i in range(n)],
+        "x1": rng.uniform(1, 10, n),
+        "x2": rng.uniform(1, 10, n),
+        "y1": rng.uniform(1, 10, n),
+        "y2": rng.uniform(1, 10, n),
+    })
+
+
+ARGS = ("DMU", ["x1", "x2"], ["y1", "y2"])
+
+
+def _bcc(df, *args, **kwargs):
+    # run_bcc parte de los resultados CCR de los mismos datos
+    return run_bcc(df, *args, df_ccr_results=run_ccr(df, *args), **kwargs)
+
+
+@pytest.mark.parametrize("model, orientation", [(run_ccr, "input"), (_bcc, "input"), (_bcc, "output")])
+def test_exact_results_are_certified(model, orientation):
+    df = _random_frame(0)
+    results = model(df, *ARGS, orientation=orientation, compact=True, solver_preset="exact")
+    report = certify_results(df, results, *ARGS, orientation=orientation)
+    assert report["certified"].all()
+    assert report.attrs["certification"]["n_failed"] == 0
+
+
+def test_corrupted_score_is_detected_and_resolved():
+    df = _random_frame(1)
+    results = copy.deepcopy(_bcc(df, *ARGS, compact=True, solver_preset="exact"))
+    true_score = results.certificate["score"].copy()
+
+    # Una puntuación alterada rompe la factibilidad primal y la brecha de dualidad
+    bad = [3, 17]
+    results.certificate["score"][bad] *= 0.9
+    report = certify_results(df, results, *ARGS)
+    assert np.flatnonzero(~report["certified"].to_numpy()).tolist() == bad
+    assert report.attrs["certification"]["n_failed"] == 2
+
+    # Solo esas DMUs se re-resuelven y recuperan su puntuación
+    assert report["certified_after"].all()
+    np.testing.assert_allclose(report.loc[bad, "resolved_score"], true_score[bad], atol=1e-6)
+    assert report["resolved_score"].drop(index=bad).isna().all()
+
+    # Sin resolve solo se informa
+    plain = certify_results(df, results, *ARGS, resolve=False)
+    assert plain.attrs["certification"]["n_resolved"] == 0
+    assert not plain.loc[bad, "certified_after"].any()
+
+
+def test_super_efficiency_is_certified_without_self():
+    df = _random_frame(2)
+    results = run_ccr(df, *ARGS, super_eff=True, compact=True, solver_preset="exact")
+    report = certify_results(df, results, *ARGS)
+    assert report["certified"].all()
+    assert (results.certificate["score"] > 1.0).any()
@@ -0,0 +1,39 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from dea_models.dominance import dominance_index
+from dea_models.radial import _column_generation_core, _dea_core
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+
+def _random_data(seed, n=150):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(1, 10, (2, n)), rng.uniform(1, 10, (2, n))
+
+
+@pytest.mark.parametrize("rts, orientation", [("CRS", "input"), ("VRS", "input"), ("VRS", "output")])
+def test_column_generation_matches_full_lp(rts, orientation):
+    X, Y = _random_data(5)
+    expected = _dea_core(X, Y, rts=rts, orientation=orientation, column_generation=False, solver_preset="exact")
+
+    # Conjunto inicial pequeño para obligar a varias rondas de precios
+    stats = {}
+    scores = _column_generation_core(X, Y, rts, orientation, initial_size=8, batch_size=4,
+                                     compare_sample=1, stats=stats, solver_preset="exact")
+    np.testing.assert_allclose(scores, expected, rtol=1e-6, atol=1e-6)
+    assert stats["mode"] == "column_generation"
+    assert stats["columns_added"] > 0
+    assert stats["working_set_size"] < stats["n_columns_full"]
+
+
+def test_column_generation_with_screened_reference():
+    # Con la referencia limitada a las DMUs no dominadas el resultado no cambia
+    X, Y = _random_data(6)
+    reference = dominance_index(X, Y)["non_dominated"]
+    expected = _dea_core(X, Y, rts="VRS", column_generation=False, solver_preset="exact")
+    scores = _column_generation_core(X, Y, "VRS", "input", reference=reference, initial_size=8,
+                                     batch_size=4, solver_preset="exact")
+    np.testing.assert_allclose(scores, expected, rtol=1e-6, atol=1e-6)
@@ -0,0 +1,69 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dea_models import DEAData
+from dea_models.cache import cache_info, clear_cache, configure_cache
+from dea_models.radial import run_ccr
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+
+def _random_frame(seed, n=30):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "DMU": [f"D{i}" for i in range(n)],
+        "x1": rng.uniform(1, 10, n),
+        "x2": rng.uniform(1, 10, n),
+        "y1": rng.uniform(1, 10, n),
+    })
+
+
+def test_dea_data_is_immutable():
+    data = DEAData(_random_frame(0), "DMU", ["x1", "x2"], ["y1"])
+    with pytest.raises(AttributeError):
+        data.X = np.ones_like(data.X)
+    with pytest.raises(ValueError):
+        data.X[0, 0] = 0.0
+    assert data.select(["x1"]).X.shape == (1, len(data))
+
+
+def test_fingerprint_tracks_data_and_labels():
+    df = _random_frame(1)
+    data = DEAData(df, "DMU", ["x1", "x2"], ["y1"])
+    assert data.fingerprint == DEAData(df.copy(), "DMU", ["x1", "x2"], ["y1"]).fingerprint
+
+    changed = df.copy()
+    changed.loc[0, "y1"] += 1e-9
+    assert DEAData(changed, "DMU", ["x1", "x2"], ["y1"]).fingerprint != data.fingerprint
+
+    renamed = df.assign(DMU=[f"E{i}" for i in range(len(df))])
+    assert DEAData(renamed, "DMU", ["x1", "x2"], ["y1"]).fingerprint != data.fingerprint
+
+    # Un subconjunto de DMUs tiene su propia huella
+    assert data.take(np.arange(10)).fingerprint != data.fingerprint
+
+
+def test_validation_errors_are_value_errors():
+    df = _random_frame(2)
+    df.loc[4, "x2"] = np.nan
+    with pytest.raises(ValueError):
+        DEAData(df, "DMU", ["x1", "x2"], ["y1"])
+    assert not DEAData(df, "DMU", ["x1", "x2"], ["y1"], strict=False).report["valid"]
+
+
+def test_dataframe_and_dea_data_share_cache_entry():
+    previous = cache_info()
+    configure_cache(max_entries=512, disk_dir="")
+    clear_cache()
+    try:
+        df = _random_frame(3)
+        from_frame = run_ccr(df, "DMU", ["x1", "x2"], ["y1"])
+        from_data = run_ccr(DEAData(df, "DMU", ["x1", "x2"], ["y1"]))
+        assert cache_info()["hits"] == 1
+        pd.testing.assert_frame_equal(from_frame, from_data)
+    finally:
+        clear_cache()
+        configure_cache(max_entries=previous["max_entries"], disk_dir=previous["disk_dir"] or "")
@@ -0,0 +1,50 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dea_models.dominance import dominance_index
+from dea_models.radial import run_ccr
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+
+def _brute_force(X, Y):
+    # j domina a i: no peor en ninguna variable y estrictamente mejor en alguna
+    Z = np.vstack([X, -Y]).T
+    le = (Z[None, :, :] <= Z[:, None, :]).all(axis=2)
+    eq = (Z[None, :, :] == Z[:, None, :]).all(axis=2)
+    return (le & ~eq).sum(axis=1)
+
+
+@pytest.mark.parametrize("m, s", [(1, 1), (2, 1), (2, 2), (3, 2)])
+def test_dominance_matches_brute_force(m, s):
+    # Datos enteros para forzar empates y DMUs duplicadas
+    rng = np.random.default_rng(m * 10 + s)
+    X = rng.integers(1, 6, (m, 300)).astype(float)
+    Y = rng.integers(1, 6, (s, 300)).astype(float)
+    expected = _brute_force(X, Y)
+
+    # chunk_size pequeño para recorrer varios bloques
+    result = dominance_index(X, Y, chunk_size=64)
+    np.testing.assert_array_equal(result["dominated"], expected > 0)
+    np.testing.assert_array_equal(result["non_dominated"], np.flatnonzero(expected == 0))
+    np.testing.assert_array_equal(result["n_dominators"], expected)
+
+    flags_only = dominance_index(X, Y, count_dominators=False, chunk_size=64)
+    np.testing.assert_array_equal(flags_only["dominated"], expected > 0)
+
+
+def test_prefilter_dominated_keeps_scores():
+    rng = np.random.default_rng(5)
+    n = 60
+    df = pd.DataFrame({
+        "DMU": [f"D{i}" for i in range(n)],
+        "x1": rng.uniform(1, 10, n),
+        "x2": rng.uniform(1, 10, n),
+        "y1": rng.uniform(1, 10, n),
+    })
+    full = run_ccr(df, "DMU", ["x1", "x2"], ["y1"])
+    screened = run_ccr(df, "DMU", ["x1", "x2"], ["y1"], prefilter_dominated=True)
+    np.testing.assert_allclose(screened["tec_efficiency_ccr"], full["tec_efficiency_ccr"], atol=1e-6)
@@ -0,0 +1,25 @@
+import warnings
+
+import numpy as np
+
+from dea_models.frontier import Frontier, candidate_mask
+from dea_models.radial import _dea_core
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+
+def _random_data(seed, n=400):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(1, 10, (2, n)), rng.uniform(1, 10, (2, n))
+
+
+def test_screened_frontier_matches_full_lp():
+    # Con seed=4 la DMU 231 (theta ≈ 1 - 1e-8) se descartaba en el cribado y
+    # después puntuaba 1.57 frente a la frontera
+    X, Y = _random_data(4)
+    keep = candidate_mask(X, Y, "VRS")
+    frontier = Frontier(X[:, keep], Y[:, keep], [str(i) for i in np.flatnonzero(keep)],
+                        ["x1", "x2"], ["y1", "y2"], rts="VRS")
+    expected = _dea_core(X, Y, rts="VRS")
+    assert keep[231]
+    np.testing.assert_allclose(frontier.score(X, Y), expected, atol=1e-5)
@@ -0,0 +1,46 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from dea_models.hull import hull_efficiencies
+from dea_models.radial import _dea_core
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+
+def _random_data(seed, m, s, n=40):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(1, 10, (m, n)), rng.uniform(1, 10, (s, n))
+
+
+@pytest.mark.parametrize("m, s", [(1, 1), (2, 1), (1, 2)])
+@pytest.mark.parametrize("rts", ["CRS", "VRS"])
+@pytest.mark.parametrize("orientation", ["input", "output"])
+def test_hull_matches_lp(m, s, rts, orientation):
+    X, Y = _random_data(m * 3 + s, m, s)
+    scores = hull_efficiencies(X, Y, rts, orientation)
+    assert scores is not None
+    expected = _dea_core(X, Y, rts=rts, orientation=orientation, use_hull=False,
+                         column_generation=False, solver_preset="exact")
+    np.testing.assert_allclose(scores, expected, rtol=1e-6, atol=1e-7)
+
+
+def test_hull_scores_external_points():
+    # DMUs nuevas fuera de la muestra se puntúan contra la misma tecnología
+    X, Y = _random_data(7, 2, 1)
+    X_new, Y_new = _random_data(8, 2, 1, n=10)
+    scores = hull_efficiencies(X, Y, "VRS", "input", X_eval=X_new, Y_eval=Y_new)
+    for j in range(10):
+        X_all = np.hstack([X, X_new[:, [j]]])
+        Y_all = np.hstack([Y, Y_new[:, [j]]])
+        expected = _dea_core(X_all, Y_all, rts="VRS", use_hull=False, column_generation=False,
+                             solver_preset="exact", super_eff=True)[-1]
+        assert np.isfinite(scores[j]) == np.isfinite(expected)
+        if np.isfinite(expected):
+            assert scores[j] == pytest.approx(expected, rel=1e-6)
+
+
+def test_hull_declines_high_dimension():
+    X, Y = _random_data(9, 2, 2)
+    assert hull_efficiencies(X, Y, "VRS", "input") is None
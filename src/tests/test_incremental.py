@@ -0,0 +1,73 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dea_models.incremental import IncrementalDEA
+from dea_models.radial import _dea_core
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+
+def _random_frame(seed, n=60, start=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "DMU": [f"D{i}" for i in range(start, start + n)],
+        "x1": rng.uniform(1, 10, n),
+        "x2": rng.uniform(1, 10, n),
+        "y1": rng.uniform(1, 10, n),
+    })
+
+
+def _assert_matches_full_solve(engine, state, rts, orientation):
+    # La eficiencia incremental debe coincidir con resolver de cero el estado actual
+    current = engine.results().set_index("DMU")["efficiency"]
+    assert sorted(current.index) == sorted(state["DMU"])
+    X = state[["x1", "x2"]].to_numpy().T
+    Y = state[["y1"]].to_numpy().T
+    full = _dea_core(X, Y, rts=rts, orientation=orientation, use_hull=False)
+    full = full if orientation == "input" else 1.0 / full
+    np.testing.assert_allclose(current.loc[state["DMU"]].to_numpy(), full, atol=2e-6)
+
+
+@pytest.mark.parametrize("rts, orientation", [("CRS", "input"), ("VRS", "output")])
+def test_incremental_matches_full_resolve(rts, orientation):
+    state = _random_frame(0)
+    engine = IncrementalDEA(state, "DMU", ["x1", "x2"], ["y1"], rts=rts, orientation=orientation)
+    _assert_matches_full_solve(engine, state, rts, orientation)
+
+    # Altas: solo se re-resuelven las DMUs nuevas y las afectadas
+    new = _random_frame(1, n=5, start=60)
+    engine.add(new)
+    state = pd.concat([state, new], ignore_index=True)
+    assert engine.last_update["skipped"] > 0
+    _assert_matches_full_solve(engine, state, rts, orientation)
+
+    # Bajas, incluida una DMU eficiente que es par de otras
+    efficient = engine.results().query("efficiency >= 0.999999")["DMU"].tolist()
+    engine.remove([efficient[0], "D3"])
+    state = state[~state["DMU"].isin([efficient[0], "D3"])].reset_index(drop=True)
+    _assert_matches_full_solve(engine, state, rts, orientation)
+
+    # Ediciones: una DMU pasa a dominar a casi todas
+    edited = pd.DataFrame({"DMU": ["D10", "D11"], "x1": [1.0, 9.0], "x2": [1.0, 9.0], "y1": [9.0, 1.0]})
+    engine.update(edited)
+    state = pd.concat([state[~state["DMU"].isin(edited["DMU"])], edited], ignore_index=True)
+    _assert_matches_full_solve(engine, state, rts, orientation)
+
+    # sync: altas, bajas y ediciones en una sola actualización
+    state = pd.concat([state.iloc[5:], _random_frame(2, n=3, start=100)], ignore_index=True)
+    state.loc[0, "y1"] *= 1.5
+    engine.sync(state)
+    _assert_matches_full_solve(engine, state, rts, orientation)
+
+
+def test_incremental_rejects_invalid_operations():
+    engine = IncrementalDEA(_random_frame(3, n=10), "DMU", ["x1", "x2"], ["y1"])
+    with pytest.raises(ValueError):
+        engine.add(_random_frame(3, n=2))
+    with pytest.raises(ValueError):
+        engine.remove(["no-existe"])
+    with pytest.raises(ValueError):
+        engine.update(_random_frame(4, n=2, start=50))
@@ -0,0 +1,59 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dea_models.fdh import run_fdh
+from dea_models.partial_frontiers import run_order_alpha, run_order_m
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+
+def _random_frame(seed, n=150):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "DMU": [f"D{i}" for i in range(n)],
+        "x1": rng.uniform(1, 10, n),
+        "x2": rng.uniform(1, 10, n),
+        "y1": rng.uniform(1, 10, n),
+    })
+
+
+ARGS = ("DMU", ["x1", "x2"], ["y1"])
+
+
+@pytest.mark.parametrize("orientation", ["input", "output"])
+def test_order_m_brackets_and_converges_to_fdh(orientation):
+    df = _random_frame(1)
+    fdh = run_fdh(df, *ARGS, orientation=orientation)["efficiency_fdh"].to_numpy()
+
+    # Cada extracción usa un subconjunto de las admisibles: la frontera parcial
+    # queda dentro de la FDH y la eficiencia reportada (theta o 1/phi) nunca baja de FDH
+    small = run_order_m(df, *ARGS, m=5, n_draws=100, orientation=orientation, seed=3)
+    score = small["efficiency_order_m"].to_numpy()
+    assert np.all(score >= fdh - 1e-6)
+    assert np.any(np.abs(score - fdh) > 1e-3)
+
+    # Con m mucho mayor que el número de admisibles la frontera parcial es la FDH
+    large = run_order_m(df, *ARGS, m=2000, n_draws=20, orientation=orientation, seed=3)
+    np.testing.assert_allclose(large["efficiency_order_m"], fdh, atol=1e-6)
+
+
+def test_order_m_is_reproducible_across_n_jobs():
+    df = _random_frame(2)
+    a = run_order_m(df, *ARGS, m=10, n_draws=50, seed=11, n_jobs=1)
+    b = run_order_m(df, *ARGS, m=10, n_draws=50, seed=11, n_jobs=2)
+    pd.testing.assert_frame_equal(a, b)
+
+
+@pytest.mark.parametrize("orientation", ["input", "output"])
+def test_order_alpha_one_is_fdh(orientation):
+    df = _random_frame(3)
+    fdh = run_fdh(df, *ARGS, orientation=orientation)["efficiency_fdh"]
+    alpha = run_order_alpha(df, *ARGS, alpha=1.0, orientation=orientation)
+    np.testing.assert_allclose(alpha["efficiency_order_alpha"], fdh, atol=1e-6)
+
+    # Un cuantil más bajo deja fuera a las mejores referencias
+    relaxed = run_order_alpha(df, *ARGS, alpha=0.9, orientation=orientation)["efficiency_order_alpha"]
+    assert np.all(relaxed >= fdh - 1e-6)
@@ -0,0 +1,31 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dea_models.radial import _dea_core
+from dea_models.sharded import run_sharded_dea, serve_worker
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+
+@pytest.mark.parametrize("seed", [2, 4])
+def test_sharded_matches_unsharded(seed):
+    rng = np.random.default_rng(seed)
+    X, Y = rng.uniform(1, 10, (2, 400)), rng.uniform(1, 10, (2, 400))
+    df = pd.DataFrame({"dmu": [f"D{i}" for i in range(400)], "x1": X[0], "x2": X[1], "y1": Y[0], "y2": Y[1]})
+
+    out = run_sharded_dea(df, "dmu", ["x1", "x2"], ["y1", "y2"], rts="VRS", n_shards=8)
+
+    assert out.attrs["sharding"]["n_shards"] == 8
+    np.testing.assert_allclose(out["efficiency"].to_numpy(), _dea_core(X, Y, rts="VRS"), atol=1e-5)
+
+
+@pytest.mark.parametrize("authkey", [b"", None])
+def test_empty_authkey_is_rejected(authkey):
+    with pytest.raises(ValueError):
+        serve_worker(("127.0.0.1", 0), authkey=authkey)
+    with pytest.raises(ValueError):
+        run_sharded_dea(pd.DataFrame({"dmu": ["A"], "x": [1.0], "y": [1.0]}), "dmu", ["x"], ["y"],
+                        workers=[("127.0.0.1", 1)], authkey=authkey)
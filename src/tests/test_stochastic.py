@@ -0,0 +1,86 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from dea_models import stochastic
+from dea_models.stochastic import bootstrap_efficiencies, run_stochastic_dea
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+
+def _random_frame(seed, n=30):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "DMU": [f"D{i}" for i in range(n)],
+        "x1": rng.uniform(1, 10, n),
+        "x2": rng.uniform(1, 10, n),
+        "y1": rng.uniform(1, 10, n),
+    })
+
+
+def _run(df, **kwargs):
+    return run_stochastic_dea(df, "DMU", ["x1", "x2"], ["y1"], seed=7, **kwargs)
+
+
+def test_bootstrap_is_reproducible_across_n_jobs():
+    # Cada réplica usa su propio flujo hijo de la SeedSequence: mismas réplicas con 1 o 2 procesos
+    df = _random_frame(1)
+    seq = bootstrap_efficiencies(df, "DMU", ["x1", "x2"], ["y1"], n_bootstrap=40, seed=7, n_jobs=1, chunk_size=10)
+    par = bootstrap_efficiencies(df, "DMU", ["x1", "x2"], ["y1"], n_bootstrap=40, seed=7, n_jobs=2, chunk_size=10)
+    assert seq == par
+
+    a = _run(df, n_bootstrap=40, n_jobs=1)
+    b = _run(df, n_bootstrap=40, n_jobs=2)
+    pd.testing.assert_frame_equal(a, b)
+
+
+def test_memmap_draws_match_in_memory(tmp_path):
+    # La matriz de réplicas respaldada en disco debe dar el mismo resumen que la de memoria
+    df = _random_frame(2)
+    path = tmp_path / "draws.npy"
+    in_memory = _run(df, n_bootstrap=30)
+    on_disk = _run(df, n_bootstrap=30, memmap_path=str(path))
+    pd.testing.assert_frame_equal(in_memory, on_disk)
+
+    draws = np.load(path)
+    assert draws.shape == (30, len(df)) and draws.dtype == np.float32
+    np.testing.assert_allclose(np.nanmean(draws, axis=0), on_disk["eff_mean"], rtol=1e-6)
+
+
+def test_adaptive_bootstrap_stops_early():
+    # Con una tolerancia holgada los intervalos se estabilizan antes del máximo de réplicas
+    df = _random_frame(0, n=60)
+    out = _run(df, n_bootstrap=400, adaptive=True, batch_size=50, ci_tol=0.05)
+    assert out.attrs["stopped_by"] == "ci_converged"
+    assert out.attrs["n_bootstrap_used"] < 400
+    assert out.attrs["ci_change"] < 0.05
+
+    # Un presupuesto de tiempo agotado corta tras el primer lote
+    timed = _run(df, n_bootstrap=400, adaptive=True, batch_size=50, max_time=0.0)
+    assert timed.attrs["stopped_by"] == "time_budget"
+    assert timed.attrs["n_bootstrap_used"] == 50
+
+
+def test_checkpoint_resume_is_bit_identical(tmp_path, monkeypatch):
+    df = _random_frame(4)
+    fresh = _run(df, n_bootstrap=60)
+
+    # Ejecución "interrumpida": el presupuesto de tiempo la corta tras el primer lote de 20
+    ckpt = str(tmp_path / "ckpt")
+    partial = _run(df, n_bootstrap=60, adaptive=True, batch_size=20, max_time=0.0,
+                   checkpoint_dir=ckpt, checkpoint_every=20)
+    assert partial.attrs["n_bootstrap_used"] == 20
+
+    # La reanudación solo calcula las 40 réplicas pendientes y reproduce la ejecución completa
+    computed = []
+    chunk_fn = stochastic._bootstrap_chunk
+
+    def counting_chunk(seeds, *args, **kwargs):
+        computed.append(len(seeds))
+        return chunk_fn(seeds, *args, **kwargs)
+
+    monkeypatch.setattr(stochastic, "_bootstrap_chunk", counting_chunk)
+    resumed = _run(df, n_bootstrap=60, checkpoint_dir=ckpt, checkpoint_every=20)
+    assert sum(computed) == 40
+    pd.testing.assert_frame_equal(fresh, resumed, check_exact=True)
@@ -0,0 +1,29 @@
+import io
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dea_models.radial import _dea_core
+from dea_models.streaming import run_streaming_dea
+
+warnings.filterwarnings("ignore", category=UserWarning)
+
+
+@pytest.mark.parametrize("orientation", ["input", "output"])
+def test_repeated_screening_keeps_frontier(tmp_path, orientation):
+    # Bloques pequeños y umbral bajo: la frontera se criba varias veces
+    rng = np.random.default_rng(4)
+    X, Y = rng.uniform(1, 10, (2, 600)), rng.uniform(1, 10, (2, 600))
+    df = pd.DataFrame({"dmu": [f"D{i}" for i in range(600)], "x1": X[0], "x2": X[1], "y1": Y[0], "y2": Y[1]})
+    source = io.StringIO(df.to_csv(index=False))
+    out = tmp_path / "scores.csv"
+
+    info = run_streaming_dea(source, "dmu", ["x1", "x2"], ["y1", "y2"], str(out), rts="VRS",
+                             orientation=orientation, chunksize=100, screen_threshold=20)
+    expected = _dea_core(X, Y, rts="VRS", orientation=orientation)
+    expected = expected if orientation == "input" else 1.0 / expected
+
+    assert info["n_screens"] > 1
+    np.testing.assert_allclose(pd.read_csv(out)["efficiency"].to_numpy(), expected, atol=1e-5)
@@ -381,7 +381,7 @@ def render_main_dashboard(active_scenario, cached_run_dea_analysis_func, validat
 
     st.markdown("---")
 
-    model_options = {"Radial (CCR/BCC)": "CCR_BCC", "No Radial (SBM)": "SBM", "Productividad (Malmquist)": "MALMQUIST"}
+    model_options = {"Radial (CCR/BCC)": "CCR_BCC", "No Radial (SBM)": "SBM", "Free Disposal Hull (FDH)": "FDH", "Frontera Parcial (orden-m)": "ORDER_M", "Frontera Parcial (orden-α)": "ORDER_ALPHA", "Productividad (Malmquist)": "MALMQUIST"}
     
     current_model_key = active_scenario['dea_config'].get('model', 'CCR_BCC')
     current_model_name = [name for name, key in model_options.items() if key == current_model_key][0]